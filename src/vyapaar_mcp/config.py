@@ -7,7 +7,7 @@ In production on Archestra, secrets are injected via Vault/K8s Secrets.
 
 from __future__ import annotations
 
-from pydantic import ConfigDict, Field
+from pydantic import ConfigDict, Field, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -63,6 +63,10 @@ class VyapaarConfig(BaseSettings):
         default=30,
         description="Polling interval in seconds for Razorpay API (5-300)",
     )
+    razorpay_max_inflight: int = Field(
+        default=8,
+        description="Max concurrent tool calls to the Razorpay MCP subprocess",
+    )
     auto_poll: bool = Field(
         default=False,
         description="Enable automatic background polling on server start",
@@ -172,6 +176,10 @@ class VyapaarConfig(BaseSettings):
         default="2024-10-21",
         description="Azure OpenAI API version",
     )
+    azure_max_inflight: int = Field(
+        default=50,
+        description="Max concurrent Azure OpenAI requests; extra callers wait",
+    )
 
     # --- Archestra Security Proxy (Deterministic Controls) ---
     # Archestra sits as a proxy between your agent and MCP servers/LLM
@@ -241,6 +249,16 @@ class VyapaarConfig(BaseSettings):
         default="gpt-4o-mini",
         description="Security LLM model (e.g., gpt-4o-mini for cost-effective validation)",
     )
+    security_llm_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds to reuse a security LLM verdict for an identical tool call (0 = off)",
+    )
+    security_llm_prompt_cache: bool = Field(
+        default=False,
+        description=(
+            "Mark the system prompt and policy with cache_control for provider prompt caching"
+        ),
+    )
     dual_llm_max_rounds: int = Field(
         default=5,
         description="Max validation rounds before forcing deny (prevents loops)",
@@ -256,6 +274,12 @@ class VyapaarConfig(BaseSettings):
         description="Log all security LLM validation decisions for audit",
     )
 
+    @field_validator("taint_sources", "dual_llm_tools")
+    @classmethod
+    def _normalize_tool_list(cls, value: str) -> str:
+        """Strip whitespace and drop empty entries ("a, b," -> "a,b")."""
+        return ",".join(name for name in (part.strip() for part in value.split(",")) if name)
+
 
 def load_config() -> VyapaarConfig:
     """Load and validate configuration from environment."""
@@ -13,24 +13,62 @@ from vyapaar_mcp.models import AgentPolicy, AuditLogEntry, Decision, GovernanceR
 
 logger = logging.getLogger(__name__)
 
+# Hot-path statements, kept as constants so the text is identical on
+# every call and hits asyncpg's per-connection statement cache.
+SQL_GET_POLICY = "SELECT * FROM agent_policies WHERE agent_id = $1"
+
+SQL_INSERT_AUDIT = """
+    INSERT INTO audit_logs
+        (payout_id, agent_id, amount, vendor_name, vendor_url,
+         decision, reason_code, reason_detail, threat_types, processing_ms)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    ON CONFLICT (payout_id) DO NOTHING
+"""
+
 
 class PostgresClient:
     """Async PostgreSQL client for Vyapaar data layer."""
 
-    def __init__(self, dsn: str) -> None:
+    def __init__(self, dsn: str, min_size: int = 2, max_size: int = 10) -> None:
         self._dsn = dsn
+        self._min_size = min_size
+        self._max_size = max_size
         self._pool: asyncpg.Pool | None = None  # type: ignore[type-arg]
 
     async def connect(self) -> None:
         """Create connection pool with timeouts."""
         self._pool = await asyncpg.create_pool(
             self._dsn,
-            min_size=2,
-            max_size=10,
+            min_size=self._min_size,
+            max_size=self._max_size,
             command_timeout=30,
         )
         logger.info("PostgreSQL pool created: %s", self._dsn.split("@")[-1])
 
+    async def warm_up(self) -> None:
+        """Prime the statement cache on every idle pool connection.
+
+        Must run after migrations (the tables have to exist). All
+        connections are held at once so each one gets warmed rather than
+        the pool handing back the same connection repeatedly. Only the
+        read-only policy lookup is executed; the audit INSERT is left
+        cold so warming never burns audit_logs sequence values.
+
+        Non-fatal: a failure here only means the first queries pay the cost.
+        """
+        conns: list[asyncpg.Connection] = []
+        try:
+            for _ in range(self._min_size):
+                conns.append(await self.pool.acquire())
+            for conn in conns:
+                await conn.fetchrow(SQL_GET_POLICY, "")
+            logger.info("PostgreSQL statement cache warmed (%d connections)", len(conns))
+        except Exception as e:
+            logger.warning("PostgreSQL warm-up failed: %s", e)
+        finally:
+            for conn in conns:
+                await self.pool.release(conn)
+
     async def disconnect(self) -> None:
         """Close connection pool."""
         if self._pool:
@@ -110,10 +148,7 @@ class PostgresClient:
     async def get_agent_policy(self, agent_id: str) -> AgentPolicy | None:
         """Fetch spending policy for an agent."""
         async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT * FROM agent_policies WHERE agent_id = $1",
-                agent_id,
-            )
+            row = await conn.fetchrow(SQL_GET_POLICY, agent_id)
             if row is None:
                 return None
             return AgentPolicy(
@@ -162,13 +197,7 @@ class PostgresClient:
         """Write a governance decision to the audit log."""
         async with self.pool.acquire() as conn:
             await conn.execute(
-                """
-                INSERT INTO audit_logs
-                    (payout_id, agent_id, amount, vendor_name, vendor_url,
-                     decision, reason_code, reason_detail, threat_types, processing_ms)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                ON CONFLICT (payout_id) DO NOTHING
-                """,
+                SQL_INSERT_AUDIT,
                 result.payout_id,
                 result.agent_id,
                 result.amount,
@@ -180,10 +209,11 @@ class PostgresClient:
                 result.threat_types,
                 result.processing_ms,
             )
-        logger.info(
-            "Audit logged: payout=%s decision=%s reason=%s",
-            result.payout_id, result.decision.value, result.reason_code.value,
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Audit logged: payout=%s decision=%s reason=%s",
+                result.payout_id, result.decision.value, result.reason_code.value,
+            )
 
     async def get_audit_logs(
         self,
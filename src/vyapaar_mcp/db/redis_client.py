@@ -8,15 +8,41 @@ when multiple agents spend concurrently.
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import date
-from typing import Any
+from typing import Any, Final, cast
 
+import orjson
 import redis.asyncio as aioredis
+from redis.exceptions import NoScriptError
 
 logger = logging.getLogger(__name__)
 
+# Daily budget keys outlive their day by an hour (25h)
+_BUDGET_TTL_SECONDS: Final[int] = 90_000
+
+# Webhook dedup window, and the number of hash buckets ids are spread over
+_IDEMPOTENCY_TTL_SECONDS: Final[int] = 172_800
+_IDEMPOTENCY_BUCKETS: Final[int] = 10_000
+# A bucket hash covers one window and must stay readable through the next
+_IDEMPOTENCY_BUCKET_TTL: Final[int] = 2 * _IDEMPOTENCY_TTL_SECONDS + 3600
+
+# Lua source -> SHA1, for EVALSHA
+_SCRIPT_SHAS: dict[str, str] = {}
+
+# types-redis leaves the scripting commands untyped
+_ScriptCommand = Callable[..., Awaitable[Any]]
+
+# In-process LRU in front of the Redis reputation cache
+REPUTATION_MEMCACHE_SIZE = 10_000
+REPUTATION_MEMCACHE_TTL = 30.0  # seconds
+
+# Pub/sub channel announcing agent policy updates (payload: agent_id)
+POLICY_INVALIDATE_CHANNEL: Final[str] = "vyapaar:policy:invalidate"
+
 
 class RedisClient:
     """Async Redis client wrapping atomic financial operations."""
@@ -24,6 +50,8 @@ class RedisClient:
     def __init__(self, url: str = "redis://localhost:6379/0") -> None:
         self._url = url
         self._client: aioredis.Redis | None = None  # type: ignore[type-arg]
+        # url_hash key -> (expires_at monotonic, cached result)
+        self._rep_memcache: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
 
     async def connect(self) -> None:
         """Establish Redis connection."""
@@ -33,6 +61,24 @@ class RedisClient:
             socket_connect_timeout=5,
         )
         logger.info("Redis connected: %s", self._url)
+        await self.warm_scripts()
+
+    async def warm_scripts(self) -> None:
+        """SCRIPT LOAD the hot-path Lua so the first EVAL skips compilation.
+
+        Non-fatal: a failure here only means the first call pays the cost.
+        """
+        try:
+            for script in (
+                self._BUDGET_LUA,
+                self._RATE_LIMIT_LUA,
+                self._IDEMPOTENCY_LUA,
+                self._RELEASE_INFLIGHT_LUA,
+            ):
+                await cast(_ScriptCommand, self.client.script_load)(script)
+            logger.debug("Redis Lua scripts preloaded")
+        except Exception as e:
+            logger.warning("Redis script warm-up failed: %s", e)
 
     async def disconnect(self) -> None:
         """Close Redis connection."""
@@ -47,6 +93,26 @@ class RedisClient:
             raise RuntimeError("Redis not connected. Call connect() first.")
         return self._client
 
+    @staticmethod
+    def _script_sha(script: str) -> str:
+        """SHA1 Redis files a Lua script under (as returned by SCRIPT LOAD)."""
+        sha = _SCRIPT_SHAS.get(script)
+        if sha is None:
+            sha = _SCRIPT_SHAS[script] = hashlib.sha1(script.encode()).hexdigest()
+        return sha
+
+    async def _eval(self, script: str, numkeys: int, *args: Any) -> Any:
+        """EVALSHA a script, falling back to EVAL if Redis lost it.
+
+        Sends the 40-byte SHA instead of the script body; the EVAL
+        fallback (after a restart or SCRIPT FLUSH) re-caches it.
+        """
+        evalsha = cast(_ScriptCommand, self.client.evalsha)
+        try:
+            return await evalsha(self._script_sha(script), numkeys, *args)
+        except NoScriptError:
+            return await cast(_ScriptCommand, self.client.eval)(script, numkeys, *args)
+
     async def ping(self) -> bool:
         """Check if Redis is reachable."""
         try:
@@ -92,20 +158,21 @@ return 1
         """
         key = self._budget_key(agent_id)
 
-        result = await self.client.eval(
+        result = await self._eval(
             self._BUDGET_LUA,
             1,       # number of KEYS
             key,     # KEYS[1]
-            str(amount),       # ARGV[1]
-            str(daily_limit),  # ARGV[2]
-            str(90000),        # ARGV[3] — TTL 25 hours
+            amount,               # ARGV[1]
+            daily_limit,          # ARGV[2]
+            _BUDGET_TTL_SECONDS,  # ARGV[3] — TTL 25 hours
         )
 
         if result == 1:
-            logger.info(
-                "Budget OK for %s: +%d paise (limit %d)",
-                agent_id, amount, daily_limit,
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Budget OK for %s: +%d paise (limit %d)",
+                    agent_id, amount, daily_limit,
+                )
             return True
         else:
             logger.warning(
@@ -136,13 +203,14 @@ return 1
 
     # Lua script: sliding window rate limiter.
     # Removes expired entries, counts current, adds new if under limit.
+    # ARGV[3] is the current time as integer microseconds since the epoch.
     # Returns: [allowed (0/1), current_count, ttl_remaining]
     _RATE_LIMIT_LUA = """
 local key = KEYS[1]
 local window = tonumber(ARGV[1])
 local max_requests = tonumber(ARGV[2])
 local now = tonumber(ARGV[3])
-local window_start = now - window
+local window_start = now - window * 1000000
 
 -- Remove expired entries
 redis.call('ZREMRANGEBYSCORE', key, '-inf', window_start)
@@ -155,8 +223,9 @@ if current >= max_requests then
     return {0, current, ttl}
 end
 
--- Add new entry with current timestamp as score
-redis.call('ZADD', key, now, now .. ':' .. math.random(1000000))
+-- Add new entry with current timestamp as score (raw ARGV keeps the
+-- member free of Lua's %.14g number formatting)
+redis.call('ZADD', key, now, ARGV[3] .. ':' .. math.random(1000000))
 redis.call('EXPIRE', key, window + 1)
 
 return {1, current + 1, window}
@@ -185,18 +254,16 @@ return {1, current + 1, window}
         Returns:
             Tuple of (allowed: bool, current_count: int).
         """
-        import time as _time
-
         key = self._rate_limit_key(agent_id)
-        now = _time.time()
+        now_us = time.time_ns() // 1000
 
-        result = await self.client.eval(
+        result = await self._eval(
             self._RATE_LIMIT_LUA,
             1,
             key,
-            str(window_seconds),
-            str(max_requests),
-            str(now),
+            window_seconds,
+            max_requests,
+            now_us,
         )
 
         allowed = bool(result[0])
@@ -213,40 +280,233 @@ return {1, current + 1, window}
     # Idempotency (per SPEC §4 constraint #3)
     # ================================================================
 
+    # Lua script: hash-bucketed dedup.
+    # KEYS[1] is the current window's bucket, KEYS[2] the previous window's
+    # (same hash tag, so one slot on Redis Cluster). The first writer of a
+    # bucket sets its TTL.
+    # Returns: 1 if the id is new, 0 if it was already seen.
+    _IDEMPOTENCY_LUA = """
+if redis.call('HEXISTS', KEYS[2], ARGV[1]) == 1 then
+    return 0
+end
+if redis.call('HSETNX', KEYS[1], ARGV[1], 1) == 0 then
+    return 0
+end
+if redis.call('TTL', KEYS[1]) < 0 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+    def _idempotency_keys(self, webhook_id: str) -> tuple[str, str]:
+        """(current, previous) window bucket keys for a webhook id.
+
+        Ids are spread over a fixed number of Redis hashes per 48h window
+        so that many small entries share one listpack-encoded key instead
+        of each paying the per-key overhead. Checking the previous window
+        too means every id stays visible for at least a full window.
+        """
+        bucket = int(
+            hashlib.blake2b(webhook_id.encode(), digest_size=4).hexdigest(), 16
+        ) % _IDEMPOTENCY_BUCKETS
+        window = int(time.time()) // _IDEMPOTENCY_TTL_SECONDS
+        return (
+            f"vyapaar:idem:{{{bucket}}}:{window}",
+            f"vyapaar:idem:{{{bucket}}}:{window - 1}",
+        )
+
+    @staticmethod
+    def _legacy_idempotency_key(webhook_id: str) -> str:
+        """Per-id SET NX key used before the bucketed layout.
+
+        Still read (never written) so ids processed under the old layout
+        are not replayed; the keys expire on their own 48h TTL, after
+        which this check can be dropped.
+        """
+        return f"vyapaar:idempotent:{webhook_id}"
+
     async def check_idempotency(self, webhook_id: str) -> bool:
         """Check if webhook has already been processed.
 
-        Uses atomic SET with NX+EX — returns True if this is a NEW webhook.
-        Returns False if already processed (idempotent skip).
+        Returns True if this is a NEW webhook, False if it was already
+        processed within the last 48 hours (idempotent skip).
+
+        The lookup across both windows, the HSETNX and the bucket TTL
+        run in a single Lua script, so two concurrent deliveries of the
+        same webhook cannot both be treated as new.
+        """
+        return (await self.check_idempotency_batch([webhook_id]))[0]
+
+    async def check_idempotency_batch(self, webhook_ids: list[str]) -> list[bool]:
+        """check_idempotency() for many ids in one pipelined round trip.
 
-        The NX and EX flags are set in a single command to avoid a
-        race where the key is created but the TTL is never applied.
+        Returns one flag per id, in order. A repeated id within the batch
+        is only reported new the first time.
         """
-        key = f"vyapaar:idempotent:{webhook_id}"
-        # Atomic: set only if not exists, with 48h TTL
-        is_new = await self.client.set(key, "processed", nx=True, ex=172800)
-        return bool(is_new)
+        if not webhook_ids:
+            return []
+        sha = self._script_sha(self._IDEMPOTENCY_LUA)
+        calls = [
+            (self._idempotency_keys(webhook_id), webhook_id)
+            for webhook_id in webhook_ids
+        ]
+        async with self.client.pipeline(transaction=False) as pipe:
+            for keys, webhook_id in calls:
+                # The legacy key lives in its own slot, so it is a separate
+                # command rather than a script key
+                pipe.exists(self._legacy_idempotency_key(webhook_id))
+                pipe.evalsha(sha, len(keys), *keys, webhook_id, _IDEMPOTENCY_BUCKET_TTL)
+            results = await pipe.execute(raise_on_error=False)
+
+        flags: list[bool] = []
+        for i, (keys, webhook_id) in enumerate(calls):
+            legacy, is_new = results[2 * i], results[2 * i + 1]
+            # A NOSCRIPT reply means the call never ran; redo just that one
+            if isinstance(is_new, NoScriptError):
+                is_new = await self._eval(
+                    self._IDEMPOTENCY_LUA, len(keys), *keys, webhook_id,
+                    _IDEMPOTENCY_BUCKET_TTL,
+                )
+            for result in (legacy, is_new):
+                if isinstance(result, Exception):
+                    raise result
+            flags.append(bool(is_new) and not legacy)
+        return flags
 
     # ================================================================
     # Reputation Cache
     # ================================================================
 
+    # Placeholder stored under a reputation key while one caller is
+    # fetching the upstream verdict (cache-stampede protection).
+    _REPUTATION_INFLIGHT = "INFLIGHT"
+
+    # Lua script: delete the key only if it still holds the in-flight marker,
+    # so a failed lookup never clobbers a result written by someone else.
+    _RELEASE_INFLIGHT_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
     def _reputation_key(self, url: str) -> str:
-        """Generate cache key for reputation check."""
-        url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+        """Generate cache key for reputation check.
+
+        An 8-byte BLAKE2b digest is plenty for cache keying and avoids
+        computing a full SHA-256 only to slice it.
+        """
+        url_hash = hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
         return f"vyapaar:reputation:{url_hash}"
 
+    def _memcache_get(self, key: str) -> dict[str, Any] | None:
+        """Look up a reputation result in the in-process LRU."""
+        entry = self._rep_memcache.get(key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at < time.monotonic():
+            del self._rep_memcache[key]
+            return None
+        self._rep_memcache.move_to_end(key)
+        return data
+
+    def _memcache_put(
+        self, key: str, data: dict[str, Any], ttl: float = REPUTATION_MEMCACHE_TTL
+    ) -> None:
+        """Store a reputation result in the in-process LRU.
+
+        Never kept longer than ``ttl``, so it can't outlive the Redis copy.
+        """
+        expires_at = time.monotonic() + min(ttl, REPUTATION_MEMCACHE_TTL)
+        self._rep_memcache[key] = (expires_at, data)
+        self._rep_memcache.move_to_end(key)
+        if len(self._rep_memcache) > REPUTATION_MEMCACHE_SIZE:
+            self._rep_memcache.popitem(last=False)
+
     async def get_cached_reputation(self, url: str) -> dict[str, Any] | None:
-        """Get cached Safe Browsing result for a URL."""
+        """Get cached Safe Browsing result for a URL.
+
+        Checks the in-process LRU first, then Redis.
+        """
         key = self._reputation_key(url)
+        local = self._memcache_get(key)
+        if local is not None:
+            return local
         cached = await self.client.get(key)
-        if cached:
-            return json.loads(cached)  # type: ignore[no-any-return]
+        if cached and cached != self._REPUTATION_INFLIGHT:
+            data: dict[str, Any] = orjson.loads(cached)
+            self._memcache_put(key, data)
+            return data
         return None
 
+    async def get_or_reserve_reputation(
+        self, url: str, reserve_ttl: int = 5
+    ) -> tuple[str, dict[str, Any] | None]:
+        """Read a cached reputation result, reserving the lookup on a miss.
+
+        On a miss, atomically claims the key with SET NX EX so that only
+        one caller performs the upstream lookup for a URL at a time.
+
+        Returns:
+            ("hit", data)      — cached result found.
+            ("reserved", None) — caller owns the lookup and must call
+                                 cache_reputation() or
+                                 release_reputation_reservation().
+            ("wait", None)     — another caller is fetching; retry shortly.
+        """
+        key = self._reputation_key(url)
+        local = self._memcache_get(key)
+        if local is not None:
+            return "hit", local
+        cached = await self.client.get(key)
+        if cached == self._REPUTATION_INFLIGHT:
+            return "wait", None
+        if cached:
+            data: dict[str, Any] = orjson.loads(cached)
+            self._memcache_put(key, data)
+            return "hit", data
+
+        reserved = await self.client.set(
+            key, self._REPUTATION_INFLIGHT, nx=True, ex=reserve_ttl
+        )
+        return ("reserved", None) if reserved else ("wait", None)
+
+    async def release_reputation_reservation(self, url: str) -> None:
+        """Drop an in-flight marker after a failed upstream lookup."""
+        key = self._reputation_key(url)
+        await self._eval(
+            self._RELEASE_INFLIGHT_LUA, 1, key, self._REPUTATION_INFLIGHT
+        )
+
     async def cache_reputation(
         self, url: str, result: dict[str, Any], ttl: int = 300
     ) -> None:
-        """Cache Safe Browsing result (default 5 min TTL)."""
+        """Cache Safe Browsing result (default 5 min TTL).
+
+        Overwrites any in-flight marker left by get_or_reserve_reputation()
+        and writes the fresh result through to the local LRU, so repeat
+        payouts to the same URL on this process skip Redis entirely.
+        """
         key = self._reputation_key(url)
-        await self.client.setex(key, ttl, json.dumps(result))
+        await self.client.setex(key, ttl, orjson.dumps(result))
+        self._memcache_put(key, result, ttl)
+
+    # ================================================================
+    # Policy Invalidation (pub/sub)
+    # ================================================================
+
+    async def publish_policy_invalidation(self, agent_id: str) -> None:
+        """Tell every server process to drop its cached policy for an agent."""
+        await self.client.publish(POLICY_INVALIDATE_CHANNEL, agent_id)
+
+    async def policy_invalidations(self) -> AsyncIterator[str]:
+        """Yield agent ids as policy invalidations are published."""
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(POLICY_INVALIDATE_CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                yield message["data"]
+        finally:
+            # types-redis predates PubSub.aclose() (redis-py 5.0.1)
+            await pubsub.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,40 @@
+"""Shared outbound HTTP clients for egress integrations.
+
+Clients here are created once at server startup and injected into the
+notifiers, so every caller shares one keep-alive pool per upstream.
+The server owns their lifecycle and closes them on shutdown.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+SLACK_API_BASE = "https://slack.com/api"
+
+
+def create_slack_client() -> httpx.AsyncClient:
+    """Pooled client for the Slack Web API (auth is sent per request)."""
+    return httpx.AsyncClient(
+        base_url=SLACK_API_BASE,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=httpx.Timeout(10.0, connect=2.0),
+    )
+
+
+def create_llm_client() -> httpx.AsyncClient:
+    """Pooled client shared by the Azure OpenAI and security LLM clients.
+
+    Both SDK clients send absolute URLs and per-request timeouts, so the
+    pool itself carries neither a base URL nor auth.
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=100),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
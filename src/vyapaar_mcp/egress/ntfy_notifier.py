@@ -3,8 +3,9 @@
 Sends push notifications via ntfy (https://ntfy.sh) as a fallback
 when Slack is unavailable (circuit open, not configured, or errors).
 
-Reference: .reference/ntfy/docs/publish.md — JSON publish format
-API:       POST https://ntfy.sh/ with JSON body containing "topic"
+Reference: .reference/ntfy/docs/publish.md — header publish format
+API:       POST https://ntfy.sh/<topic> with the message as the body and
+           Title/Priority/Tags/Click as HTTP headers
 
 Key design choices:
   • Simple HTTP POST — ntfy has the simplest API of any notification service
@@ -16,13 +17,21 @@ Key design choices:
 
 from __future__ import annotations
 
-import json
+import asyncio
+import base64
+import contextlib
 import logging
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
 import httpx
 
+from vyapaar_mcp.egress.slack_notifier import SLACK_ALERT_REASONS
 from vyapaar_mcp.models import Decision, GovernanceResult, ReasonCode
+from vyapaar_mcp.observability import metrics
 from vyapaar_mcp.resilience import CircuitBreaker, CircuitOpenError
 
 logger = logging.getLogger("vyapaar_mcp.egress.ntfy")
@@ -34,9 +43,221 @@ PRIORITY_DEFAULT = 3
 PRIORITY_HIGH = 4
 PRIORITY_URGENT = 5
 
+# Static notification fragments, built once at import
+_HELD_TITLE = "🔔 Payout Approval Required"
+_HELD_TAGS = ["warning", "moneybag"]
+_REJECTED_TITLES: dict[ReasonCode, str] = {
+    code: f"❌ Payout Rejected — {code.value}" for code in ReasonCode
+}
+_REASON_TAGS: dict[ReasonCode, list[str]] = {
+    ReasonCode.RISK_HIGH: ["skull", "warning"],
+    ReasonCode.DOMAIN_BLOCKED: ["no_entry", "warning"],
+    ReasonCode.LIMIT_EXCEEDED: ["moneybag", "x"],
+    ReasonCode.TXN_LIMIT_EXCEEDED: ["money_with_wings", "x"],
+    ReasonCode.NO_POLICY: ["clipboard", "x"],
+    ReasonCode.RATE_LIMITED: ["hourglass", "x"],
+}
+_DEFAULT_REJECTED_TAGS = ["x"]
+_HELD_TEMPLATE = (
+    "Payout {payout_id}\n"
+    "Amount: ₹{amount:,.2f}\n"
+    "Agent: {agent_id}\n"
+    "Vendor: {vendor}\n"
+    "Reason: {reason}\n"
+    "\n⚠️ Requires human approval"
+)
+_REJECTED_TEMPLATE = (
+    "Payout {payout_id}\n"
+    "Amount: ₹{amount:,.2f}\n"
+    "Agent: {agent_id}\n"
+    "Vendor: {vendor}\n"
+    "Reason: {reason}{threats}"
+)
+
+# Health probes within this window reuse the last ping result
+_PING_CACHE_TTL = 5.0  # seconds
+
 # Default ntfy server (public)
 _DEFAULT_NTFY_URL = "https://ntfy.sh"
 
+# One pooled client per event loop, shared by every NtfyNotifier that
+# was not handed its own. Keyed on the loop itself so a client is never
+# reused from a loop it was not created on.
+_shared_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Return the running loop's shared ntfy client, creating it lazily."""
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=15.0),
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+async def aclose_all() -> None:
+    """Close every shared ntfy client (process shutdown)."""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+@dataclass(slots=True)
+class NtfyPayload:
+    """One ntfy notification: message body plus header metadata."""
+
+    topic: str
+    message: str
+    priority: int = PRIORITY_DEFAULT
+    title: str | None = None
+    tags: list[str] | None = None
+    click: str | None = None
+
+
+def _header_value(value: str) -> str:
+    """Make a header value ASCII-safe.
+
+    Non-ASCII text (emoji titles, ₹ amounts) is sent as an RFC 2047
+    encoded word, which ntfy decodes.
+    """
+    if value.isascii():
+        return value
+    return f"=?UTF-8?B?{base64.b64encode(value.encode()).decode()}?="
+
+
+# ================================================================
+# Burst Coalescing
+# ================================================================
+
+
+def _merge_payloads(batch: list[NtfyPayload]) -> NtfyPayload:
+    """Fold several pending notifications for one topic into a single one.
+
+    ntfy publishes exactly one message per request, so a burst is sent
+    as one digest: highest priority wins and tags are unioned. The
+    click URL is kept when every payload shares it.
+    """
+    if len(batch) == 1:
+        return batch[0]
+
+    tags: list[str] = []
+    sections: list[str] = []
+    for payload in batch:
+        for tag in payload.tags or ():
+            if tag not in tags:
+                tags.append(tag)
+        sections.append(
+            f"{payload.title}\n{payload.message}" if payload.title else payload.message
+        )
+
+    return NtfyPayload(
+        topic=batch[0].topic,
+        title=f"{len(batch)} Vyapaar alerts",
+        message="\n\n".join(sections),
+        priority=max(p.priority for p in batch),
+        tags=tags or None,
+        click=batch[0].click if len({p.click for p in batch}) == 1 else None,
+    )
+
+
+class NtfyBatcher:
+    """Background queue that coalesces bursts of ntfy notifications.
+
+    Payloads are collected for up to ``max_wait_ms`` (or ``max_batch``
+    items) after the first one arrives and then delivered as one
+    request per topic.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[NtfyPayload], Awaitable[bool]],
+        max_batch: int = 32,
+        max_wait_ms: float = 50.0,
+        max_queue: int = 1024,
+    ) -> None:
+        self._deliver = deliver
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self.queue: asyncio.Queue[NtfyPayload] = asyncio.Queue(maxsize=max_queue)
+        self._task: asyncio.Task[None] | None = None
+        # Dequeued but not yet delivered; aclose() flushes what is left
+        self._in_flight: list[NtfyPayload] = []
+
+    def put(self, payload: NtfyPayload) -> bool:
+        """Enqueue a payload; False if the queue is full and it was dropped."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        try:
+            self.queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            logger.error("ntfy queue full — notification dropped")
+            return False
+        return True
+
+    def put_many(self, payloads: list[NtfyPayload]) -> bool:
+        """Enqueue several payloads; False if any had to be dropped."""
+        ok = True
+        for payload in payloads:
+            ok = self.put(payload) and ok
+        return ok
+
+    async def _collect(self, loop: asyncio.AbstractEventLoop) -> list[NtfyPayload]:
+        """Wait for one payload, then gather more until the window closes."""
+        batch = self._in_flight = [await self.queue.get()]
+        deadline = loop.time() + self._max_wait
+        while len(batch) < self._max_batch:
+            if not self.queue.empty():
+                # Already queued: take it without arming a timeout
+                batch.append(self.queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _flush(self, batch: list[NtfyPayload]) -> None:
+        """Deliver ``batch`` per topic, dropping each group once it is sent."""
+        by_topic: dict[str, list[NtfyPayload]] = {}
+        for payload in batch:
+            by_topic.setdefault(payload.topic, []).append(payload)
+        for topic, group in by_topic.items():
+            await self._deliver(_merge_payloads(group))
+            batch[:] = [p for p in batch if p.topic != topic]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect(loop)
+            try:
+                await self._flush(batch)
+            except Exception as e:
+                logger.error("ntfy batch flush failed: %s", e)
+            self._in_flight = []
+
+    async def aclose(self) -> None:
+        """Stop the flush task and deliver anything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        # Whatever the task had dequeued goes out first, in order
+        pending, self._in_flight = self._in_flight, []
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+        if pending:
+            await self._flush(pending)
+
 
 class NtfyNotifier:
     """Async ntfy push notification client.
@@ -60,32 +281,57 @@ class NtfyNotifier:
         circuit_breaker: CircuitBreaker | None = None,
         timeout: float = 10.0,
         auth_token: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        batch: bool = False,
     ) -> None:
         self._topic = topic
         self._server_url = server_url.rstrip("/")
         self._circuit = circuit_breaker
         self._auth_token = auth_token
+        self._timeout = timeout
 
-        headers: dict[str, str] = {}
+        # Sent per request, since the pooled client is shared across topics
+        self._headers: dict[str, str] = {}
         if auth_token:
-            headers["Authorization"] = f"Bearer {auth_token}"
+            self._headers["Authorization"] = f"Bearer {auth_token}"
 
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            headers=headers,
-        )
+        # None means "use the shared per-loop client"
+        self._client = client
+
+        # (checked_at monotonic, healthy)
+        self._ping_cache: tuple[float, bool] | None = None
+
+        # Opt-in burst coalescing; send() then only enqueues
+        self._batcher = NtfyBatcher(self._deliver) if batch else None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Injected client if any, otherwise the loop's shared one."""
+        return self._client or _get_shared_client()
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        await self._client.aclose()
+        """Flush pending batched notifications.
+
+        The HTTP client itself is injected or shared (see aclose_all).
+        """
+        if self._batcher is not None:
+            await self._batcher.aclose()
 
     async def ping(self) -> bool:
-        """Test connectivity to the ntfy server."""
+        """Test connectivity to the ntfy server (cached for a few seconds)."""
+        now = time.monotonic()
+        if self._ping_cache and now - self._ping_cache[0] < _PING_CACHE_TTL:
+            return self._ping_cache[1]
         try:
-            resp = await self._client.get(f"{self._server_url}/v1/health")
-            return resp.status_code == 200
+            resp = await self._http().get(
+                f"{self._server_url}/v1/health",
+                headers=self._headers,
+                timeout=self._timeout,
+            )
+            ok = resp.status_code == 200
         except Exception:
-            return False
+            ok = False
+        self._ping_cache = (now, ok)
+        return ok
 
     # ----------------------------------------------------------------
     # Public API
@@ -101,8 +347,8 @@ class NtfyNotifier:
     ) -> bool:
         """Send a push notification via ntfy.
 
-        Reference: .reference/ntfy/docs/publish.md — "Publish as JSON"
-        Must POST to the ROOT URL with "topic" in JSON body.
+        Reference: .reference/ntfy/docs/publish.md — the message is the
+        raw POST body to the topic URL, metadata goes in headers.
 
         Args:
             message: Notification body text.
@@ -112,33 +358,19 @@ class NtfyNotifier:
             click: URL to open when notification is clicked (optional).
 
         Returns:
-            True if notification was sent successfully.
+            True if notification was sent successfully (or, when
+            batching, accepted into the send queue).
         """
-        payload: dict[str, Any] = {
-            "topic": self._topic,
-            "message": message,
-            "priority": priority,
-        }
-        if title:
-            payload["title"] = title
-        if tags:
-            payload["tags"] = tags
-        if click:
-            payload["click"] = click
-
-        try:
-            if self._circuit:
-                result = await self._circuit.call(self._post_notification, payload)
-            else:
-                result = await self._post_notification(payload)
-            return result
+        payload = NtfyPayload(
+            topic=self._topic,
+            message=message,
+            priority=priority,
+            title=title or None,
+            tags=tags or None,
+            click=click or None,
+        )
 
-        except CircuitOpenError:
-            logger.error("ntfy circuit OPEN — notification dropped")
-            return False
-        except Exception as e:
-            logger.error("ntfy send failed: %s", e)
-            return False
+        return await self._submit(payload)
 
     async def send_governance_notification(
         self,
@@ -150,84 +382,138 @@ class NtfyNotifier:
 
         Maps governance decisions to ntfy priority and tags.
         """
-        amount_rupees = result.amount / 100
-        vendor_display = vendor_name or vendor_url or "Unknown"
+        payload = self._format_payload(result, vendor_name, vendor_url)
+        if payload is None:
+            # Approvals are silent by default — don't notify
+            return True
+        return await self._submit(payload)
 
+    async def send_many(self, results: list[GovernanceResult]) -> bool:
+        """Send governance notifications for a burst of results.
+
+        All messages are formatted up front and handed to the batch
+        queue together (or delivered in order when not batching).
+
+        Returns:
+            True if every notification was sent or queued.
+        """
+        payloads = [
+            payload
+            for payload in map(self._format_payload, results)
+            if payload is not None
+        ]
+        if self._batcher is not None:
+            return self._batcher.put_many(payloads)
+        ok = True
+        for payload in payloads:
+            ok = await self._deliver(payload) and ok
+        return ok
+
+    # ----------------------------------------------------------------
+    # Private
+    # ----------------------------------------------------------------
+
+    def _format_payload(
+        self,
+        result: GovernanceResult,
+        vendor_name: str | None = None,
+        vendor_url: str | None = None,
+    ) -> NtfyPayload | None:
+        """Build the notification for a decision; None for silent ones."""
         if result.decision == Decision.HELD:
-            title = "🔔 Payout Approval Required"
-            priority = PRIORITY_HIGH
-            tags = ["warning", "moneybag"]
-            message = (
-                f"Payout {result.payout_id}\n"
-                f"Amount: ₹{amount_rupees:,.2f}\n"
-                f"Agent: {result.agent_id}\n"
-                f"Vendor: {vendor_display}\n"
-                f"Reason: {result.reason_detail}\n"
-                f"\n⚠️ Requires human approval"
-            )
+            title = _HELD_TITLE
+            tags = _HELD_TAGS
+            template = _HELD_TEMPLATE
         elif result.decision == Decision.REJECTED:
-            reason_tags = {
-                ReasonCode.RISK_HIGH: ["skull", "warning"],
-                ReasonCode.DOMAIN_BLOCKED: ["no_entry", "warning"],
-                ReasonCode.LIMIT_EXCEEDED: ["moneybag", "x"],
-                ReasonCode.TXN_LIMIT_EXCEEDED: ["money_with_wings", "x"],
-                ReasonCode.NO_POLICY: ["clipboard", "x"],
-                ReasonCode.RATE_LIMITED: ["hourglass", "x"],
-            }
-            title = f"❌ Payout Rejected — {result.reason_code.value}"
-            priority = PRIORITY_HIGH
-            tags = reason_tags.get(result.reason_code, ["x"])
-
-            threat_info = ""
-            if result.threat_types:
-                threat_info = f"\nThreats: {', '.join(result.threat_types)}"
-
-            message = (
-                f"Payout {result.payout_id}\n"
-                f"Amount: ₹{amount_rupees:,.2f}\n"
-                f"Agent: {result.agent_id}\n"
-                f"Vendor: {vendor_display}\n"
-                f"Reason: {result.reason_detail}{threat_info}"
-            )
-        elif result.decision == Decision.APPROVED:
-            # Approvals are silent by default — don't notify
-            return True
+            title = _REJECTED_TITLES[result.reason_code]
+            tags = _REASON_TAGS.get(result.reason_code, _DEFAULT_REJECTED_TAGS)
+            template = _REJECTED_TEMPLATE
         else:
-            return True
-
-        return await self.send(
+            return None
+
+        message = template.format_map({
+            "payout_id": result.payout_id,
+            "amount": result.amount / 100,
+            "agent_id": result.agent_id,
+            "vendor": vendor_name or vendor_url or "Unknown",
+            "reason": result.reason_detail,
+            "threats": (
+                f"\nThreats: {', '.join(result.threat_types)}"
+                if result.threat_types else ""
+            ),
+        })
+        return NtfyPayload(
+            topic=self._topic,
             message=message,
+            priority=PRIORITY_HIGH,
             title=title,
-            priority=priority,
             tags=tags,
         )
 
-    # ----------------------------------------------------------------
-    # Private
-    # ----------------------------------------------------------------
+    async def _submit(self, payload: NtfyPayload) -> bool:
+        """Queue the payload when batching, otherwise deliver it now."""
+        if self._batcher is not None:
+            return self._batcher.put(payload)
+        return await self._deliver(payload)
 
-    async def _post_notification(self, payload: dict[str, Any]) -> bool:
-        """POST JSON payload to ntfy server root.
+    async def _deliver(self, payload: NtfyPayload) -> bool:
+        """POST one payload through the circuit breaker, logging failures."""
+        circuit = self._circuit
+        try:
+            if circuit is None:
+                return await self._post_notification(payload)
+            if not circuit.is_closed():
+                return await circuit.call(self._post_notification, payload)
+
+            # Closed breaker: skip call() and just report the outcome
+            started = time.monotonic()
+            try:
+                result = await self._post_notification(payload)
+            except Exception as e:
+                circuit.record_failure(e, time.monotonic() - started)
+                raise
+            circuit.record_success(time.monotonic() - started)
+            return result
 
-        Per ntfy docs: JSON publish must POST to the ROOT URL,
-        not to the topic URL. Topic is specified in the JSON body.
+        except CircuitOpenError:
+            logger.error("ntfy circuit OPEN — notification dropped")
+            return False
+        except Exception as e:
+            logger.error("ntfy send failed: %s", e)
+            return False
+
+    async def _post_notification(self, payload: NtfyPayload) -> bool:
+        """POST the message to the topic URL with metadata as headers.
+
+        Smaller on the wire than the JSON form and needs no encoding
+        step beyond UTF-8 for the body.
         """
-        resp = await self._client.post(
-            f"{self._server_url}/",
-            json=payload,
+        headers = {**self._headers, "Priority": str(payload.priority)}
+        if payload.title:
+            headers["Title"] = _header_value(payload.title)
+        if payload.tags:
+            headers["Tags"] = ",".join(payload.tags)
+        if payload.click:
+            headers["Click"] = _header_value(payload.click)
+
+        resp = await self._http().post(
+            f"{self._server_url}/{payload.topic}",
+            content=payload.message.encode(),
+            headers=headers,
+            timeout=self._timeout,
         )
         if resp.status_code in (200, 201):
             logger.info(
                 "ntfy notification sent: topic=%s priority=%d",
-                payload.get("topic"),
-                payload.get("priority", 3),
+                payload.topic,
+                payload.priority,
             )
             return True
         else:
             logger.error(
                 "ntfy notification failed: status=%d body=%s",
                 resp.status_code,
-                resp.text[:200],
+                resp.content[:200].decode("utf-8", errors="replace"),
             )
             return False
 
@@ -253,8 +539,6 @@ async def notify_with_fallback(
 
     APPROVED decisions are silent regardless of notification channel.
     """
-    from vyapaar_mcp.observability import metrics
-
     if result.decision == Decision.APPROVED:
         return
 
@@ -269,11 +553,7 @@ async def notify_with_fallback(
                     result, vendor_name=vendor_name, vendor_url=vendor_url,
                 )
             elif result.decision == Decision.REJECTED:
-                alert_reasons = {
-                    ReasonCode.RISK_HIGH, ReasonCode.DOMAIN_BLOCKED,
-                    ReasonCode.LIMIT_EXCEEDED, ReasonCode.NO_POLICY,
-                }
-                if result.reason_code in alert_reasons:
+                if result.reason_code in SLACK_ALERT_REASONS:
                     slack_sent = await slack_notifier.send_rejection_alert(
                         result, vendor_name=vendor_name, vendor_url=vendor_url,
                     )
@@ -1,7 +1,7 @@
 """Razorpay X payout actions — approve/reject/cancel payouts.
 
-Uses the Razorpay Python SDK for authenticated API calls.
-Implements retry with exponential backoff for 5xx errors.
+Talks to the Razorpay X REST API directly over a pooled async HTTP
+client. Implements retry with exponential backoff for 5xx errors.
 """
 
 from __future__ import annotations
@@ -9,22 +9,38 @@ from __future__ import annotations
 import asyncio
 import base64
 import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
-import razorpay
 
+from vyapaar_mcp.egress.http_clients import HTTP2_AVAILABLE
 from vyapaar_mcp.resilience import CircuitBreaker
 from vyapaar_mcp.security import mask_secrets
 
 logger = logging.getLogger(__name__)
 
+_RAZORPAY_API_URL = "https://api.razorpay.com"
+
+# Health probes within this window reuse the last ping result
+_PING_CACHE_TTL = 5.0  # seconds
+
 # Retry configuration per SPEC §14.3
 MAX_RETRIES = 3
 BASE_DELAY = 1.0
 MAX_DELAY = 30.0
 BACKOFF_MULTIPLIER = 2.0
 
+# Transport failures worth retrying; anything else is a bug or a
+# permanent error and is raised straight away
+_TRANSIENT_ERRORS = (
+    httpx.TimeoutException,
+    httpx.ConnectError,
+    httpx.RemoteProtocolError,
+)
+
 
 class RazorpayActions:
     """Razorpay X payout approve/reject actions."""
@@ -35,64 +51,141 @@ class RazorpayActions:
         key_secret: str,
         circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
-        self._client = razorpay.Client(auth=(key_id, key_secret))
         self._key_id = key_id
-        self._key_secret = key_secret
+        # Basic-auth header is built once, not per request
+        self._auth_header = "Basic " + base64.b64encode(
+            f"{key_id}:{key_secret}".encode()
+        ).decode()
         self._circuit = circuit_breaker or CircuitBreaker(
             "razorpay", failure_threshold=5, recovery_timeout=30.0
         )
+        # Shared keep-alive pool for every Razorpay call
+        self._http = httpx.AsyncClient(
+            base_url=_RAZORPAY_API_URL,
+            # Concurrent approve/reject calls can share one connection
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=15.0,
+            ),
+            timeout=10.0,
+            headers={
+                "Authorization": self._auth_header,
+                "Content-Type": "application/json",
+            },
+        )
+        # (checked_at monotonic, reachable)
+        self._ping_cache: tuple[float, bool] | None = None
         logger.info("Razorpay client initialized")
 
+    @staticmethod
+    def _jittered(delay: float) -> float:
+        """Randomise a backoff step so concurrent retries don't line up."""
+        return random.uniform(BASE_DELAY, min(delay * BACKOFF_MULTIPLIER, MAX_DELAY))
+
     async def _retry_with_backoff(
         self,
         operation: str,
-        func: object,
-        *args: object,
+        func: Callable[..., Awaitable[dict[str, object]]],
+        *args: Any,
     ) -> dict[str, object]:
         """Execute a Razorpay API call with exponential backoff retry.
 
-        Retries on 5xx errors. Does NOT retry on 4xx (client errors).
+        Retries on 5xx, 429 (honouring Retry-After) and transient
+        transport errors. Anything else — 4xx client errors, bugs —
+        propagates immediately.
         """
         last_error: Exception | None = None
         delay = BASE_DELAY
 
         for attempt in range(1, MAX_RETRIES + 1):
             try:
-                # Razorpay SDK is synchronous — run in thread pool
-                loop = asyncio.get_running_loop()
-                result = await loop.run_in_executor(None, func, *args)  # type: ignore[arg-type]
+                result = await self._attempt(func, *args)
                 logger.info(
                     "%s succeeded on attempt %d for args: %s",
                     operation, attempt, args,
                 )
-                return result  # type: ignore[return-value]
-
-            except razorpay.errors.ServerError as e:
+                return result
+
+            except httpx.HTTPStatusError as e:
+                status = e.response.status_code
+                if status < 500 and status != 429:
+                    # 4xx — don't retry
+                    logger.error(
+                        "%s failed with client error: %s",
+                        operation, mask_secrets(str(e)),
+                    )
+                    raise
                 last_error = e
-                logger.warning(
-                    "%s failed (attempt %d/%d): %s — retrying in %.1fs",
-                    operation, attempt, MAX_RETRIES, mask_secrets(str(e)), delay,
-                )
-                await asyncio.sleep(delay)
-                delay = min(delay * BACKOFF_MULTIPLIER, MAX_DELAY)
+                sleep_for = self._jittered(delay)
+                if status == 429:
+                    sleep_for = self._retry_after(e.response, sleep_for)
 
-            except razorpay.errors.BadRequestError as e:
-                # 4xx — don't retry
-                logger.error("%s failed with client error: %s", operation, mask_secrets(str(e)))
-                raise
-
-            except Exception as e:
+            except _TRANSIENT_ERRORS as e:
                 last_error = e
-                logger.error("%s unexpected error: %s", operation, mask_secrets(str(e)))
-                if attempt == MAX_RETRIES:
-                    raise
-                await asyncio.sleep(delay)
-                delay = min(delay * BACKOFF_MULTIPLIER, MAX_DELAY)
+                sleep_for = self._jittered(delay)
+
+            if attempt == MAX_RETRIES:
+                break
+            logger.warning(
+                "%s failed (attempt %d/%d): %s — retrying in %.1fs",
+                operation, attempt, MAX_RETRIES,
+                mask_secrets(str(last_error)), sleep_for,
+            )
+            await asyncio.sleep(sleep_for)
+            delay = min(delay * BACKOFF_MULTIPLIER, MAX_DELAY)
 
         raise RuntimeError(
             f"{operation} failed after {MAX_RETRIES} attempts: {last_error}"
         )
 
+    async def _attempt(
+        self,
+        func: Callable[..., Awaitable[dict[str, object]]],
+        *args: Any,
+    ) -> dict[str, object]:
+        """One HTTP attempt, timed for the breaker's latency tracking.
+
+        Timing each attempt rather than the whole retry keeps backoff
+        sleeps from reading as a slow Razorpay.
+        """
+        started = time.monotonic()
+        try:
+            return await func(*args)
+        finally:
+            self._circuit.record_latency(time.monotonic() - started)
+
+    @staticmethod
+    def _retry_after(response: httpx.Response, default: float) -> float:
+        """Seconds to wait from a Retry-After header, capped at MAX_DELAY."""
+        try:
+            return min(float(response.headers["Retry-After"]), MAX_DELAY)
+        except (KeyError, ValueError):
+            return default
+
+    async def _guarded(
+        self,
+        operation: str,
+        func: Callable[..., Awaitable[dict[str, object]]],
+        *args: Any,
+    ) -> dict[str, object]:
+        """Run a retried API call under the circuit breaker.
+
+        While the breaker is closed the call skips its gate entirely;
+        otherwise it must be admitted first. The outcome is reported
+        once per retried call, latency once per attempt (see _attempt).
+        """
+        if not self._circuit.is_closed():
+            await self._circuit.admit()
+        try:
+            result = await self._retry_with_backoff(operation, func, *args)
+        except Exception as e:
+            self._circuit.record_failure(e)
+            raise
+        self._circuit.record_success()
+        return result
+
     async def approve_payout(self, payout_id: str) -> dict[str, object]:
         """Approve a queued payout on Razorpay X.
 
@@ -100,25 +193,13 @@ class RazorpayActions:
         Protected by circuit breaker.
         """
         logger.info("Approving payout: %s", payout_id)
-        return await self._circuit.call(
-            self._retry_with_backoff,
-            "approve_payout",
-            self._approve_payout_sync,
-            payout_id,
+        return await self._guarded(
+            "approve_payout", self._approve_payout_async, payout_id,
         )
 
-    def _approve_payout_sync(self, payout_id: str) -> dict[str, object]:
-        """Synchronous Razorpay approve call (run in thread pool)."""
-        auth_str = base64.b64encode(
-            f"{self._key_id}:{self._key_secret}".encode()
-        ).decode()
-        resp = httpx.post(
-            f"https://api.razorpay.com/v1/payouts/{payout_id}/approve",
-            headers={
-                "Authorization": f"Basic {auth_str}",
-                "Content-Type": "application/json",
-            },
-        )
+    async def _approve_payout_async(self, payout_id: str) -> dict[str, object]:
+        """Single approve request (retries handled by the caller)."""
+        resp = await self._http.post(f"/v1/payouts/{payout_id}/approve")
         resp.raise_for_status()
         return resp.json()  # type: ignore[return-value]
 
@@ -129,48 +210,35 @@ class RazorpayActions:
         Protected by circuit breaker.
         """
         logger.info("Rejecting payout: %s — reason: %s", payout_id, reason)
-        return await self._circuit.call(
-            self._retry_with_backoff,
-            "reject_payout",
-            self._approve_or_cancel,
-            payout_id,
-            reason,
+        return await self._guarded(
+            "reject_payout", self._approve_or_cancel, payout_id, reason,
         )
 
-    def _approve_or_cancel(self, payout_id: str, reason: str = "") -> dict[str, object]:
-        """Synchronous Razorpay cancel call (run in thread pool)."""
-        try:
-            # Try SDK cancel method
-            result: dict[str, object] = self._client.payout.cancel(  # type: ignore[attr-defined]
-                payout_id,
-                {"remarks": f"REJECTED by Vyapaar MCP: {reason}"},
-            )
-            return result
-        except AttributeError:
-            # Fallback: use general HTTP
-            auth_str = base64.b64encode(
-                f"{self._key_id}:{self._key_secret}".encode()
-            ).decode()
-            resp = httpx.patch(
-                f"https://api.razorpay.com/v1/payouts/{payout_id}/cancel",
-                headers={
-                    "Authorization": f"Basic {auth_str}",
-                    "Content-Type": "application/json",
-                },
-                json={"remarks": f"REJECTED by Vyapaar MCP: {reason}"},
-            )
-            resp.raise_for_status()
-            return resp.json()  # type: ignore[return-value]
+    async def _approve_or_cancel(
+        self, payout_id: str, reason: str = ""
+    ) -> dict[str, object]:
+        """Single cancel request (retries handled by the caller)."""
+        resp = await self._http.patch(
+            f"/v1/payouts/{payout_id}/cancel",
+            json={"remarks": f"REJECTED by Vyapaar MCP: {reason}"},
+        )
+        resp.raise_for_status()
+        return resp.json()  # type: ignore[return-value]
 
     async def ping(self) -> bool:
-        """Check if Razorpay API is reachable."""
+        """Check if Razorpay API is reachable (cached for a few seconds)."""
+        now = time.monotonic()
+        if self._ping_cache and now - self._ping_cache[0] < _PING_CACHE_TTL:
+            return self._ping_cache[1]
         try:
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(
-                None,
-                self._client.payment.all,  # type: ignore[attr-defined]
-                {"count": 1},
-            )
-            return True
+            resp = await self._http.get("/v1/payments", params={"count": 1})
+            resp.raise_for_status()
+            ok = True
         except Exception:
-            return False
+            ok = False
+        self._ping_cache = (now, ok)
+        return ok
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._http.aclose()
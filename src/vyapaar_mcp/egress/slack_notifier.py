@@ -23,28 +23,176 @@ Environment Variables:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
 import hashlib
 import hmac
 import logging
+import re
 import time
 from typing import Any
 
 import httpx
+import orjson
 
+from vyapaar_mcp.egress.http_clients import SLACK_API_BASE
 from vyapaar_mcp.models import Decision, GovernanceResult, ReasonCode
 from vyapaar_mcp.observability import metrics
 from vyapaar_mcp.security import mask_secrets
 
 logger = logging.getLogger(__name__)
 
-SLACK_API_BASE = "https://slack.com/api"
-
 # Slack signature verification
 SLACK_SIGNATURE_VERSION = "v0"
 
+# Security-relevant rejections that get a Slack alert
+SLACK_ALERT_REASONS: frozenset[ReasonCode] = frozenset({
+    ReasonCode.RISK_HIGH,
+    ReasonCode.DOMAIN_BLOCKED,
+    ReasonCode.LIMIT_EXCEEDED,
+    ReasonCode.NO_POLICY,
+})
+
+
+# ================================================================
+# Block Kit Templates
+#
+# The approval/rejection layouts are fixed, so they are serialized to
+# JSON once at import with %(name)s markers. Rendering is then a single
+# string substitution of pre-escaped values — no per-message dict tree
+# and no JSON encoding walk.
+# ================================================================
+
+_FOOTER_BLOCK: dict[str, Any] = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": (
+                "⚖️ *Vyapaar MCP* — Agentic Financial Governance | "
+                "Processing: %(processing_ms)sms"
+            ),
+        },
+    ],
+}
+
+_APPROVAL_BLOCKS_TEMPLATE: str = orjson.dumps([
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": "🔔 Payout Approval Required",
+            "emoji": True,
+        },
+    },
+    {
+        "type": "section",
+        "fields": [
+            {"type": "mrkdwn", "text": "*Payout ID:*\n`%(payout_id)s`"},
+            {"type": "mrkdwn", "text": "*Amount:*\n₹%(amount)s (%(amount_paise)d paise)"},
+            {"type": "mrkdwn", "text": "*Agent:*\n`%(agent_id)s`"},
+            {"type": "mrkdwn", "text": "*Vendor:*\n%(vendor)s"},
+        ],
+    },
+    {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": "*Reason:* %(reason)s"},
+    },
+    {
+        "type": "actions",
+        "block_id": "approval_%(payout_id)s",
+        "elements": [
+            {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "✅ Approve", "emoji": True},
+                "style": "primary",
+                "action_id": "approve_payout",
+                "value": "%(payout_id)s",
+            },
+            {
+                "type": "button",
+                "text": {"type": "plain_text", "text": "❌ Reject", "emoji": True},
+                "style": "danger",
+                "action_id": "reject_payout",
+                "value": "%(payout_id)s",
+            },
+        ],
+    },
+    {"type": "divider"},
+    _FOOTER_BLOCK,
+]).decode()
+
+_REJECTION_BLOCKS_TEMPLATE: str = orjson.dumps([
+    {
+        "type": "header",
+        "text": {
+            "type": "plain_text",
+            "text": "%(emoji)s Payout Rejected — %(reason_code)s",
+            "emoji": True,
+        },
+    },
+    {
+        "type": "section",
+        "fields": [
+            {"type": "mrkdwn", "text": "*Payout ID:*\n`%(payout_id)s`"},
+            {"type": "mrkdwn", "text": "*Amount:*\n₹%(amount)s"},
+            {"type": "mrkdwn", "text": "*Agent:*\n`%(agent_id)s`"},
+            {"type": "mrkdwn", "text": "*Vendor:*\n%(vendor)s"},
+        ],
+    },
+    {
+        "type": "section",
+        "text": {"type": "mrkdwn", "text": "*Detail:* %(detail)s"},
+    },
+    {"type": "divider"},
+    _FOOTER_BLOCK,
+]).decode()
+
+# Replaces the buttons once a human has decided (chat.update)
+_DECISION_BLOCKS_TEMPLATE: str = orjson.dumps([
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "%(emoji)s *Payout `%(payout_id)s` %(verb)s*\nDecision by <@%(user_name)s>",
+        },
+    },
+]).decode()
+
+# Rejection alerts queued within this window are posted as one message.
+# Slack caps a message at 50 blocks; an alert is 5 blocks plus a divider.
+_REJECTION_BATCH_WINDOW = 0.05
+_REJECTION_BATCH_MAX = 8
+_DIVIDER_JOIN = b',{"type":"divider"},'
+
+# Slack responses lead with the top-level "ok" flag, so success can be
+# detected without decoding the (echoed-back) message body
+_SLACK_OK_PREFIX = b'{"ok":true'
+_SLACK_TS_RE = re.compile(rb'"ts":"([^"]*)"')
+
+_REASON_EMOJI: dict[ReasonCode, str] = {
+    ReasonCode.RISK_HIGH: "🦠",
+    ReasonCode.DOMAIN_BLOCKED: "🚫",
+    ReasonCode.LIMIT_EXCEEDED: "💰",
+    ReasonCode.TXN_LIMIT_EXCEEDED: "💸",
+    ReasonCode.NO_POLICY: "📋",
+}
+
+
+def _json_escape(value: str) -> str:
+    """Escape a string for splicing between quotes in a JSON template."""
+    return orjson.dumps(value).decode()[1:-1]
+
+
+@functools.lru_cache(maxsize=8)
+def _hmac_prototype(signing_secret: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 state for a signing secret; copy it before use."""
+    return hmac.new(signing_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
 
 def verify_slack_signature(
-    payload: str,
+    payload: bytes | str,
     timestamp: str,
     signature: str,
     signing_secret: str,
@@ -55,7 +203,7 @@ def verify_slack_signature(
     https://api.slack.com/authentication/verifying-requests-from-slack
     
     Args:
-        payload: Raw request body
+        payload: Raw request body, ideally the undecoded bytes
         timestamp: X-Slack-Request-Timestamp header
         signature: X-Slack-Signature header
         signing_secret: Slack app signing secret
@@ -74,18 +222,26 @@ def verify_slack_signature(
         logger.warning("Slack signature verification failed: invalid timestamp")
         return False
     
-    # Build the base string
-    base_string = f"{SLACK_SIGNATURE_VERSION}:{timestamp}:{payload}"
-    
-    # Compute signature
-    expected_signature = hmac.new(
-        key=signing_secret.encode("utf-8"),
-        msg=base_string.encode("utf-8"),
-        digestmod=hashlib.sha256,
-    ).hexdigest()
-    
-    # Compare signatures (timing-safe)
-    is_valid = hmac.compare_digest(f"{SLACK_SIGNATURE_VERSION}={expected_signature}", signature)
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+
+    # Compute signature over "v0:{timestamp}:{body}" from the cached keyed
+    # state (skips re-padding the key); the body is hashed in place.
+    # One-shot hmac.digest() was measured slower here: it re-keys on every
+    # call and needs the prefix and body concatenated first.
+    mac = _hmac_prototype(signing_secret).copy()
+    mac.update(f"{SLACK_SIGNATURE_VERSION}:{timestamp}:".encode())
+    mac.update(payload)
+
+    # Compare raw digests (timing-safe) rather than their hex forms
+    version, _, hex_digest = signature.partition("=")
+    try:
+        received = bytes.fromhex(hex_digest)
+    except ValueError:
+        received = b""
+    is_valid = version == SLACK_SIGNATURE_VERSION and hmac.compare_digest(
+        mac.digest(), received
+    )
     
     if not is_valid:
         logger.warning("Slack signature verification FAILED")
@@ -102,25 +258,52 @@ class SlackNotifier:
         self,
         bot_token: str,
         channel_id: str,
+        http: httpx.AsyncClient | None = None,
+        batch: bool = False,
     ) -> None:
+        """Create the notifier.
+
+        Args:
+            bot_token: Slack bot token (xoxb-...).
+            channel_id: Channel to post governance messages to.
+            http: Shared Slack API client (see ``http_clients``). The
+                caller owns it; without one the notifier opens its own.
+            batch: Coalesce rejection alerts arriving within ~50ms into
+                one message. Approval requests are always sent at once.
+        """
         self._bot_token = bot_token
         self._channel_id = channel_id
-        self._http = httpx.AsyncClient(
-            base_url=SLACK_API_BASE,
-            headers={
-                "Authorization": f"Bearer {bot_token}",
-                "Content-Type": "application/json; charset=utf-8",
-            },
-            timeout=10.0,
+        self._headers = {
+            "Authorization": f"Bearer {bot_token}",
+            "Content-Type": "application/json; charset=utf-8",
+        }
+        self._owns_http = http is None
+        self._http = http or httpx.AsyncClient(base_url=SLACK_API_BASE, timeout=10.0)
+        self._batch = batch
+        self._pending: asyncio.Queue[tuple[str, bytes, asyncio.Future[bool]]] = (
+            asyncio.Queue()
         )
+        self._flush_task: asyncio.Task[None] | None = None
         logger.info(
             "SlackNotifier initialized (channel=%s)",
             channel_id,
         )
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self._http.aclose()
+        """Flush queued rejection alerts and close the HTTP client.
+
+        The client is left open if it was injected.
+        """
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        while not self._pending.empty():
+            size = min(self._pending.qsize(), _REJECTION_BATCH_MAX)
+            await self._flush_rejections([self._pending.get_nowait() for _ in range(size)])
+        if self._owns_http:
+            await self._http.aclose()
 
     # ================================================================
     # Approval Requests (HELD payouts)
@@ -163,16 +346,64 @@ class SlackNotifier:
         - DOMAIN_BLOCKED
         - LIMIT_EXCEEDED
         - NO_POLICY
+
+        When batching, the alert is queued and this returns once the
+        combined message it joined has been posted.
         """
         amount_rupees = result.amount / 100
         blocks = self._build_rejection_blocks(
             result, amount_rupees, vendor_name, vendor_url
         )
+        text = f"🚨 Payout Rejected: ₹{amount_rupees:,.2f} — {result.reason_code.value}"
+
+        if not self._batch:
+            return await self._post_message(text=text, blocks=blocks)
+
+        loop = asyncio.get_running_loop()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_loop())
+        future: asyncio.Future[bool] = loop.create_future()
+        self._pending.put_nowait((text, blocks, future))
+        return await future
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._pending.get()]
+            deadline = loop.time() + _REJECTION_BATCH_WINDOW
+            try:
+                while len(batch) < _REJECTION_BATCH_MAX:
+                    if not self._pending.empty():
+                        batch.append(self._pending.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    batch.append(await asyncio.wait_for(self._pending.get(), remaining))
+            except TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                # Hand the partial batch back for close() to deliver
+                for item in batch:
+                    self._pending.put_nowait(item)
+                raise
+            await self._flush_rejections(batch)
+
+    async def _flush_rejections(
+        self,
+        batch: list[tuple[str, bytes, asyncio.Future[bool]]],
+    ) -> None:
+        """Post queued alerts as one message, separated by dividers."""
+        text = batch[0][0] if len(batch) == 1 else f"🚨 {len(batch)} payouts rejected"
+        blocks = b"[" + _DIVIDER_JOIN.join(b[1:-1] for _, b, _ in batch) + b"]"
 
-        return await self._post_message(
-            text=f"🚨 Payout Rejected: ₹{amount_rupees:,.2f} — {result.reason_code.value}",
-            blocks=blocks,
-        )
+        sent = False
+        try:
+            sent = await self._post_message(text=text, blocks=blocks)
+        finally:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_result(sent)
 
     # ================================================================
     # Slack API
@@ -181,23 +412,36 @@ class SlackNotifier:
     async def _post_message(
         self,
         text: str,
-        blocks: list[dict[str, Any]] | None = None,
+        blocks: bytes | None = None,
     ) -> bool:
-        """Post a message to the configured Slack channel."""
-        payload: dict[str, Any] = {
-            "channel": self._channel_id,
-            "text": text,  # Fallback for notifications
-        }
+        """Post a message to the configured Slack channel.
+
+        ``blocks`` is a pre-rendered JSON array from the template builders.
+        """
+        # "text" is the fallback for notifications
+        body = orjson.dumps({"channel": self._channel_id, "text": text})
         if blocks:
-            payload["blocks"] = blocks
+            body = body[:-1] + b',"blocks":' + blocks + b"}"
 
         try:
             response = await self._http.post(
                 "/chat.postMessage",
-                json=payload,
+                content=body,
+                headers=self._headers,
             )
-            data = response.json()
+            content = response.content
+            if content.startswith(_SLACK_OK_PREFIX):
+                if logger.isEnabledFor(logging.INFO):
+                    ts = _SLACK_TS_RE.search(content)
+                    logger.info(
+                        "Slack message sent: ts=%s channel=%s",
+                        ts.group(1).decode() if ts else None,
+                        self._channel_id,
+                    )
+                return True
 
+            # Unusual formatting or an error: fall back to a full parse
+            data = orjson.loads(content)
             if data.get("ok"):
                 logger.info(
                     "Slack message sent: ts=%s channel=%s",
@@ -205,12 +449,11 @@ class SlackNotifier:
                     self._channel_id,
                 )
                 return True
-            else:
-                logger.error(
-                    "Slack API error: %s",
-                    data.get("error", "unknown"),
-                )
-                return False
+            logger.error(
+                "Slack API error: %s",
+                data.get("error", "unknown"),
+            )
+            return False
 
         except httpx.TimeoutException:
             logger.error("Slack API timeout")
@@ -222,8 +465,8 @@ class SlackNotifier:
     async def ping(self) -> bool:
         """Check if Slack API is reachable with valid token."""
         try:
-            response = await self._http.post("/auth.test")
-            data = response.json()
+            response = await self._http.post("/auth.test", headers=self._headers)
+            data = orjson.loads(response.content)
             return bool(data.get("ok"))
         except Exception:
             return False
@@ -240,35 +483,22 @@ class SlackNotifier:
 
         Replaces the interactive buttons with a confirmation banner.
         """
-        emoji = "✅" if action == "approve" else "❌"
         verb = "APPROVED" if action == "approve" else "REJECTED"
-
-        blocks: list[dict[str, Any]] = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": (
-                        f"{emoji} *Payout `{payout_id}` {verb}*\n"
-                        f"Decision by <@{user_name}>"
-                    ),
-                },
-            },
-        ]
-
-        payload: dict[str, Any] = {
+        body = orjson.dumps({
             "channel": channel,
             "ts": message_ts,
-            "blocks": blocks,
             "text": f"Payout {payout_id} {verb} by {user_name}",
-        }
+        })
+        blocks = self._build_decision_blocks(payout_id, action, user_name)
+        body = body[:-1] + b',"blocks":' + blocks + b"}"
 
         try:
             response = await self._http.post(
                 "/chat.update",
-                json=payload,
+                content=body,
+                headers=self._headers,
             )
-            data = response.json()
+            data = orjson.loads(response.content)
             return bool(data.get("ok"))
         except Exception as e:
             logger.error("Failed to update Slack message: %s", e)
@@ -278,98 +508,34 @@ class SlackNotifier:
     # Block Kit Message Builders
     # ================================================================
 
+    @staticmethod
+    def _build_decision_blocks(payout_id: str, action: str, user_name: str) -> bytes:
+        """Render the Block Kit blocks (JSON array) for a decided approval."""
+        approved = action == "approve"
+        return (_DECISION_BLOCKS_TEMPLATE % {
+            "emoji": "✅" if approved else "❌",
+            "payout_id": _json_escape(payout_id),
+            "verb": "APPROVED" if approved else "REJECTED",
+            "user_name": _json_escape(user_name),
+        }).encode()
+
     @staticmethod
     def _build_approval_blocks(
         result: GovernanceResult,
         amount_rupees: float,
         vendor_name: str | None,
         vendor_url: str | None,
-    ) -> list[dict[str, Any]]:
-        """Build Slack Block Kit blocks for an approval request."""
-        vendor_display = vendor_name or vendor_url or "Unknown Vendor"
-
-        blocks: list[dict[str, Any]] = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "🔔 Payout Approval Required",
-                    "emoji": True,
-                },
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Payout ID:*\n`{result.payout_id}`",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Amount:*\n₹{amount_rupees:,.2f} ({result.amount} paise)",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Agent:*\n`{result.agent_id}`",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Vendor:*\n{vendor_display}",
-                    },
-                ],
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Reason:* {result.reason_detail}",
-                },
-            },
-            {
-                "type": "actions",
-                "block_id": f"approval_{result.payout_id}",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "✅ Approve",
-                            "emoji": True,
-                        },
-                        "style": "primary",
-                        "action_id": "approve_payout",
-                        "value": result.payout_id,
-                    },
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "❌ Reject",
-                            "emoji": True,
-                        },
-                        "style": "danger",
-                        "action_id": "reject_payout",
-                        "value": result.payout_id,
-                    },
-                ],
-            },
-            {
-                "type": "divider",
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": (
-                            "⚖️ *Vyapaar MCP* — Agentic Financial Governance | "
-                            f"Processing: {result.processing_ms}ms"
-                        ),
-                    },
-                ],
-            },
-        ]
-        return blocks
+    ) -> bytes:
+        """Render the Block Kit blocks (JSON array) for an approval request."""
+        return (_APPROVAL_BLOCKS_TEMPLATE % {
+            "payout_id": _json_escape(result.payout_id),
+            "amount": _json_escape(f"{amount_rupees:,.2f}"),
+            "amount_paise": result.amount,
+            "agent_id": _json_escape(result.agent_id),
+            "vendor": _json_escape(vendor_name or vendor_url or "Unknown Vendor"),
+            "reason": _json_escape(result.reason_detail),
+            "processing_ms": result.processing_ms,
+        }).encode()
 
     @staticmethod
     def _build_rejection_blocks(
@@ -377,78 +543,22 @@ class SlackNotifier:
         amount_rupees: float,
         vendor_name: str | None,
         vendor_url: str | None,
-    ) -> list[dict[str, Any]]:
-        """Build Slack Block Kit blocks for a rejection alert."""
-        vendor_display = vendor_name or vendor_url or "Unknown Vendor"
-
-        # Emoji based on reason
-        reason_emoji = {
-            ReasonCode.RISK_HIGH: "🦠",
-            ReasonCode.DOMAIN_BLOCKED: "🚫",
-            ReasonCode.LIMIT_EXCEEDED: "💰",
-            ReasonCode.TXN_LIMIT_EXCEEDED: "💸",
-            ReasonCode.NO_POLICY: "📋",
-        }
-        emoji = reason_emoji.get(result.reason_code, "❌")
-
+    ) -> bytes:
+        """Render the Block Kit blocks (JSON array) for a rejection alert."""
         threat_text = ""
         if result.threat_types:
             threat_text = f"\n*Threats Detected:* {', '.join(result.threat_types)}"
 
-        blocks: list[dict[str, Any]] = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} Payout Rejected — {result.reason_code.value}",
-                    "emoji": True,
-                },
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Payout ID:*\n`{result.payout_id}`",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Amount:*\n₹{amount_rupees:,.2f}",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Agent:*\n`{result.agent_id}`",
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Vendor:*\n{vendor_display}",
-                    },
-                ],
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Detail:* {result.reason_detail}{threat_text}",
-                },
-            },
-            {
-                "type": "divider",
-            },
-            {
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": (
-                            "⚖️ *Vyapaar MCP* — Agentic Financial Governance | "
-                            f"Processing: {result.processing_ms}ms"
-                        ),
-                    },
-                ],
-            },
-        ]
-        return blocks
+        return (_REJECTION_BLOCKS_TEMPLATE % {
+            "emoji": _REASON_EMOJI.get(result.reason_code, "❌"),
+            "reason_code": _json_escape(result.reason_code.value),
+            "payout_id": _json_escape(result.payout_id),
+            "amount": _json_escape(f"{amount_rupees:,.2f}"),
+            "agent_id": _json_escape(result.agent_id),
+            "vendor": _json_escape(vendor_name or vendor_url or "Unknown Vendor"),
+            "detail": _json_escape(f"{result.reason_detail}{threat_text}"),
+            "processing_ms": result.processing_ms,
+        }).encode()
 
 
 # ================================================================
@@ -469,32 +579,29 @@ async def notify_slack(
     - REJECTED (security reasons) → Slack alert
     - APPROVED → No notification (logged silently)
     """
-    if notifier is None:
+    # Most decisions need no message: settle them before any branching
+    decision = result.decision
+    if notifier is None or decision is Decision.APPROVED:
+        return
+    # Only alert on security-relevant rejections
+    if decision is Decision.REJECTED and result.reason_code not in SLACK_ALERT_REASONS:
         return
 
     try:
-        if result.decision == Decision.HELD:
+        if decision is Decision.HELD:
             success = await notifier.request_approval(
                 result,
                 vendor_name=vendor_name,
                 vendor_url=vendor_url,
             )
             metrics.record_slack_notification(success=success)
-        elif result.decision == Decision.REJECTED:
-            # Only alert on security-relevant rejections
-            alert_reasons = {
-                ReasonCode.RISK_HIGH,
-                ReasonCode.DOMAIN_BLOCKED,
-                ReasonCode.LIMIT_EXCEEDED,
-                ReasonCode.NO_POLICY,
-            }
-            if result.reason_code in alert_reasons:
-                success = await notifier.send_rejection_alert(
-                    result,
-                    vendor_name=vendor_name,
-                    vendor_url=vendor_url,
-                )
-                metrics.record_slack_notification(success=success)
+        elif decision is Decision.REJECTED:
+            success = await notifier.send_rejection_alert(
+                result,
+                vendor_name=vendor_name,
+                vendor_url=vendor_url,
+            )
+            metrics.record_slack_notification(success=success)
     except Exception as e:
         # Slack failures should never block the governance pipeline
         metrics.record_slack_notification(success=False)
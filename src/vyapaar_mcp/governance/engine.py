@@ -14,23 +14,35 @@ Implements the Decision Matrix from SPEC §8:
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import time
-from urllib.parse import urlparse
+from collections import OrderedDict
 
 from vyapaar_mcp.db.postgres import PostgresClient
 from vyapaar_mcp.db.redis_client import RedisClient
 from vyapaar_mcp.models import (
+    AgentPolicy,
     Decision,
     GovernanceResult,
     PayoutEntity,
     ReasonCode,
+    SafeBrowsingResponse,
 )
 from vyapaar_mcp.observability import metrics
 from vyapaar_mcp.reputation.safe_browsing import SafeBrowsingChecker
 
 logger = logging.getLogger(__name__)
 
+# In-process cache of agent policies; updates are also pushed over
+# Redis pub/sub, so the TTL only bounds staleness if that is down
+POLICY_CACHE_SIZE = 10_000
+POLICY_CACHE_TTL = 60.0  # seconds
+# Listener reconnect backoff: doubles per failed attempt, up to the cap
+POLICY_LISTENER_RETRY = 1.0  # seconds
+POLICY_LISTENER_RETRY_MAX = 30.0  # seconds
+
 
 class GovernanceEngine:
     """Core decision engine for payout governance.
@@ -52,6 +64,81 @@ class GovernanceEngine:
         self._safe_browsing = safe_browsing
         self._rate_limit_max = rate_limit_max
         self._rate_limit_window = rate_limit_window
+        # agent_id -> (expires_at monotonic, policy)
+        self._policy_cache: OrderedDict[str, tuple[float, AgentPolicy]] = OrderedDict()
+        # Bumped on every invalidation so an in-flight fetch can't
+        # re-cache a policy that was replaced while it ran
+        self._policy_epoch = 0
+        self._policy_listener: asyncio.Task[None] | None = None
+
+    # ================================================================
+    # Policy Cache
+    # ================================================================
+
+    async def _get_policy(self, agent_id: str) -> AgentPolicy | None:
+        """Return the agent's policy, from the local cache when fresh."""
+        now = time.monotonic()
+        entry = self._policy_cache.get(agent_id)
+        if entry is not None and entry[0] > now:
+            self._policy_cache.move_to_end(agent_id)
+            return entry[1]
+
+        epoch = self._policy_epoch
+        policy = await self._postgres.get_agent_policy(agent_id)
+        if policy is None:
+            self._policy_cache.pop(agent_id, None)
+        elif epoch == self._policy_epoch:
+            self._policy_cache[agent_id] = (now + POLICY_CACHE_TTL, policy)
+            self._policy_cache.move_to_end(agent_id)
+            if len(self._policy_cache) > POLICY_CACHE_SIZE:
+                self._policy_cache.popitem(last=False)
+        return policy
+
+    def invalidate_policy(self, agent_id: str) -> None:
+        """Drop the cached policy for an agent (call after updating it)."""
+        self._policy_epoch += 1
+        self._policy_cache.pop(agent_id, None)
+
+    def start_policy_listener(self) -> None:
+        """Evict cached policies as updates are published on Redis."""
+        if self._policy_listener is None or self._policy_listener.done():
+            self._policy_listener = asyncio.create_task(
+                self._listen_policy_invalidations()
+            )
+
+    async def _listen_policy_invalidations(self) -> None:
+        delay = POLICY_LISTENER_RETRY
+        while True:
+            started = time.monotonic()
+            try:
+                async for agent_id in self._redis.policy_invalidations():
+                    self.invalidate_policy(agent_id)
+            except Exception as e:
+                # Staying up longer than the backoff means it had recovered
+                if time.monotonic() - started > delay:
+                    delay = POLICY_LISTENER_RETRY
+                # Warn once per outage; the retries are only worth a debug line
+                if delay == POLICY_LISTENER_RETRY:
+                    logger.warning("Policy invalidation listener failed: %s", e)
+                else:
+                    logger.debug("Policy invalidation listener still down: %s", e)
+            # Updates published while unsubscribed were missed
+            self._policy_epoch += 1
+            self._policy_cache.clear()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, POLICY_LISTENER_RETRY_MAX)
+
+    async def close(self) -> None:
+        """Stop the policy invalidation listener."""
+        if self._policy_listener is not None:
+            self._policy_listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._policy_listener
+            self._policy_listener = None
+
+    # ================================================================
+    # Evaluation
+    # ================================================================
 
     async def evaluate(
         self,
@@ -63,13 +150,47 @@ class GovernanceEngine:
 
         Returns a GovernanceResult with the decision, reason, and metadata.
         """
-        start_time = time.monotonic()
+        start_ns = time.perf_counter_ns()
 
-        # --- Step 1: Fetch agent policy ---
-        policy = await self._postgres.get_agent_policy(agent_id)
+        # The reputation lookup is the slowest step and needs nothing from
+        # the earlier ones, so it starts now and is cancelled if an earlier
+        # check rejects the payout.
+        sb_task = (
+            asyncio.create_task(self._safe_browsing.check_url(vendor_url))
+            if vendor_url
+            else None
+        )
+        # Check results, recorded to metrics in one go at the end
+        checks: dict[str, bool] = {}
+        try:
+            return await self._evaluate(
+                payout, agent_id, vendor_url, start_ns, sb_task, checks
+            )
+        finally:
+            if sb_task is not None:
+                if not sb_task.done():
+                    sb_task.cancel()
+                elif not sb_task.cancelled():
+                    # An early reject never awaited it; retrieve a failure
+                    # so asyncio doesn't report it as never retrieved
+                    sb_task.exception()
+            if checks:
+                metrics.record_payout_checks(**checks)
+
+    async def _evaluate(
+        self,
+        payout: PayoutEntity,
+        agent_id: str,
+        vendor_url: str | None,
+        start_ns: int,
+        sb_task: asyncio.Task[SafeBrowsingResponse] | None,
+        checks: dict[str, bool],
+    ) -> GovernanceResult:
+        # --- Step 1: Fetch agent policy (cached) ---
+        policy = await self._get_policy(agent_id)
         if policy is None:
             return self._result(
-                payout, agent_id, start_time,
+                payout, agent_id, start_ns,
                 Decision.REJECTED, ReasonCode.NO_POLICY,
                 f"No spending policy found for agent '{agent_id}'",
             )
@@ -77,37 +198,54 @@ class GovernanceEngine:
         # --- Step 2: Per-transaction limit check ---
         if policy.per_txn_limit is not None and payout.amount > policy.per_txn_limit:
             return self._result(
-                payout, agent_id, start_time,
+                payout, agent_id, start_ns,
                 Decision.REJECTED, ReasonCode.TXN_LIMIT_EXCEEDED,
                 f"Amount {payout.amount} paise exceeds per-txn limit"
                 f" of {policy.per_txn_limit} paise",
             )
 
-        # --- Step 2.5: Rate limit check (sliding window) ---
+        # --- Steps 2.5 + 3: Rate limit (sliding window) and daily budget ---
+        # Independent Redis round trips, so they run concurrently. A budget
+        # reservation made for a rate-limited request is rolled back.
+        budget_check = self._redis.check_budget_atomic(
+            agent_id, payout.amount, policy.daily_limit
+        )
         if self._rate_limit_max > 0:
-            allowed, count = await self._redis.check_rate_limit(
-                agent_id,
-                max_requests=self._rate_limit_max,
-                window_seconds=self._rate_limit_window,
+            rate_outcome, budget_outcome = await asyncio.gather(
+                self._redis.check_rate_limit(
+                    agent_id,
+                    max_requests=self._rate_limit_max,
+                    window_seconds=self._rate_limit_window,
+                ),
+                budget_check,
+                return_exceptions=True,
             )
-            metrics.record_rate_limit_check(allowed=allowed)
+            if isinstance(rate_outcome, BaseException):
+                if budget_outcome is True:
+                    await self._redis.rollback_budget(agent_id, payout.amount)
+                raise rate_outcome
+            if isinstance(budget_outcome, BaseException):
+                raise budget_outcome
+            allowed, count = rate_outcome
+            budget_ok = budget_outcome
+            checks["rate_limit_allowed"] = allowed
             if not allowed:
+                if budget_ok:
+                    await self._redis.rollback_budget(agent_id, payout.amount)
                 return self._result(
-                    payout, agent_id, start_time,
+                    payout, agent_id, start_ns,
                     Decision.REJECTED, ReasonCode.RATE_LIMITED,
                     f"Rate limit exceeded: {count}/{self._rate_limit_max}"
                     f" requests in {self._rate_limit_window}s window",
                 )
+        else:
+            budget_ok = await budget_check
 
-        # --- Step 3: Daily budget check (ATOMIC Redis) ---
-        budget_ok = await self._redis.check_budget_atomic(
-            agent_id, payout.amount, policy.daily_limit
-        )
-        metrics.record_budget_check(ok=budget_ok)
+        checks["budget_ok"] = budget_ok
         if not budget_ok:
             current_spend = await self._redis.get_daily_spend(agent_id)
             return self._result(
-                payout, agent_id, start_time,
+                payout, agent_id, start_ns,
                 Decision.REJECTED, ReasonCode.LIMIT_EXCEEDED,
                 f"Daily budget exceeded: spent {current_spend}"
                 f" + {payout.amount} > limit {policy.daily_limit} paise",
@@ -116,36 +254,42 @@ class GovernanceEngine:
         # --- Step 4: Domain blacklist/whitelist check ---
         if vendor_url:
             domain = self._extract_domain(vendor_url)
+            if domain:
+                domain = domain.lower()
 
             # Check blacklist
-            if domain and policy.blocked_domains and domain in policy.blocked_domains:
+            if domain and domain in policy.blocked_domain_set:
                 # Rollback budget since we're rejecting
                 await self._redis.rollback_budget(agent_id, payout.amount)
                 return self._result(
-                    payout, agent_id, start_time,
+                    payout, agent_id, start_ns,
                     Decision.REJECTED, ReasonCode.DOMAIN_BLOCKED,
                     f"Vendor domain '{domain}' is on the blocklist",
                 )
 
             # Check whitelist (if set, domain must be in it)
-            if domain and policy.allowed_domains and domain not in policy.allowed_domains:
+            if (
+                domain
+                and policy.allowed_domain_set
+                and domain not in policy.allowed_domain_set
+            ):
                 await self._redis.rollback_budget(agent_id, payout.amount)
                 return self._result(
-                    payout, agent_id, start_time,
+                    payout, agent_id, start_ns,
                     Decision.REJECTED, ReasonCode.DOMAIN_BLOCKED,
                     f"Vendor domain '{domain}' not in allowlist",
                 )
 
         # --- Step 5: Google Safe Browsing reputation check ---
-        if vendor_url:
-            sb_result = await self._safe_browsing.check_url(vendor_url)
-            metrics.record_reputation_check(safe=sb_result.is_safe)
+        if sb_task is not None:
+            sb_result = await sb_task
+            checks["reputation_safe"] = sb_result.is_safe
             if not sb_result.is_safe:
                 # Rollback budget since we're rejecting
                 await self._redis.rollback_budget(agent_id, payout.amount)
                 threat_types = sb_result.threat_types
                 return self._result(
-                    payout, agent_id, start_time,
+                    payout, agent_id, start_ns,
                     Decision.REJECTED, ReasonCode.RISK_HIGH,
                     f"Google Safe Browsing flagged URL as unsafe: {', '.join(threat_types)}",
                     threat_types=threat_types,
@@ -157,7 +301,7 @@ class GovernanceEngine:
             and payout.amount > policy.require_approval_above
         ):
             return self._result(
-                payout, agent_id, start_time,
+                payout, agent_id, start_ns,
                 Decision.HELD, ReasonCode.APPROVAL_REQUIRED,
                 f"Amount {payout.amount} paise exceeds approval"
                 f" threshold of {policy.require_approval_above} paise",
@@ -165,32 +309,56 @@ class GovernanceEngine:
 
         # --- Step 7: All checks passed → APPROVE ---
         return self._result(
-            payout, agent_id, start_time,
+            payout, agent_id, start_ns,
             Decision.APPROVED, ReasonCode.POLICY_OK,
             "All governance checks passed",
         )
 
     @staticmethod
     def _extract_domain(url: str) -> str | None:
-        """Extract domain from a URL."""
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc or parsed.path.split("/")[0]
-        except Exception:
-            return None
+        """Extract the host (without userinfo or port) from a URL.
+
+        A plain string scan rather than ``urlparse``: this runs on every
+        payout with a vendor URL and only needs the authority part.
+        Scheme-less URLs ("vendor.com/pay") are treated as host-first.
+        """
+        start = url.find("://")
+        if (
+            start >= 0
+            and url.find("/", 0, start) < 0
+            and url.find("?", 0, start) < 0
+            and url.find("#", 0, start) < 0
+        ):
+            start += 3
+        else:
+            start = 2 if url.startswith("//") else 0
+
+        end = len(url)
+        for sep in "/?#":
+            i = url.find(sep, start, end)
+            if i >= 0:
+                end = i
+
+        host = url[start:end]
+        host = host[host.rfind("@") + 1:]
+        # Drop a port, but not the colons inside an IPv6 literal
+        colon = host.rfind(":")
+        if colon > host.rfind("]"):
+            host = host[:colon]
+        return host or None
 
     @staticmethod
     def _result(
         payout: PayoutEntity,
         agent_id: str,
-        start_time: float,
+        start_ns: int,
         decision: Decision,
         reason_code: ReasonCode,
         reason_detail: str,
         threat_types: list[str] | None = None,
     ) -> GovernanceResult:
         """Create a GovernanceResult with processing time."""
-        elapsed_ms = int((time.monotonic() - start_time) * 1000)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         result = GovernanceResult(
             decision=decision,
             reason_code=reason_code,
@@ -202,11 +370,21 @@ class GovernanceEngine:
             processing_ms=elapsed_ms,
         )
 
-        log_level = logging.WARNING if decision != Decision.APPROVED else logging.INFO
-        logger.log(
-            log_level,
-            "DECISION: %s | payout=%s agent=%s amount=%d reason=%s (%dms)",
-            decision.value, payout.id, agent_id, payout.amount,
-            reason_code.value, elapsed_ms,
-        )
+        log_level = logging.INFO if decision is Decision.APPROVED else logging.WARNING
+        if logger.isEnabledFor(log_level):
+            logger.log(
+                log_level,
+                "DECISION: %s | payout=%s agent=%s amount=%d reason=%s (%dms)",
+                decision.value, payout.id, agent_id, payout.amount,
+                reason_code.value, elapsed_ms,
+                # Picked up as top-level keys by the JSON formatter
+                extra={"extra_fields": {
+                    "decision": decision.value,
+                    "payout_id": payout.id,
+                    "agent_id": agent_id,
+                    "amount": payout.amount,
+                    "reason_code": reason_code.value,
+                    "processing_ms": elapsed_ms,
+                }},
+            )
         return result
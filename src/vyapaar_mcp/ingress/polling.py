@@ -21,10 +21,17 @@ Architecture:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import itertools
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+from types import MappingProxyType
 from typing import Any
 
+from pydantic import TypeAdapter, ValidationError
+
 from vyapaar_mcp.db.redis_client import RedisClient
 from vyapaar_mcp.ingress.razorpay_bridge import RazorpayBridge
 from vyapaar_mcp.models import PayoutEntity
@@ -36,8 +43,23 @@ DEFAULT_POLL_INTERVAL = 30  # seconds
 MIN_POLL_INTERVAL = 5
 MAX_POLL_INTERVAL = 300
 MAX_PAYOUTS_PER_PAGE = 100
+# Pages requested at once past the first (well under 600 req/min)
+PAGE_FETCH_CONCURRENCY = 4
 ERROR_BACKOFF_BASE = 5.0
 ERROR_BACKOFF_MAX = 120.0
+# Payout IDs already marked in Redis, remembered to skip re-checking them
+SEEN_CACHE_SIZE = 4 * MAX_PAYOUTS_PER_PAGE
+
+# Idempotency key prefix for polled payouts
+_POLL_KEY_PREFIX = "poll:payout.queued:"
+# Read-only stand-in for a payout without notes
+_NO_NOTES: Mapping[str, Any] = MappingProxyType({})
+
+# Validates a page of payouts in a single call
+_PAYOUT_LIST_ADAPTER = TypeAdapter(list[PayoutEntity])
+
+# In-flight batch of (queued payouts, is_last) pages
+_PageWindow = asyncio.Future[list[tuple[list[dict[str, Any]], bool]]]
 
 
 class PayoutPoller:
@@ -58,77 +80,154 @@ class PayoutPoller:
     ) -> None:
         self._bridge = bridge
         self._account_number = account_number
+        # Masked once for every log line that names the account
+        self._masked_account = (
+            "*" * max(len(account_number) - 4, 0) + account_number[-4:]
+        )
         self._redis = redis
         self._poll_interval = max(
             MIN_POLL_INTERVAL, min(poll_interval, MAX_POLL_INTERVAL)
         )
         self._running = False
         self._error_count = 0
+        # Progress tracking for adaptive scheduling
+        self._last_found = 0
+        self._consecutive_empty = 0
         self._total_processed = 0
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        # time.monotonic() of the last poll; converted to epoch in stats
         self._last_poll_at: float | None = None
 
-        # Mask account number in logs
-        masked = account_number[-4:].rjust(
-            len(account_number), "*"
-        )
         logger.info(
             "PayoutPoller initialized (interval=%ds, account=%s)",
             self._poll_interval,
-            masked,
+            self._masked_account,
         )
 
-    async def fetch_queued_payouts(
+    async def _fetch_page(
         self,
         count: int = MAX_PAYOUTS_PER_PAGE,
         skip: int = 0,
-    ) -> list[dict[str, Any]]:
-        """Fetch payouts with status=queued from Razorpay API.
-
-        Uses RazorpayBridge.fetch_all_payouts which maps to:
-          GET /v1/payouts?account_number={acct}&status=queued
-
-        Returns:
-            List of raw payout dicts from the API response.
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Fetch one page of payouts.
+
+        Returns (queued payouts, is_last_page). Status filtering happens
+        here rather than in the bridge so the unfiltered page size can
+        tell whether more pages follow. Razorpay's ``count`` is the size
+        of this page, not a total, so a full last page still costs one
+        empty probe, unless the response carries a ``has_more`` flag.
         """
         data = await self._bridge.fetch_all_payouts(
             account_number=self._account_number,
             count=count,
             skip=skip,
-            status="queued",
         )
         items: list[dict[str, Any]] = data.get("items", [])
+        queued = [p for p in items if p.get("status") == "queued"]
 
         logger.debug(
-            "Fetched %d queued payouts (skip=%d, total_count=%d)",
+            "Fetched %d queued of %d payouts (skip=%d)",
+            len(queued),
             len(items),
             skip,
-            data.get("count", 0),
         )
-        return items
+        has_more = data.get("has_more")
+        if isinstance(has_more, bool):
+            return queued, not has_more
+        return queued, len(items) < count
 
-    async def fetch_all_queued_payouts(self) -> list[dict[str, Any]]:
-        """Fetch ALL queued payouts with automatic pagination.
+    async def fetch_queued_payouts(
+        self,
+        count: int = MAX_PAYOUTS_PER_PAGE,
+        skip: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Fetch payouts with status=queued from Razorpay API.
 
-        Iterates through pages until no more results.
+        Uses RazorpayBridge.fetch_all_payouts which maps to:
+          GET /v1/payouts?account_number={acct}
 
         Returns:
-            Complete list of queued payouts.
+            List of raw payout dicts from the API response.
         """
-        all_payouts: list[dict[str, Any]] = []
-        skip = 0
+        queued, _ = await self._fetch_page(count=count, skip=skip)
+        return queued
 
-        while True:
-            batch = await self.fetch_queued_payouts(
-                count=MAX_PAYOUTS_PER_PAGE, skip=skip
-            )
-            if not batch:
-                break
-            all_payouts.extend(batch)
-            if len(batch) < MAX_PAYOUTS_PER_PAGE:
-                break  # Last page
-            skip += MAX_PAYOUTS_PER_PAGE
+    async def iter_queued_payouts(
+        self,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """Yield queued payouts page by page, in page order.
+
+        The first page is fetched alone (usually the only one). If it is
+        full, the following pages are requested PAGE_FETCH_CONCURRENCY at
+        a time until a short page marks the end. Razorpay reports no
+        total count, so the window is speculative. The next window is
+        already in flight while the caller handles the current one.
+        """
+        first, is_last = await self._fetch_page(skip=0)
+        if is_last:
+            yield first
+            return
+
+        skip = MAX_PAYOUTS_PER_PAGE
+        pending: _PageWindow | None = self._fetch_window(skip)
+        try:
+            yield first
+            while pending is not None:
+                pages = await pending
+                skip += PAGE_FETCH_CONCURRENCY * MAX_PAYOUTS_PER_PAGE
+                done = any(is_last for _, is_last in pages)
+                pending = None if done else self._fetch_window(skip)
+                for queued, is_last in pages:
+                    yield queued
+                    if is_last:
+                        break
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await pending
+
+    def _fetch_window(self, skip: int) -> _PageWindow:
+        """Start fetching PAGE_FETCH_CONCURRENCY pages from ``skip`` on."""
+        window = range(
+            skip,
+            skip + PAGE_FETCH_CONCURRENCY * MAX_PAYOUTS_PER_PAGE,
+            MAX_PAYOUTS_PER_PAGE,
+        )
+        return asyncio.gather(
+            *(self._fetch_page(skip=page_skip) for page_skip in window)
+        )
 
-        return all_payouts
+    async def fetch_all_queued_payouts(self) -> list[dict[str, Any]]:
+        """Fetch ALL queued payouts with automatic pagination.
+
+        Returns:
+            Complete list of queued payouts, in page order.
+        """
+        pages = [page async for page in self.iter_queued_payouts()]
+        if len(pages) == 1:
+            return pages[0]
+        # One pass over the pages instead of growing a list per page
+        return list(itertools.chain.from_iterable(pages))
+
+    @staticmethod
+    def _payout_fields(raw_payout: dict[str, Any]) -> dict[str, Any]:
+        """Pick and default the PayoutEntity fields from a raw payout."""
+        return {
+            "id": raw_payout["id"],
+            "entity": raw_payout.get("entity", "payout"),
+            "fund_account_id": raw_payout.get("fund_account_id"),
+            "amount": raw_payout["amount"],
+            "currency": raw_payout.get("currency", "INR"),
+            "notes": raw_payout.get("notes", {}),
+            "fees": raw_payout.get("fees"),
+            "tax": raw_payout.get("tax"),
+            "status": raw_payout["status"],
+            "purpose": raw_payout.get("purpose"),
+            "mode": raw_payout.get("mode"),
+            "reference_id": raw_payout.get("reference_id"),
+            "created_at": raw_payout.get("created_at"),
+        }
 
     def convert_to_payout_entity(
         self, raw_payout: dict[str, Any]
@@ -138,93 +237,183 @@ class PayoutPoller:
         The API response format matches what the Go MCP server's
         fetch_all_payouts returns. We normalize into our Pydantic model.
         """
-        return PayoutEntity(
-            id=raw_payout["id"],
-            entity=raw_payout.get("entity", "payout"),
-            fund_account_id=raw_payout.get("fund_account_id"),
-            amount=raw_payout["amount"],
-            currency=raw_payout.get("currency", "INR"),
-            notes=raw_payout.get("notes", {}),
-            fees=raw_payout.get("fees"),
-            tax=raw_payout.get("tax"),
-            status=raw_payout["status"],
-            purpose=raw_payout.get("purpose"),
-            mode=raw_payout.get("mode"),
-            reference_id=raw_payout.get("reference_id"),
-            created_at=raw_payout.get("created_at"),
+        # Validated on purpose: strict typing keeps a drifted or string
+        # amount out of the governance checks, and pydantic-core builds
+        # this model faster than model_construct() would.
+        return PayoutEntity.model_validate(self._payout_fields(raw_payout))
+
+    def convert_page(
+        self, raw_payouts: list[dict[str, Any]]
+    ) -> list[PayoutEntity]:
+        """convert_to_payout_entity() for a whole page in one validation call."""
+        return _PAYOUT_LIST_ADAPTER.validate_python(
+            [self._payout_fields(raw) for raw in raw_payouts]
         )
 
-    async def poll_once(
+    async def iter_new_payouts(
         self,
-    ) -> list[tuple[PayoutEntity, str, str | None]]:
-        """Execute a single poll cycle.
+    ) -> AsyncIterator[tuple[PayoutEntity, str, str | None]]:
+        """Execute a single poll cycle, yielding new payouts as pages land.
 
         Steps:
-        1. Fetch all queued payouts via RazorpayBridge
-        2. Deduplicate against Redis (same as webhook idempotency)
+        1. Fetch queued payouts page by page via RazorpayBridge
+        2. Deduplicate each page against Redis (same as webhook idempotency)
         3. Convert new payouts to PayoutEntity
-        4. Return list of (payout, agent_id, vendor_url) tuples
+        4. Yield (payout, agent_id, vendor_url) tuples
 
-        Returns:
-            List of new (not-yet-processed) payout tuples.
+        Earlier pages are handed out while later ones are still being
+        fetched, so callers can start processing without waiting for the
+        whole queue.
         """
-        self._last_poll_at = time.time()
+        self._last_poll_at = time.monotonic()
+        total = found = 0
 
-        # Step 1: Fetch via bridge
+        pages = self.iter_queued_payouts()
         try:
-            raw_payouts = await self.fetch_all_queued_payouts()
-            self._error_count = 0  # Reset on success
-        except Exception as e:
-            self._error_count += 1
-            logger.error(
-                "Razorpay API poll error (attempt %d): %s",
-                self._error_count,
-                e,
+            while True:
+                # Step 1: Fetch via bridge
+                try:
+                    raw_page = await anext(pages)
+                except StopAsyncIteration:
+                    break
+                except Exception as e:
+                    self._error_count += 1
+                    logger.error(
+                        "Razorpay API poll error for account %s (attempt %d): %s",
+                        self._masked_account,
+                        self._error_count,
+                        e,
+                    )
+                    return
+
+                total += len(raw_page)
+                for entry in await self._new_from_page(raw_page):
+                    found += 1
+                    yield entry
+        finally:
+            await pages.aclose()
+
+        self._error_count = 0  # Reset on success
+
+        if not total:
+            logger.debug("No queued payouts found")
+        elif found:
+            logger.info(
+                "🔍 Poll found %d NEW payouts (of %d total queued)",
+                found,
+                total,
             )
-            return []
 
+        self._record_progress(found)
+
+    async def _new_from_page(
+        self, raw_payouts: list[dict[str, Any]]
+    ) -> list[tuple[PayoutEntity, str, str | None]]:
+        """Deduplicate and convert one page of queued payouts."""
         if not raw_payouts:
-            logger.debug("No queued payouts found")
             return []
 
+        # Checked once per page rather than per skipped payout
+        debug_on = logger.isEnabledFor(logging.DEBUG)
+
         # Step 2 & 3: Deduplicate + Convert
         new_payouts: list[tuple[PayoutEntity, str, str | None]] = []
 
+        # Payouts stay queued across cycles until processed; IDs already
+        # marked in Redis are skipped locally without another round trip
+        to_check: list[dict[str, Any]] = []
         for raw in raw_payouts:
             payout_id = raw.get("id", "")
-            idempotency_key = f"poll:payout.queued:{payout_id}"
-
-            # Check if already processed (same Redis layer as webhooks)
-            is_new = await self._redis.check_idempotency(
-                idempotency_key
-            )
+            if payout_id in self._seen:
+                self._seen.move_to_end(payout_id)
+                if debug_on:
+                    logger.debug(
+                        "Skipping already-processed payout: %s",
+                        payout_id,
+                    )
+            else:
+                to_check.append(raw)
+
+        # Convert before marking anything: a payout is only recorded as
+        # processed in Redis once it is certain to reach governance
+        converted = self._convert_valid(to_check)
+
+        # Check the rest against Redis (same layer as webhooks), all in
+        # one pipelined round trip
+        is_new_flags: list[bool] = []
+        if converted:
+            is_new_flags = await self._redis.check_idempotency_batch([
+                _POLL_KEY_PREFIX + payout.id for _, payout in converted
+            ])
+
+        for (raw, payout), is_new in zip(converted, is_new_flags, strict=True):
+            # Marked in Redis either way now
+            self._remember(payout.id)
             if not is_new:
-                logger.debug(
-                    "Skipping already-processed payout: %s",
-                    payout_id,
-                )
+                if debug_on:
+                    logger.debug(
+                        "Skipping already-processed payout: %s",
+                        payout.id,
+                    )
                 continue
 
-            # Convert
-            payout = self.convert_to_payout_entity(raw)
-
             # Extract agent_id and vendor_url from notes
-            notes = raw.get("notes", {})
+            notes = raw.get("notes") or _NO_NOTES
             agent_id = notes.get("agent_id", "unknown")
             vendor_url = notes.get("vendor_url") or None
 
             new_payouts.append((payout, agent_id, vendor_url))
-            self._total_processed += 1
-
-        if new_payouts:
-            logger.info(
-                "🔍 Poll found %d NEW payouts (of %d total queued)",
-                len(new_payouts),
-                len(raw_payouts),
-            )
+        self._total_processed += len(new_payouts)
 
         return new_payouts
 
+    def _convert_valid(
+        self, raw_payouts: list[dict[str, Any]]
+    ) -> list[tuple[dict[str, Any], PayoutEntity]]:
+        """Convert a page, dropping (and logging) payouts that don't validate.
+
+        The whole page goes through one pydantic-core call; only if that
+        fails is it redone payout by payout to isolate the bad ones.
+        """
+        if not raw_payouts:
+            return []
+        with contextlib.suppress(ValidationError, KeyError):
+            return list(zip(raw_payouts, self.convert_page(raw_payouts), strict=True))
+
+        converted: list[tuple[dict[str, Any], PayoutEntity]] = []
+        for raw in raw_payouts:
+            try:
+                converted.append((raw, self.convert_to_payout_entity(raw)))
+            except (ValidationError, KeyError) as e:
+                logger.warning(
+                    "Skipping malformed payout %s: %s", raw.get("id", "<no id>"), e
+                )
+        return converted
+
+    async def poll_once(
+        self,
+    ) -> list[tuple[PayoutEntity, str, str | None]]:
+        """Execute a single poll cycle and collect its new payouts.
+
+        Returns:
+            List of new (not-yet-processed) payout tuples.
+        """
+        return [entry async for entry in self.iter_new_payouts()]
+
+    def _remember(self, payout_id: str) -> None:
+        """Add a payout ID to the bounded seen-set, evicting the oldest."""
+        self._seen[payout_id] = None
+        if len(self._seen) > SEEN_CACHE_SIZE:
+            self._seen.popitem(last=False)
+
+    def _record_progress(self, found: int) -> None:
+        """Track how many new payouts the last successful poll found."""
+        self._last_found = found
+        if found:
+            self._consecutive_empty = 0
+        else:
+            self._consecutive_empty += 1
+
     async def run_continuous(
         self,
         on_payout: Any = None,
@@ -238,33 +427,36 @@ class PayoutPoller:
         self._running = True
         logger.info(
             "🔄 PayoutPoller starting continuous poll "
-            "(interval=%ds)",
+            "(interval=%ds, account=%s)",
             self._poll_interval,
+            self._masked_account,
         )
 
         while self._running:
+            started = time.monotonic()
             try:
-                new_payouts = await self.poll_once()
-
-                if on_payout and new_payouts:
-                    for payout, agent_id, vendor_url in new_payouts:
-                        try:
-                            await on_payout(
-                                payout, agent_id, vendor_url
-                            )
-                        except Exception as e:
-                            logger.error(
-                                "Payout callback error for %s: %s",
-                                payout.id,
-                                e,
-                            )
+                async for payout, agent_id, vendor_url in self.iter_new_payouts():
+                    if not on_payout:
+                        continue
+                    try:
+                        await on_payout(
+                            payout, agent_id, vendor_url
+                        )
+                    except Exception as e:
+                        logger.error(
+                            "Payout callback error for %s: %s",
+                            payout.id,
+                            e,
+                        )
 
             except Exception as e:
                 logger.error("Poll loop error: %s", e)
 
-            # Wait with backoff
+            # Wait with backoff, measured from the start of this cycle so
+            # slow polls do not stretch the period
             interval = self.get_backoff_interval()
-            await asyncio.sleep(interval)
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(0.0, interval - elapsed))
 
     def stop(self) -> None:
         """Signal the continuous poller to stop."""
@@ -275,15 +467,26 @@ class PayoutPoller:
         )
 
     def get_backoff_interval(self) -> float:
-        """Calculate poll interval with exponential backoff on errors."""
-        if self._error_count == 0:
-            return float(self._poll_interval)
+        """Calculate the next poll delay from recent progress.
 
-        backoff = min(
-            ERROR_BACKOFF_BASE * (2 ** (self._error_count - 1)),
-            ERROR_BACKOFF_MAX,
-        )
-        return backoff
+        - After an error: exponential backoff up to ``ERROR_BACKOFF_MAX``.
+        - After a poll that found new payouts: ``MIN_POLL_INTERVAL``, since
+          queued payouts tend to arrive in bursts.
+        - After ``k`` empty polls in a row: the configured interval,
+          doubling per further empty poll up to ``MAX_POLL_INTERVAL``.
+        """
+        if self._error_count:
+            return min(
+                ERROR_BACKOFF_BASE * (2 ** (self._error_count - 1)),
+                ERROR_BACKOFF_MAX,
+            )
+
+        if self._last_found:
+            return float(MIN_POLL_INTERVAL)
+
+        # Cap the exponent; the interval saturates long before this
+        k = min(max(self._consecutive_empty - 1, 0), 16)
+        return float(min(self._poll_interval * (2 ** k), MAX_POLL_INTERVAL))
 
     @property
     def stats(self) -> dict[str, Any]:
@@ -292,7 +495,12 @@ class PayoutPoller:
             "running": self._running,
             "poll_interval_seconds": self._poll_interval,
             "error_count": self._error_count,
+            "consecutive_empty_polls": self._consecutive_empty,
             "total_processed": self._total_processed,
-            "last_poll_at": self._last_poll_at,
+            "last_poll_at": (
+                None
+                if self._last_poll_at is None
+                else time.time() - (time.monotonic() - self._last_poll_at)
+            ),
             "current_backoff": self.get_backoff_interval(),
         }
@@ -26,19 +26,37 @@ License:   MIT (Copyright (c) 2025 Razorpay)
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import shutil
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, TypeVar
 
+import anyio
+import orjson
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from mcp.types import TextContent
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Raised by the stdio streams once the Go subprocess has gone away
+_SESSION_BROKEN_ERRORS = (
+    anyio.BrokenResourceError,
+    anyio.ClosedResourceError,
+    anyio.EndOfStream,
+    ConnectionError,
+)
+
+# Concurrent tool calls allowed on the shared session
+MAX_INFLIGHT_CALLS = 8
+# Seconds before a single tool call is abandoned
+TOOL_CALL_TIMEOUT = 30.0
+
 # Default binary location (built from vendor source)
 DEFAULT_BINARY_PATH = str(
     Path(__file__).resolve().parents[3] / "bin" / "razorpay-mcp-server"
@@ -65,12 +83,21 @@ class RazorpayBridge:
         key_id: str,
         key_secret: str,
         binary_path: str | None = None,
+        max_inflight: int = MAX_INFLIGHT_CALLS,
     ) -> None:
         self._key_id = key_id
         self._key_secret = key_secret
         self._binary_path = binary_path or DEFAULT_BINARY_PATH
         self._session: ClientSession | None = None
         self._available_tools: list[str] = []
+        # The persistent session lives in its own task, since the stdio
+        # transport's task group must be exited by the task that entered it
+        self._session_task: asyncio.Task[None] | None = None
+        self._session_closing = asyncio.Event()
+        self._session_lock = asyncio.Lock()
+        self._max_inflight = max_inflight
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._inflight_calls = 0
 
         # Verify binary exists
         if not os.path.isfile(self._binary_path):
@@ -82,15 +109,8 @@ class RazorpayBridge:
                 f"./cmd/razorpay-mcp-server"
             )
 
-        logger.info(
-            "RazorpayBridge initialized (binary: %s, key: %s...)",
-            self._binary_path,
-            key_id[:12],
-        )
-
-    def _get_server_params(self) -> StdioServerParameters:
-        """Build server parameters for the Go MCP binary."""
-        return StdioServerParameters(
+        # Environment is snapshotted once; reconnects reuse the same params
+        self._server_params = StdioServerParameters(
             command=self._binary_path,
             args=[
                 "stdio",
@@ -103,6 +123,16 @@ class RazorpayBridge:
             },
         )
 
+        logger.info(
+            "RazorpayBridge initialized (binary: %s, key: %s...)",
+            self._binary_path,
+            key_id[:12],
+        )
+
+    def _get_server_params(self) -> StdioServerParameters:
+        """Server parameters for the Go MCP binary (built in __init__)."""
+        return self._server_params
+
     @asynccontextmanager
     async def _connect(self) -> AsyncGenerator[ClientSession, None]:
         """Spawn Go binary and establish MCP session.
@@ -131,6 +161,109 @@ class RazorpayBridge:
 
                 yield session
 
+    # ================================================================
+    # Persistent Session
+    # ================================================================
+
+    async def _run_session(
+        self, ready: asyncio.Future[ClientSession], closing: asyncio.Event
+    ) -> None:
+        """Own one Go subprocess + MCP session until ``closing`` is set."""
+        session: ClientSession | None = None
+        try:
+            async with self._connect() as session:
+                ready.set_result(session)
+                await closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("Razorpay MCP session ended: %s", e)
+        finally:
+            # Only forget our own session, never a replacement a peer opened
+            if session is not None and self._session is session:
+                self._session = None
+
+    async def _ensure_session(self) -> ClientSession:
+        """Return the live MCP session, spawning the Go binary if needed."""
+        session = self._session
+        if session is not None:
+            return session
+        async with self._session_lock:
+            if self._session is None:
+                loop = asyncio.get_running_loop()
+                ready: asyncio.Future[ClientSession] = loop.create_future()
+                self._session_closing = asyncio.Event()
+                self._session_task = loop.create_task(
+                    self._run_session(ready, self._session_closing)
+                )
+                self._session = await ready
+                logger.info("Razorpay MCP session started (persistent)")
+            return self._session
+
+    async def _shutdown_session(self) -> None:
+        """Close the current session task; the caller holds _session_lock."""
+        task = self._session_task
+        self._session_task = None
+        self._session = None
+        if task is None:
+            return
+        self._session_closing.set()
+        try:
+            # wait_for cancels the task if the subprocess won't exit
+            await asyncio.wait_for(task, timeout=5.0)
+        except TimeoutError:
+            logger.warning("Razorpay MCP session did not close in time")
+
+    async def _discard_session(self, session: ClientSession) -> None:
+        """Tear down ``session`` after it failed, unless already replaced.
+
+        Concurrent callers that hit the same broken session all land
+        here; only the first one closes it, the rest leave the fresh
+        session a peer may already have opened alone.
+        """
+        async with self._session_lock:
+            if self._session is session:
+                await self._shutdown_session()
+
+    async def aclose(self) -> None:
+        """Shut down the persistent session and its subprocess."""
+        async with self._session_lock:
+            await self._shutdown_session()
+
+    async def _request(
+        self,
+        op: Callable[[ClientSession], Awaitable[T]],
+        retry: bool,
+        label: str,
+    ) -> T:
+        """Run ``op`` on the shared session, bounded and timed out.
+
+        Calls share one persistent subprocess session. If it turns out to
+        be broken, only that session is torn down, and ``op`` is retried
+        once on a fresh one when ``retry`` is set.
+        """
+        # Bounded in-flight calls: excess callers wait here instead of
+        # piling requests onto the subprocess pipe and the rate limit
+        async with self._inflight:
+            self._inflight_calls += 1
+            try:
+                session = await self._ensure_session()
+                try:
+                    return await asyncio.wait_for(op(session), TOOL_CALL_TIMEOUT)
+                except _SESSION_BROKEN_ERRORS as e:
+                    await self._discard_session(session)
+                    if not retry:
+                        raise
+                    logger.warning(
+                        "Razorpay MCP session broken (%s) — reconnecting for '%s'",
+                        type(e).__name__, label,
+                    )
+                    session = await self._ensure_session()
+                    return await asyncio.wait_for(op(session), TOOL_CALL_TIMEOUT)
+            finally:
+                self._inflight_calls -= 1
+
     async def _call_tool(
         self,
         tool_name: str,
@@ -138,39 +271,41 @@ class RazorpayBridge:
     ) -> dict[str, Any]:
         """Call a tool on the Go MCP server and return parsed result.
 
-        Spawns a fresh subprocess for each call. This is the safest
-        approach — no process state leaks between calls.
-        For high-frequency usage, consider a persistent connection.
+        Read-only (fetch_*) calls are retried once on a fresh session if
+        the shared one turns out to be broken; writes are not, since the
+        broken call may already have reached Razorpay.
         """
-        async with self._connect() as session:
-            result = await session.call_tool(
-                tool_name, arguments
-            )
+        result = await self._request(
+            lambda session: session.call_tool(tool_name, arguments),
+            retry=tool_name.startswith("fetch_"),
+            label=tool_name,
+        )
 
-            # Parse the MCP response
-            if result.isError:
-                error_text = ""
-                for content in result.content:
-                    if hasattr(content, "text"):
-                        error_text += content.text
-                logger.error(
-                    "Go MCP tool '%s' error: %s",
-                    tool_name,
-                    error_text,
-                )
-                raise RuntimeError(
-                    f"Razorpay MCP tool error: {error_text}"
-                )
+        # Parse the MCP response
+        if result.isError:
+            error_text = "".join(
+                content.text
+                for content in result.content
+                if isinstance(content, TextContent)
+            )
+            logger.error(
+                "Go MCP tool '%s' error: %s",
+                tool_name,
+                error_text,
+            )
+            raise RuntimeError(
+                f"Razorpay MCP tool error: {error_text}"
+            )
 
-            # Extract text content and parse as JSON
-            for content in result.content:
-                if hasattr(content, "text"):
-                    try:
-                        return json.loads(content.text)
-                    except json.JSONDecodeError:
-                        return {"raw": content.text}
+        # Extract text content and parse as JSON
+        for content in result.content:
+            if isinstance(content, TextContent):
+                try:
+                    return orjson.loads(content.text)
+                except orjson.JSONDecodeError:
+                    return {"raw": content.text}
 
-            return {"raw": str(result.content)}
+        return {"raw": str(result.content)}
 
     # ================================================================
     # Payouts — uses Go SDK's native Payout resource
@@ -409,17 +544,30 @@ class RazorpayBridge:
 
     async def list_tools(self) -> list[str]:
         """List all available tools from the Go MCP server."""
-        async with self._connect() as session:
-            tools_response = await session.list_tools()
-            return [t.name for t in tools_response.tools]
+        tools_response = await self._request(
+            lambda session: session.list_tools(), retry=True, label="list_tools"
+        )
+        return [t.name for t in tools_response.tools]
 
     async def ping(self) -> bool:
-        """Health check — verify Go binary and API reachability."""
+        """Health check — verify Go binary and API reachability.
+
+        A broken session is replaced as for any call; other failures
+        leave the shared session to the calls still using it.
+        """
         try:
-            async with self._connect() as session:
-                # Just establishing a session proves the binary works
-                tools = await session.list_tools()
-                return len(tools.tools) > 0
+            # A live session answering list_tools proves the binary works
+            return len(await self.list_tools()) > 0
         except Exception as e:
             logger.error("Ping failed: %s", e)
             return False
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return session and in-flight call statistics."""
+        return {
+            "session_open": self._session is not None,
+            "max_inflight": self._max_inflight,
+            "inflight": self._inflight_calls,
+            "saturated": self._inflight_calls >= self._max_inflight,
+        }
@@ -2,18 +2,19 @@
 
 CRITICAL SECURITY:
 - Every webhook MUST have its X-Razorpay-Signature verified via HMAC-SHA256.
-- Replayed webhooks are detected via Redis SETNX idempotency.
+- Replayed webhooks are detected via Redis HSETNX idempotency buckets.
 - Invalid signatures return 401 immediately.
 - All payloads are validated for size and format before processing.
 """
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import hmac
-import json
 import logging
-from typing import Any
+
+from pydantic import ValidationError
 
 from vyapaar_mcp.models import RazorpayWebhookEvent
 
@@ -31,6 +32,36 @@ class WebhookValidationError(Exception):
         super().__init__(message)
 
 
+class RazorpaySignatureVerifier:
+    """HMAC-SHA256 verifier for one webhook signing secret.
+
+    The keyed HMAC state (inner and outer pads already absorbed) is built
+    once and copied per message, so verification only hashes the body.
+    """
+
+    def __init__(self, secret: str) -> None:
+        self._mac = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def verify(self, payload_body: bytes, signature: str) -> bool:
+        """Check ``signature`` (hex) against the body's HMAC, timing-safe."""
+        mac = self._mac.copy()
+        mac.update(payload_body)
+
+        # Compare the 32 raw bytes rather than 64 hex chars
+        try:
+            provided = bytes.fromhex(signature)
+        except ValueError:
+            provided = b""
+
+        return hmac.compare_digest(mac.digest(), provided)
+
+
+@functools.lru_cache(maxsize=8)
+def _verifier_for(secret: str) -> RazorpaySignatureVerifier:
+    """Shared verifier per secret (the server only ever has one)."""
+    return RazorpaySignatureVerifier(secret)
+
+
 def verify_razorpay_signature(
     payload_body: bytes,
     signature: str,
@@ -48,13 +79,7 @@ def verify_razorpay_signature(
     Returns:
         True if signature is valid, False otherwise.
     """
-    expected = hmac.new(
-        key=secret.encode("utf-8"),
-        msg=payload_body,
-        digestmod=hashlib.sha256,
-    ).hexdigest()
-
-    is_valid = hmac.compare_digest(expected, signature)
+    is_valid = _verifier_for(secret).verify(payload_body, signature)
 
     if not is_valid:
         logger.warning("Webhook signature verification FAILED")
@@ -77,8 +102,9 @@ def parse_webhook_event(payload_body: bytes) -> RazorpayWebhookEvent:
         ValueError: If the payload cannot be parsed.
     """
     try:
-        data: dict[str, Any] = json.loads(payload_body)
-        event = RazorpayWebhookEvent(**data)
+        # pydantic-core parses the bytes straight into the model, with no
+        # intermediate dict
+        event = RazorpayWebhookEvent.model_validate_json(payload_body)
         logger.info(
             "Parsed webhook: event=%s payout_id=%s amount=%d",
             event.event,
@@ -86,7 +112,7 @@ def parse_webhook_event(payload_body: bytes) -> RazorpayWebhookEvent:
             event.payload.payout.entity.amount,
         )
         return event
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
+    except ValidationError as e:
         logger.error("Failed to parse webhook payload: %s", e)
         raise ValueError(f"Invalid webhook payload: {e}") from e
 
@@ -101,16 +127,18 @@ def extract_webhook_id(event: RazorpayWebhookEvent) -> str:
     return f"{event_type}:{payout_id}"
 
 
-def validate_webhook_payload(payload: str) -> bytes:
+def validate_webhook_payload(payload: bytes) -> bytes:
     """Validate and sanitize webhook payload before processing.
     
     Implements fail-fast input validation per API security best practices.
+    The checks run on the raw body, which is returned unchanged so the
+    signature verifier and parser consume the same object.
     
     Args:
-        payload: Raw webhook payload string.
+        payload: Raw webhook payload bytes.
         
     Returns:
-        Validated payload as bytes.
+        The validated payload bytes.
         
     Raises:
         WebhookValidationError: If payload fails validation.
@@ -122,21 +150,18 @@ def validate_webhook_payload(payload: str) -> bytes:
             code="EMPTY_PAYLOAD"
         )
     
-    # Encode to bytes for size check
-    payload_bytes = payload.encode("utf-8")
-    
     # Check payload size (DoS protection)
-    if len(payload_bytes) > MAX_PAYLOAD_SIZE:
+    if len(payload) > MAX_PAYLOAD_SIZE:
         raise WebhookValidationError(
             f"Webhook payload exceeds maximum size of {MAX_PAYLOAD_SIZE} bytes",
             code="PAYLOAD_TOO_LARGE"
         )
     
     # Check for obviously malformed data (potential injection)
-    if len(payload_bytes) < 10:  # Minimum reasonable size
+    if len(payload) < 10:  # Minimum reasonable size
         raise WebhookValidationError(
             "Webhook payload too short to be valid",
             code="PAYLOAD_TOO_SHORT"
         )
     
-    return payload_bytes
+    return payload
@@ -5,13 +5,18 @@ Reference: https://learn.microsoft.com/en-us/azure/ai-foundry/
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import AsyncAzureOpenAI
+import httpx
 
 from vyapaar_mcp.config import VyapaarConfig
 
+if TYPE_CHECKING:
+    # Imported lazily in initialize(); unconfigured workers skip the SDK
+    from openai import AsyncAzureOpenAI
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,9 +27,21 @@ class AzureOpenAIClient:
     Archestra's deterministic controls.
     """
 
-    def __init__(self, config: VyapaarConfig) -> None:
+    def __init__(
+        self, config: VyapaarConfig, http: httpx.AsyncClient | None = None
+    ) -> None:
+        """Create the client.
+
+        Args:
+            config: Server configuration.
+            http: Shared HTTP pool (see ``egress.http_clients``). The caller
+                owns it; without one the SDK opens its own.
+        """
         self._config = config
+        self._http = http
         self._client: AsyncAzureOpenAI | None = None
+        # Backpressure: bounded in-flight requests, the rest queue here
+        self._inflight = asyncio.Semaphore(max(1, config.azure_max_inflight))
 
     @property
     def is_configured(self) -> bool:
@@ -40,10 +57,13 @@ class AzureOpenAIClient:
             logger.warning("Azure OpenAI not configured - set VYAPAAR_AZURE_OPENAI_ENDPOINT and VYAPAAR_AZURE_OPENAI_API_KEY")
             return
 
+        from openai import AsyncAzureOpenAI
+
         self._client = AsyncAzureOpenAI(
             azure_endpoint=self._config.azure_openai_endpoint,
             api_key=self._config.azure_openai_api_key,
             api_version=self._config.azure_openai_api_version,
+            http_client=self._http,
         )
         logger.info(
             "Azure OpenAI client initialized: endpoint=%s, deployment=%s",
@@ -70,22 +90,36 @@ class AzureOpenAIClient:
         if not self._client:
             return None, "Azure OpenAI not configured - set VYAPAAR_AZURE_OPENAI_ENDPOINT and VYAPAAR_AZURE_OPENAI_API_KEY"
 
+        # Already loaded by initialize(); this is a sys.modules lookup
+        from openai import APIError, APIStatusError, NotFoundError
+
         try:
-            response = await self._client.chat.completions.create(
-                model=self._config.azure_openai_deployment,
-                messages=messages,  # type: ignore
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+            async with self._inflight:
+                response = await self._client.chat.completions.create(
+                    model=self._config.azure_openai_deployment,
+                    messages=messages,  # type: ignore
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
             return response.choices[0].message.content, "success"
-        except Exception as e:
-            error_msg = str(e)
-            if "DeploymentNotFound" in error_msg:
+        except NotFoundError as e:
+            if e.code == "DeploymentNotFound":
                 return None, f"Azure deployment '{self._config.azure_openai_deployment}' not found. Create it in Azure AI Foundry (ai.azure.com)."
-            if "404" in error_msg:
-                return None, f"Azure endpoint error (404). Check VYAPAAR_AZURE_OPENAI_ENDPOINT and deployment name."
-            logger.error("Azure OpenAI API error: %s", e)
-            return None, f"Azure API error: {error_msg}"
+            return None, (
+                "Azure endpoint error (404). "
+                "Check VYAPAAR_AZURE_OPENAI_ENDPOINT and deployment name."
+            )
+        except APIError as e:
+            status = e.status_code if isinstance(e, APIStatusError) else None
+            logger.error(
+                "Azure OpenAI API error: %s",
+                e.message,
+                extra={"extra_fields": {"status": status, "error_code": e.code}},
+            )
+            return None, f"Azure API error: {e.message}"
+        except Exception as e:
+            logger.error("Azure OpenAI client error: %s", e)
+            return None, f"Azure API error: {e}"
 
     async def validate_with_guardrails(self, content: str) -> tuple[bool, str]:
         """Validate content against Azure AI Foundry guardrails.
@@ -124,7 +158,8 @@ class AzureOpenAIClient:
         return True, "Guardrails check pending full implementation"
 
     async def close(self) -> None:
-        """Close the client connection."""
+        """Close the client connection (an injected pool is left open)."""
         if self._client:
-            await self._client.close()
+            if self._http is None:
+                await self._client.close()
             self._client = None
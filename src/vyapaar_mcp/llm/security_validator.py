@@ -8,19 +8,78 @@ It only sees: tool name, parameters, and governance policy.
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from openai import AsyncOpenAI
+import httpx
+import orjson
 
 from vyapaar_mcp.config import VyapaarConfig
 
+if TYPE_CHECKING:
+    # Imported lazily in initialize(); unconfigured workers skip the SDK
+    from openai import AsyncOpenAI
+
 logger = logging.getLogger(__name__)
 
+# Security LLM verdicts kept in-process for repeat tool calls
+VALIDATION_CACHE_SIZE = 1024
+
+
+def _policy_blob(governance_policy: dict[str, Any]) -> bytes:
+    """Canonical (key-sorted) JSON bytes of a governance policy."""
+    return orjson.dumps(governance_policy, option=orjson.OPT_SORT_KEYS, default=str)
+
+
+# Static parts of the security LLM conversation; only the tool call varies
+_SYSTEM_PROMPT = (
+    "You are a security validator for an AI agent. "
+    "Your job is to approve or deny tool calls based on "
+    "governance policies. You have NO access to conversation "
+    "context - only see tool name, parameters, and policy rules. "
+    "Respond with JSON: {\"approved\": bool, \"reason\": str, "
+    "\"risk_score\": float (0-1), \"mitigation\": str|null}"
+)
+_SYSTEM_MESSAGE: dict[str, str] = {"role": "system", "content": _SYSTEM_PROMPT}
+
+_CALL_TEMPLATE = """Validate this tool call:
+
+TOOL: {tool}
+PARAMETERS: {params}
+AGENT_ID: {agent}
+CONTEXT_TAINTED: {tainted}"""
+
+_POLICY_TEMPLATE = """GOVERNANCE_POLICY:
+{policy}"""
+
+_QUESTION = """Question: Should this tool call be allowed?
+Consider:
+1. Does it violate any governance rules?
+2. Is it being called from tainted context?
+3. Could it lead to data leakage or unauthorized actions?
+4. Is the agent_id authorized for this operation?
+
+Respond with JSON only."""
+
+# Provider prompt-caching marker for the persistent (system + policy) prefix
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _tool_set(csv: str) -> frozenset[str]:
+    """Parse a comma-separated tool list from config.
+
+    The config already normalizes these at load time; stripping again
+    keeps values assigned after load honest too.
+    """
+    return frozenset(name for name in (part.strip() for part in csv.split(",")) if name)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolCallRequest:
     """A tool call to be validated."""
     tool_name: str
@@ -29,7 +88,7 @@ class ToolCallRequest:
     context_tainted: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of security LLM validation."""
     approved: bool
@@ -38,6 +97,33 @@ class ValidationResult:
     mitigation: str | None = None
 
 
+# Denied outright while the context is tainted (unless routed to the Dual LLM)
+CRITICAL_TOOLS = frozenset({"handle_razorpay_webhook", "handle_slack_action", "set_agent_policy"})
+
+# Fixed verdicts are shared rather than rebuilt on every call
+_CLEAN_RESULT = ValidationResult(
+    approved=True,
+    reason="Context clean or tool read-only",
+    risk_score=0.0,
+)
+_LLM_UNAVAIL_STRICT = ValidationResult(
+    approved=False,
+    reason="Security LLM unavailable (strict mode)",
+    risk_score=1.0,
+    mitigation="DENY",
+)
+_LLM_UNAVAIL_LENIENT = ValidationResult(
+    approved=True,
+    reason="Security LLM unavailable (non-strict mode)",
+    risk_score=0.5,
+)
+_PARSE_ERROR_LENIENT = ValidationResult(
+    approved=True,
+    reason="Validation parsing error (non-strict mode)",
+    risk_score=0.5,
+)
+
+
 class SecurityLLMClient:
     """Isolated security LLM for Dual LLM quarantine pattern.
     
@@ -45,9 +131,17 @@ class SecurityLLMClient:
     tool calls against governance policies.
     """
 
-    def __init__(self, config: VyapaarConfig) -> None:
+    def __init__(
+        self, config: VyapaarConfig, http: httpx.AsyncClient | None = None
+    ) -> None:
         self._config = config
+        # Shared pool owned by the caller; None lets the SDK open its own
+        self._http = http
         self._client: AsyncOpenAI | None = None
+        # cache key -> (expires_at monotonic, verdict)
+        self._cache: OrderedDict[str, tuple[float, ValidationResult]] = OrderedDict()
+        # cache key -> LLM request already under way for it
+        self._inflight: dict[str, asyncio.Task[ValidationResult]] = {}
 
     @property
     def is_configured(self) -> bool:
@@ -64,9 +158,12 @@ class SecurityLLMClient:
         base_url = self._config.security_llm_url
         api_key = self._config.security_llm_key or "not-needed"
 
+        from openai import AsyncOpenAI
+
         self._client = AsyncOpenAI(
             base_url=base_url,
             api_key=api_key,
+            http_client=self._http,
         )
         logger.info("Security LLM client initialized: %s", base_url)
 
@@ -86,40 +183,57 @@ class SecurityLLMClient:
         """
         if not self._client:
             if self._config.quarantine_strict:
-                return ValidationResult(
-                    approved=False,
-                    reason="Security LLM unavailable (strict mode)",
-                    risk_score=1.0,
-                    mitigation="DENY",
-                )
+                return _LLM_UNAVAIL_STRICT
             # Non-strict: allow but warn
             logger.warning("Security LLM unavailable, allowing tool call (non-strict mode)")
-            return ValidationResult(
-                approved=True,
-                reason="Security LLM unavailable (non-strict mode)",
-                risk_score=0.5,
+            return _LLM_UNAVAIL_LENIENT
+
+        # Serialized once; used for both the verdict cache key and the prompt
+        try:
+            policy_blob = _policy_blob(governance_policy)
+            cache_key = self._cache_key(request, policy_blob)
+        except TypeError as e:
+            # orjson.JSONEncodeError: ints past 64 bits, non-str dict keys
+            logger.error("Cannot serialize tool call for security LLM: %s", e)
+            return self._error_verdict(e)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug("Security LLM cache hit: tool=%s", request.tool_name)
+            return cached
+
+        # Identical calls arriving together share one LLM request. It runs
+        # as its own task so one caller being cancelled does not fail the rest.
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._validate_uncached(
+                    self._client, request, governance_policy, policy_blob, cache_key
+                )
             )
+            self._inflight[cache_key] = task
+
+            def _forget(_task: asyncio.Task[ValidationResult]) -> None:
+                self._inflight.pop(cache_key, None)
+
+            task.add_done_callback(_forget)
+        return await asyncio.shield(task)
 
+    async def _validate_uncached(
+        self,
+        client: AsyncOpenAI,
+        request: ToolCallRequest,
+        governance_policy: dict[str, Any],
+        policy_blob: bytes,
+        cache_key: str,
+    ) -> ValidationResult:
+        """Ask the security LLM; fall back per quarantine mode on failure."""
         try:
             # Build isolated validation prompt (NO conversation context)
-            prompt = self._build_validation_prompt(request, governance_policy)
-            
-            response = await self._client.chat.completions.create(
+            messages = self._build_messages(request, governance_policy, policy_blob)
+
+            response = await client.chat.completions.create(
                 model=self._config.security_llm_model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are a security validator for an AI agent. "
-                            "Your job is to approve or deny tool calls based on "
-                            "governance policies. You have NO access to conversation "
-                            "context - only see tool name, parameters, and policy rules. "
-                            "Respond with JSON: {\"approved\": bool, \"reason\": str, "
-                            "\"risk_score\": float (0-1), \"mitigation\": str|null}"
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
+                messages=messages,  # type: ignore[arg-type]
                 temperature=0.1,  # Low variance for deterministic validation
                 max_tokens=500,
             )
@@ -129,7 +243,7 @@ class SecurityLLMClient:
                 raise ValueError("Empty response from security LLM")
 
             # Parse JSON response
-            result = json.loads(content.strip())
+            result = orjson.loads(content)
             
             # Log for audit
             if self._config.quarantine_audit_log:
@@ -141,14 +255,18 @@ class SecurityLLMClient:
                     result.get("reason", "No reason"),
                 )
 
-            return ValidationResult(
+            verdict = ValidationResult(
                 approved=result.get("approved", False),
                 reason=result.get("reason", "No reason provided"),
                 risk_score=result.get("risk_score", 0.5),
                 mitigation=result.get("mitigation"),
             )
+            # Only real verdicts are cached; the fallbacks below are not,
+            # so an LLM outage is not remembered past its end
+            self._cache_put(cache_key, verdict)
+            return verdict
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error("Failed to parse security LLM response: %s", e)
             if self._config.quarantine_strict:
                 return ValidationResult(
@@ -157,55 +275,121 @@ class SecurityLLMClient:
                     risk_score=1.0,
                     mitigation="DENY",
                 )
-            return ValidationResult(
-                approved=True,
-                reason="Validation parsing error (non-strict mode)",
-                risk_score=0.5,
-            )
+            return _PARSE_ERROR_LENIENT
         except Exception as e:
             logger.error("Security LLM validation error: %s", e)
-            if self._config.quarantine_strict:
-                return ValidationResult(
-                    approved=False,
-                    reason=f"Validation error: {e}",
-                    risk_score=1.0,
-                    mitigation="DENY",
-                )
+            return self._error_verdict(e)
+
+    def _error_verdict(self, error: Exception) -> ValidationResult:
+        """Fallback verdict for a failed validation, per quarantine mode."""
+        if self._config.quarantine_strict:
             return ValidationResult(
-                approved=True,
-                reason=f"Validation error (non-strict): {e}",
-                risk_score=0.5,
+                approved=False,
+                reason=f"Validation error: {error}",
+                risk_score=1.0,
+                mitigation="DENY",
             )
+        return ValidationResult(
+            approved=True,
+            reason=f"Validation error (non-strict): {error}",
+            risk_score=0.5,
+        )
+
+    @staticmethod
+    def _cache_key(request: ToolCallRequest, policy_blob: bytes) -> str:
+        """Digest of everything the security LLM sees for a tool call."""
+        blob = orjson.dumps(
+            {
+                "t": request.tool_name,
+                "p": request.parameters,
+                "a": request.agent_id,
+                "c": request.context_tainted,
+            },
+            option=orjson.OPT_SORT_KEYS,
+            default=str,
+        )
+        digest = hashlib.blake2b(blob, digest_size=16)
+        digest.update(policy_blob)
+        return digest.hexdigest()
+
+    def _cache_get(self, key: str) -> ValidationResult | None:
+        """Return a cached verdict that has not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, verdict = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return verdict
+
+    def _cache_put(self, key: str, verdict: ValidationResult) -> None:
+        """Store a verdict, evicting the least recently used past the cap."""
+        ttl = self._config.security_llm_cache_ttl
+        if ttl <= 0:
+            return
+        self._cache[key] = (time.monotonic() + ttl, verdict)
+        self._cache.move_to_end(key)
+        if len(self._cache) > VALIDATION_CACHE_SIZE:
+            self._cache.popitem(last=False)
 
     def _build_validation_prompt(
         self,
         request: ToolCallRequest,
         governance_policy: dict[str, Any],
+        policy_blob: bytes | None = None,
     ) -> str:
         """Build isolated validation prompt without conversation context."""
-        return f"""Validate this tool call:
-
-TOOL: {request.tool_name}
-PARAMETERS: {json.dumps(request.parameters, indent=2)}
-AGENT_ID: {request.agent_id}
-CONTEXT_TAINTED: {request.context_tainted}
-
-GOVERNANCE_POLICY:
-{json.dumps(governance_policy, indent=2)}
+        if policy_blob is None:
+            policy_blob = _policy_blob(governance_policy)
+        return "\n\n".join((
+            self._format_call(request),
+            _POLICY_TEMPLATE.format(policy=policy_blob.decode()),
+            _QUESTION,
+        ))
+
+    @staticmethod
+    def _format_call(request: ToolCallRequest) -> str:
+        return _CALL_TEMPLATE.format(
+            tool=request.tool_name,
+            params=orjson.dumps(request.parameters, default=str).decode(),
+            agent=request.agent_id,
+            tainted=request.context_tainted,
+        )
 
-Question: Should this tool call be allowed?
-Consider:
-1. Does it violate any governance rules?
-2. Is it being called from tainted context?
-3. Could it lead to data leakage or unauthorized actions?
-4. Is the agent_id authorized for this operation?
+    def _build_messages(
+        self,
+        request: ToolCallRequest,
+        governance_policy: dict[str, Any],
+        policy_blob: bytes,
+    ) -> list[dict[str, Any]]:
+        """Chat messages for one validation.
 
-Respond with JSON only."""
+        With prompt caching on, the system prompt and policy form a
+        persistent prefix marked with ``cache_control`` so the provider
+        can reuse it; only the tool call is sent fresh in the user turn.
+        """
+        if not self._config.security_llm_prompt_cache:
+            prompt = self._build_validation_prompt(request, governance_policy, policy_blob)
+            return [_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+        policy_text = _POLICY_TEMPLATE.format(policy=policy_blob.decode())
+        return [
+            {
+                "role": "system",
+                "content": [
+                    {"type": "text", "text": _SYSTEM_PROMPT, "cache_control": _EPHEMERAL},
+                    {"type": "text", "text": policy_text, "cache_control": _EPHEMERAL},
+                ],
+            },
+            {"role": "user", "content": f"{self._format_call(request)}\n\n{_QUESTION}"},
+        ]
 
     async def close(self) -> None:
-        """Close the client connection."""
+        """Close the client connection (an injected pool is left open)."""
         if self._client:
-            await self._client.close()
+            if self._http is None:
+                await self._client.close()
             self._client = None
 
 
@@ -216,13 +400,38 @@ class ToolCallValidator:
     to the appropriate tier based on tool classification.
     """
 
-    def __init__(self, config: VyapaarConfig) -> None:
+    def __init__(
+        self, config: VyapaarConfig, http: httpx.AsyncClient | None = None
+    ) -> None:
         self._config = config
-        self._security_llm = SecurityLLMClient(config)
-        self._taint_sources = set(config.taint_sources.split(","))
-        self._dual_llm_tools = set(config.dual_llm_tools.split(","))
+        self._security_llm = SecurityLLMClient(config, http=http)
+        self._taint_sources = _tool_set(config.taint_sources)
+        self._dual_llm_tools = _tool_set(config.dual_llm_tools)
+        self._tainted_routes = self._build_tainted_routes(self._dual_llm_tools)
         self._context_tainted = False
 
+    @staticmethod
+    def _build_tainted_routes(
+        dual_llm_tools: frozenset[str],
+    ) -> dict[str, ValidationResult | None]:
+        """Per-tool outcome under a tainted context, for a single lookup.
+
+        A ValidationResult is returned as-is (critical tools get a fixed
+        deny); None means "ask the security LLM". Dual LLM routing wins
+        over the critical-tool deny. Tools not listed are allowed.
+        """
+        routes: dict[str, ValidationResult | None] = {
+            tool: ValidationResult(
+                approved=False,
+                reason=f"Tool '{tool}' is blocked when context is tainted (deterministic policy)",
+                risk_score=1.0,
+                mitigation="Refresh session or wait for taint clearance",
+            )
+            for tool in CRITICAL_TOOLS
+        }
+        routes.update(dict.fromkeys(dual_llm_tools))
+        return routes
+
     @property
     def is_configured(self) -> bool:
         return self._security_llm.is_configured
@@ -260,34 +469,23 @@ class ToolCallValidator:
         2. DUAL LLM when tainted: Security LLM validation required
         3. ALLOW: Read-only tools pass through
         """
-        # Tier 1: Hard deny for critical tools when tainted
-        if self._context_tainted and tool_name not in self._dual_llm_tools:
-            # These are critical operations - deny when tainted
-            critical_tools = {"handle_razorpay_webhook", "handle_slack_action", "set_agent_policy"}
-            if tool_name in critical_tools:
-                return ValidationResult(
-                    approved=False,
-                    reason=f"Tool '{tool_name}' is blocked when context is tainted (deterministic policy)",
-                    risk_score=1.0,
-                    mitigation="Refresh session or wait for taint clearance",
-                )
+        # Tier 3 first: a clean context is the common case
+        if not self._context_tainted:
+            return _CLEAN_RESULT
 
-        # Tier 2: Dual LLM validation for specified tools when tainted
-        if self._context_tainted and tool_name in self._dual_llm_tools:
-            request = ToolCallRequest(
-                tool_name=tool_name,
-                parameters=parameters,
-                agent_id=agent_id,
-                context_tainted=self._context_tainted,
-            )
-            return await self._security_llm.validate_tool_call(request, governance_policy)
+        # Tier 1 (fixed deny) or Tier 3 (allow) resolve from one lookup
+        route = self._tainted_routes.get(tool_name, _CLEAN_RESULT)
+        if route is not None:
+            return route
 
-        # Tier 3: Allow (not tainted or read-only tool)
-        return ValidationResult(
-            approved=True,
-            reason="Context clean or tool read-only",
-            risk_score=0.0,
+        # Tier 2: Dual LLM validation for specified tools when tainted
+        request = ToolCallRequest(
+            tool_name=tool_name,
+            parameters=parameters,
+            agent_id=agent_id,
+            context_tainted=True,
         )
+        return await self._security_llm.validate_tool_call(request, governance_policy)
 
     async def close(self) -> None:
         await self._security_llm.close()
@@ -6,13 +6,25 @@ Can be enabled via VYAPAAR_LOG_FORMAT=json environment variable.
 
 from __future__ import annotations
 
-import json
+import atexit
+import copy
 import logging
 import os
+import queue
 import sys
-from datetime import UTC, datetime
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Any
 
+import orjson
+
+# Background listener that drains the log queue (see configure_logging)
+_listener: QueueListener | None = None
+
+# Rotation for the optional JSON file sink (VYAPAAR_LOG_FILE)
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for structured logging.
@@ -20,11 +32,26 @@ class JSONFormatter(logging.Formatter):
     Outputs logs in JSON format for easy parsing by log aggregators
     (ELK, Datadog, CloudWatch, etc.)
     """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last record; records
+        # within the same second only rebuild the fractional part
+        self._last_second: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC timestamp, same shape as datetime.isoformat()."""
+        sec = int(created)
+        last_sec, base = self._last_second
+        if sec != last_sec:
+            base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._last_second = (sec, base)
+        return f"{base}.{int((created - sec) * 1_000_000):06d}+00:00"
     
     def format(self, record: logging.LogRecord) -> str:
         # Build base log entry
         log_entry: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -37,9 +64,12 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
         
-        # Add extra fields (custom context)
-        if hasattr(record, "extra_fields"):
-            log_entry.update(record.extra_fields)
+        # Add extra fields (custom context). One dict lookup rather than
+        # hasattr + getattr; a record factory can't pre-seed this attribute
+        # because makeRecord refuses to overwrite it from ``extra=``
+        extra_fields = record.__dict__.get("extra_fields")
+        if extra_fields:
+            log_entry.update(extra_fields)
         
         # Add thread/process info for debugging
         if record.threadName != "MainThread":
@@ -47,30 +77,68 @@ class JSONFormatter(logging.Formatter):
         if record.processName != "MainProcess":
             log_entry["process"] = record.processName
         
-        return json.dumps(log_entry)
+        return orjson.dumps(log_entry, default=str).decode()
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that keeps records intact for in-process listeners.
+
+    The stock ``prepare`` pre-formats the message and drops ``exc_info``
+    so records can be pickled across processes. Our listener runs in a
+    thread of the same process, so we only merge args into the message
+    and leave exception info for the downstream formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def _stop_listener() -> None:
+    """Flush and stop the background log listener, if running."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
 
 
 def configure_logging(
     level: str | None = None,
     json_format: bool | None = None,
+    log_file: str | None = None,
 ) -> None:
     """Configure logging for the application.
     
+    Records are pushed onto an in-memory queue by the root logger and
+    written out by a background QueueListener thread, so handler I/O
+    never blocks the event loop. Each handler formats a record itself,
+    so a JSON file sink can sit beside human-readable console output
+    without the console paying for JSON encoding.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR). Default: INFO.
         json_format: Use JSON format. Default: True if VYAPAAR_LOG_FORMAT=json.
+        log_file: Also write JSON lines to this rotating file.
+            Default: VYAPAAR_LOG_FILE, if set.
     """
     # Get configuration from environment
     level = level or os.environ.get("VYAPAAR_LOG_LEVEL", "INFO")
     json_format = json_format or os.environ.get("VYAPAAR_LOG_FORMAT", "") == "json"
+    log_file = log_file or os.environ.get("VYAPAAR_LOG_FILE") or None
     
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers
+    # Remove existing handlers (and drain any previous listener)
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_listener()
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -86,7 +154,25 @@ def configure_logging(
             datefmt="%Y-%m-%d %H:%M:%S"
         ))
     
-    root_logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
+    if log_file:
+        # Machine-readable sink, always JSON regardless of console format
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding="utf-8",
+        )
+        file_handler.setLevel(getattr(logging, level.upper()))
+        file_handler.setFormatter(JSONFormatter())
+        handlers.append(file_handler)
+
+    # Hand records to a background thread for formatting + I/O
+    global _listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger.addHandler(_InProcessQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     
     # Set third-party loggers to WARNING to reduce noise
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -112,6 +198,13 @@ def get_structured_logger(name: str, extra: dict[str, Any] | None = None) -> log
     return logger
 
 
+atexit.register(_stop_listener)
+
+
 # Auto-configure on import if enabled
-if os.environ.get("VYAPAAR_LOG_FORMAT") or os.environ.get("VYAPAAR_LOG_LEVEL"):
+if (
+    os.environ.get("VYAPAAR_LOG_FORMAT")
+    or os.environ.get("VYAPAAR_LOG_LEVEL")
+    or os.environ.get("VYAPAAR_LOG_FILE")
+):
     configure_logging()
@@ -10,7 +10,7 @@ from datetime import datetime
 from enum import StrEnum
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 # ============================================================
 # Enums
@@ -113,11 +113,19 @@ class PayoutEntity(BaseModel):
     fund_account: RazorpayFundAccount | None = None
     created_at: int | None = None
 
+    # (notes object converted, result) so repeat calls skip re-validation
+    _notes_cache: tuple[Any, PayoutNotes] | None = PrivateAttr(default=None)
+
     def get_notes(self) -> PayoutNotes:
         """Get notes as a PayoutNotes model, handling dict input."""
-        if isinstance(self.notes, dict):
-            return PayoutNotes(**self.notes)
-        return self.notes
+        if not isinstance(self.notes, dict):
+            return self.notes
+        cached = self._notes_cache
+        if cached is not None and cached[0] is self.notes:
+            return cached[1]
+        notes = PayoutNotes.model_validate(self.notes)
+        self._notes_cache = (self.notes, notes)
+        return notes
 
 
 class PayoutWrapper(BaseModel):
@@ -173,15 +181,23 @@ class SafeBrowsingResponse(BaseModel):
 
     matches: list[ThreatMatch] = Field(default_factory=list)
 
+    # (matches list deduplicated, result) so repeat reads skip the scan
+    _threat_types_cache: tuple[Any, list[str]] | None = PrivateAttr(default=None)
+
     @property
     def is_safe(self) -> bool:
         """URL is safe if no matches found."""
-        return len(self.matches) == 0
+        return not self.matches
 
     @property
     def threat_types(self) -> list[str]:
-        """Extract unique threat types from matches."""
-        return list({m.threatType for m in self.matches})
+        """Extract unique threat types from matches, in first-seen order."""
+        cached = self._threat_types_cache
+        if cached is not None and cached[0] is self.matches:
+            return cached[1]
+        types = list(dict.fromkeys(m.threatType for m in self.matches))
+        self._threat_types_cache = (self.matches, types)
+        return types
 
 
 # ============================================================
@@ -205,6 +221,36 @@ class AgentPolicy(BaseModel):
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
+    @field_validator("allowed_domains", "blocked_domains")
+    @classmethod
+    def _normalize_domains(cls, domains: list[str]) -> list[str]:
+        """Domains are matched case-insensitively, so store them lower-cased."""
+        return [d.strip().lower() for d in domains]
+
+    # (source list, frozenset) so lookups skip rebuilding the set
+    _allowed_set_cache: tuple[Any, frozenset[str]] | None = PrivateAttr(default=None)
+    _blocked_set_cache: tuple[Any, frozenset[str]] | None = PrivateAttr(default=None)
+
+    @property
+    def allowed_domain_set(self) -> frozenset[str]:
+        """``allowed_domains`` as a set for membership checks."""
+        cached = self._allowed_set_cache
+        if cached is not None and cached[0] is self.allowed_domains:
+            return cached[1]
+        domains = frozenset(self.allowed_domains)
+        self._allowed_set_cache = (self.allowed_domains, domains)
+        return domains
+
+    @property
+    def blocked_domain_set(self) -> frozenset[str]:
+        """``blocked_domains`` as a set for membership checks."""
+        cached = self._blocked_set_cache
+        if cached is not None and cached[0] is self.blocked_domains:
+            return cached[1]
+        domains = frozenset(self.blocked_domains)
+        self._blocked_set_cache = (self.blocked_domains, domains)
+        return domains
+
 
 class GovernanceResult(BaseModel):
     """Result of the governance engine evaluation."""
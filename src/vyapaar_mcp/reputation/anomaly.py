@@ -11,7 +11,7 @@ Key design choices:
   • score_samples() returns raw anomaly scores (lower = more anomalous)
   • Normalised to 0.0–1.0 risk score (1.0 = most anomalous)
   • Redis-backed feature history for incremental learning
-  • Async-safe: sklearn operations run in thread executor
+  • Async-safe: sklearn operations run in a dedicated thread pool
   • Graceful degradation: returns neutral score 0.5 when model is untrained
 """
 
@@ -21,6 +21,7 @@ import asyncio
 import json
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
@@ -115,6 +116,13 @@ class TransactionAnomalyScorer:
         self._IsolationForest: type | None = None
         self._models: dict[str, Any] = {}  # per-agent trained models
 
+        # Own bounded pool so model fits can't starve the loop's default executor
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="anomaly")
+
+    async def close(self) -> None:
+        """Shut down the scoring thread pool."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def _get_isolation_forest(self) -> type:
         """Lazy-load sklearn to avoid import overhead at startup."""
         if self._IsolationForest is None:
@@ -179,7 +187,7 @@ class TransactionAnomalyScorer:
         try:
             loop = asyncio.get_running_loop()
             score_result = await loop.run_in_executor(
-                None,
+                self._executor,
                 self._fit_and_score,
                 agent_id,
                 history_matrix,
@@ -7,6 +7,8 @@ Checks vendor URLs against Google's threat lists:
 - POTENTIALLY_HARMFUL_APPLICATION
 
 Results are cached in Redis (5 min TTL) to avoid redundant API calls.
+Concurrent lookups for the same URL are collapsed: the first caller
+reserves the cache key and the rest wait for its result.
 
 IMPORTANT: On API timeout, we default to HOLD (not APPROVE).
 Per SPEC §14.2: "If in doubt, REJECT."
@@ -14,6 +16,7 @@ Per SPEC §14.2: "If in doubt, REJECT."
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -36,6 +39,12 @@ THREAT_TYPES = [
 CLIENT_ID = "vyapaar-mcp"
 CLIENT_VERSION = "1.0"
 
+# Waiting on another caller's in-flight lookup (exponential backoff).
+# The sleeps between attempts total ~6.35s, past the 5s reservation TTL,
+# so a waiter only stops once the result lands or it can reserve itself.
+INFLIGHT_WAIT_BASE = 0.05
+INFLIGHT_WAIT_ATTEMPTS = 8
+
 
 class SafeBrowsingChecker:
     """Google Safe Browsing v4 Lookup API client."""
@@ -71,9 +80,10 @@ class SafeBrowsingChecker:
         On timeout/error: returns a response indicating UNSAFE
         (fail-closed per SPEC §14.2).
         """
-        # Check cache first
+        # Check cache first (reserving the lookup on a miss)
+        reserved = False
         if self._redis:
-            cached = await self._redis.get_cached_reputation(url)
+            cached, reserved = await self._cached_or_reserve(url)
             if cached is not None:
                 logger.debug("Cache hit for URL: %s", url)
                 return SafeBrowsingResponse(**cached)
@@ -104,13 +114,14 @@ class SafeBrowsingChecker:
             data = response.json()
             result = SafeBrowsingResponse(**data) if data else SafeBrowsingResponse()
 
-            # Cache the result
+            # Cache the result (replaces our in-flight marker)
             if self._redis:
                 await self._redis.cache_reputation(
                     url,
                     result.model_dump(),
                     ttl=300,  # 5 minutes
                 )
+                reserved = False
 
             if result.is_safe:
                 logger.info("URL is SAFE: %s", url)
@@ -182,3 +193,36 @@ class SafeBrowsingChecker:
                     }
                 ]
             )
+
+        finally:
+            # Failed lookups are never cached — free the key for waiters
+            if reserved and self._redis:
+                try:
+                    await self._redis.release_reputation_reservation(url)
+                except Exception as e:
+                    logger.warning("Failed to release reputation reservation: %s", e)
+
+    async def _cached_or_reserve(
+        self, url: str
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Return (cached_result, reserved) for a URL.
+
+        If another caller holds the reservation, polls with exponential
+        backoff for its result. Gives up after INFLIGHT_WAIT_ATTEMPTS and
+        lets the caller query upstream directly.
+        """
+        if self._redis is None:
+            return None, False
+        delay = INFLIGHT_WAIT_BASE
+        for attempt in range(INFLIGHT_WAIT_ATTEMPTS):
+            if attempt:
+                # Sleep only between checks, never after the last one
+                await asyncio.sleep(delay)
+                delay *= 2
+            status, data = await self._redis.get_or_reserve_reputation(url)
+            if status == "hit":
+                return data, False
+            if status == "reserved":
+                return None, True
+        logger.warning("Timed out waiting on in-flight lookup for URL: %s", url)
+        return None, False
@@ -8,6 +8,10 @@ States:
   OPEN     — Circuit is tripped. All calls fail immediately.
   HALF_OPEN — Trial period. One call is allowed through to test recovery.
 
+With ``latency_timeout`` set, a CLOSED breaker also sheds a fraction of
+calls while recent latency runs well above its baseline, so a slow but
+still-answering service is backed off before calls start timing out.
+
 Per CODE_REVIEW §5.3: "Circuit breaker pattern to prevent cascading failures."
 """
 
@@ -15,6 +19,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import time
 from collections.abc import Callable, Coroutine
 from enum import StrEnum
@@ -63,6 +68,7 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 30.0,
         half_open_max_calls: int = 1,
+        latency_timeout: float | None = None,
     ) -> None:
         """Initialize circuit breaker.
 
@@ -71,6 +77,8 @@ class CircuitBreaker:
             failure_threshold: Consecutive failures before OPEN.
             recovery_timeout: Seconds to wait before HALF_OPEN.
             half_open_max_calls: Max concurrent calls in HALF_OPEN state.
+            latency_timeout: Call timeout of the wrapped service, in
+                seconds. Enables latency-based load shedding when set.
         """
         self._name = name
         self._failure_threshold = failure_threshold
@@ -84,6 +92,12 @@ class CircuitBreaker:
         self._half_open_calls: int = 0
         self._lock = asyncio.Lock()
 
+        # Latency EMAs (seconds): baseline follows the fast calls,
+        # current tracks recent calls
+        self._latency_timeout = latency_timeout
+        self._latency_baseline: float | None = None
+        self._latency_current: float = 0.0
+
     @property
     def state(self) -> CircuitState:
         """Current circuit state (may auto-transition to HALF_OPEN)."""
@@ -98,6 +112,38 @@ class CircuitBreaker:
         """Number of consecutive failures."""
         return self._failure_count
 
+    @property
+    def latency_ratio(self) -> float:
+        """Fraction of calls (0-0.3) to shed because of elevated latency.
+
+        Zero until current latency exceeds 3x the baseline, then grows
+        linearly as it approaches the call timeout.
+        """
+        if self._latency_timeout is None or self._latency_baseline is None:
+            return 0.0
+        slow = self._latency_baseline * 3
+        if self._latency_current <= slow:
+            return 0.0
+        span = self._latency_timeout * 0.95 - slow
+        if span <= 0:
+            return 0.3
+        return min(1.0, (self._latency_current - slow) / span) * 0.3
+
+    def _record_latency(self, latency: float) -> None:
+        """Update the latency EMAs with one observed call duration."""
+        baseline = self._latency_baseline
+        if baseline is None:
+            self._latency_baseline = latency
+            self._latency_current = latency
+            return
+        if latency < baseline:
+            # Fast decay towards quicker calls
+            self._latency_baseline = (baseline + latency) / 2
+        else:
+            # Slow rise, so a degrading service doesn't become the new normal
+            self._latency_baseline = (baseline * 100 + latency) / 101
+        self._latency_current = (latency + 3 * self._latency_current) / 4
+
     async def call(
         self,
         func: Callable[..., Coroutine[Any, Any, T]],
@@ -118,6 +164,24 @@ class CircuitBreaker:
             CircuitOpenError: If the circuit is OPEN.
             Exception: Any exception from the wrapped function.
         """
+        await self.admit()
+
+        # Execute the function outside the lock
+        started = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e, time.monotonic() - started)
+            raise
+        self.record_success(time.monotonic() - started)
+        return result
+
+    async def admit(self) -> None:
+        """Let one call through, or raise CircuitOpenError.
+
+        The gate half of call(), for callers that time and report the
+        work themselves.
+        """
         async with self._lock:
             current_state = self.state
 
@@ -135,51 +199,65 @@ class CircuitBreaker:
 
             if current_state == CircuitState.HALF_OPEN:
                 self._half_open_calls += 1
+            elif random.random() < self.latency_ratio:
+                raise CircuitOpenError(self._name, 0.0)
+
+    # ----------------------------------------------------------------
+    # Synchronous fast path
+    #
+    # Callers may skip call() while the breaker is closed: check
+    # is_closed(), await the work directly and report the outcome with
+    # record_success()/record_failure(). These never await, so they
+    # need no lock on a single event loop.
+    # ----------------------------------------------------------------
+
+    def is_closed(self) -> bool:
+        """True when calls may bypass call(): CLOSED and not shedding load."""
+        return self._state == CircuitState.CLOSED and self.latency_ratio == 0.0
+
+    def record_latency(self, latency: float) -> None:
+        """Feed one request duration, in seconds, to the latency EMAs."""
+        if self._latency_timeout is not None:
+            self._record_latency(latency)
+
+    def record_success(self, latency: float | None = None) -> None:
+        """Record a successful call (and its duration, in seconds)."""
+        if latency is not None:
+            self.record_latency(latency)
+
+        prev_state = self._state
+        self._failure_count = 0
+        self._success_count += 1
+        self._half_open_calls = 0
 
-        # Execute the function outside the lock
-        try:
-            result = await func(*args, **kwargs)
-            await self._on_success()
-            return result
-        except Exception as e:
-            await self._on_failure(e)
-            raise
+        if self._state in (CircuitState.HALF_OPEN, CircuitState.OPEN):
+            self._state = CircuitState.CLOSED
+            logger.info(
+                "Circuit '%s' CLOSED (recovered from %s)",
+                self._name,
+                prev_state,
+            )
+
+    def record_failure(self, error: Exception, latency: float | None = None) -> None:
+        """Record a failed call (and its duration, in seconds)."""
+        if latency is not None:
+            self.record_latency(latency)
+
+        self._failure_count += 1
+        self._last_failure_time = time.monotonic()
+        self._success_count = 0
 
-    async def _on_success(self) -> None:
-        """Record a successful call."""
-        async with self._lock:
-            prev_state = self._state
-            self._failure_count = 0
-            self._success_count += 1
+        if self._failure_count >= self._failure_threshold:
+            self._state = CircuitState.OPEN
             self._half_open_calls = 0
-
-            if self._state in (CircuitState.HALF_OPEN, CircuitState.OPEN):
-                self._state = CircuitState.CLOSED
-                logger.info(
-                    "Circuit '%s' CLOSED (recovered from %s)",
-                    self._name,
-                    prev_state,
-                )
-
-    async def _on_failure(self, error: Exception) -> None:
-        """Record a failed call."""
-        async with self._lock:
-            self._failure_count += 1
-            self._last_failure_time = time.monotonic()
-            self._success_count = 0
-
-            if self._failure_count >= self._failure_threshold:
-                prev_state = self._state
-                self._state = CircuitState.OPEN
-                self._half_open_calls = 0
-                logger.warning(
-                    "Circuit '%s' OPEN after %d failures "
-                    "(recovery in %.0fs) — last error: %s",
-                    self._name,
-                    self._failure_count,
-                    self._recovery_timeout,
-                    error,
-                )
+            logger.warning(
+                "Circuit '%s' OPEN after %d failures "
+                "(recovery in %.0fs) — last error: %s",
+                self._name,
+                self._failure_count,
+                self._recovery_timeout,
+                error,
+            )
 
     def reset(self) -> None:
         """Manually reset the circuit to CLOSED."""
@@ -187,6 +265,8 @@ class CircuitBreaker:
         self._failure_count = 0
         self._success_count = 0
         self._half_open_calls = 0
+        self._latency_baseline = None
+        self._latency_current = 0.0
         logger.info("Circuit '%s' manually RESET to CLOSED", self._name)
 
     def snapshot(self) -> dict[str, Any]:
@@ -197,4 +277,5 @@ class CircuitBreaker:
             "failure_count": self._failure_count,
             "failure_threshold": self._failure_threshold,
             "recovery_timeout_s": self._recovery_timeout,
+            "latency_shed_ratio": round(self.latency_ratio, 3),
         }
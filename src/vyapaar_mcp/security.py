@@ -13,7 +13,7 @@ from typing import Any
 # Common patterns for sensitive data that should be masked
 SECRET_PATTERNS = [
     # API keys, tokens, secrets
-    (r"(api[_-]?key|secret[_-]?key|auth[_-]?token|access[_-]?token)"
+    (r"((api[_-]?key|secret[_-]?key|auth[_-]?token|access[_-]?token)"
      r"[=:]\s*[\"']?)([a-zA-Z0-9_\-]{8,})", r"\1****"),
     # Razorpay keys
     (r"(rzp_)[a-zA-Z0-9]{14}", r"\1****"),
@@ -15,6 +15,7 @@ import time
 from contextlib import asynccontextmanager
 from typing import Any
 
+import httpx
 from mcp.server.fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
@@ -23,19 +24,23 @@ from vyapaar_mcp.audit.logger import log_decision
 from vyapaar_mcp.config import VyapaarConfig, load_config
 from vyapaar_mcp.db.postgres import PostgresClient
 from vyapaar_mcp.db.redis_client import RedisClient
+from vyapaar_mcp.egress.http_clients import create_llm_client, create_slack_client
 from vyapaar_mcp.egress.ntfy_notifier import NtfyNotifier, notify_with_fallback
+from vyapaar_mcp.egress.ntfy_notifier import aclose_all as aclose_ntfy_clients
 from vyapaar_mcp.egress.razorpay_actions import RazorpayActions
 from vyapaar_mcp.egress.slack_notifier import SlackNotifier
 from vyapaar_mcp.governance.engine import GovernanceEngine
-from vyapaar_mcp.reputation.anomaly import TransactionAnomalyScorer
-from vyapaar_mcp.reputation.gleif import GLEIFChecker
 from vyapaar_mcp.ingress.polling import PayoutPoller
 from vyapaar_mcp.ingress.razorpay_bridge import RazorpayBridge
 from vyapaar_mcp.ingress.webhook import (
+    WebhookValidationError,
     extract_webhook_id,
     parse_webhook_event,
+    validate_webhook_payload,
     verify_razorpay_signature,
 )
+from vyapaar_mcp.llm import AzureOpenAIClient, SecurityLLMClient
+from vyapaar_mcp.llm.security_validator import ToolCallValidator
 from vyapaar_mcp.models import (
     AgentPolicy,
     BudgetStatus,
@@ -43,9 +48,9 @@ from vyapaar_mcp.models import (
     HealthStatus,
     ReasonCode,
 )
-from vyapaar_mcp.llm import AzureOpenAIClient, SecurityLLMClient
-from vyapaar_mcp.llm.security_validator import ToolCallValidator
 from vyapaar_mcp.observability import metrics
+from vyapaar_mcp.reputation.anomaly import TransactionAnomalyScorer
+from vyapaar_mcp.reputation.gleif import GLEIFChecker
 from vyapaar_mcp.reputation.safe_browsing import SafeBrowsingChecker
 from vyapaar_mcp.resilience import CircuitBreaker, CircuitOpenError
 
@@ -71,6 +76,7 @@ _safe_browsing: SafeBrowsingChecker | None = None
 _razorpay: RazorpayActions | None = None
 _razorpay_bridge: RazorpayBridge | None = None
 _slack: SlackNotifier | None = None
+_slack_http: httpx.AsyncClient | None = None
 _poller: PayoutPoller | None = None
 _governance: GovernanceEngine | None = None
 _poll_task: asyncio.Task[None] | None = None
@@ -81,6 +87,7 @@ _cb_gleif: CircuitBreaker | None = None
 _gleif: GLEIFChecker | None = None
 _anomaly_scorer: TransactionAnomalyScorer | None = None
 _ntfy: NtfyNotifier | None = None
+_llm_http: httpx.AsyncClient | None = None
 _azure_llm: AzureOpenAIClient | None = None
 _security_llm: SecurityLLMClient | None = None
 _tool_validator: ToolCallValidator | None = None
@@ -143,11 +150,11 @@ async def health_endpoint(request: Request) -> JSONResponse:
 async def _startup() -> None:
     """Initialize all services on server start."""
     global _config, _redis, _postgres, _safe_browsing, \
-        _razorpay, _razorpay_bridge, _slack, _poller, \
+        _razorpay, _razorpay_bridge, _slack, _slack_http, _poller, \
         _governance, _poll_task, _start_time, \
         _cb_razorpay, _cb_safe_browsing, _cb_gleif, \
         _gleif, _anomaly_scorer, _ntfy, \
-        _azure_llm, _security_llm, _tool_validator
+        _llm_http, _azure_llm, _security_llm, _tool_validator
 
     _start_time = time.time()
     _config = load_config()
@@ -169,6 +176,7 @@ async def _startup() -> None:
     try:
         await _postgres.connect()
         await _postgres.run_migrations()
+        await _postgres.warm_up()
         logger.info("✅ PostgreSQL connected + migrations complete")
     except Exception as e:
         logger.error("❌ PostgreSQL connection failed: %s", e)
@@ -192,6 +200,7 @@ async def _startup() -> None:
         "razorpay",
         failure_threshold=_config.circuit_breaker_failure_threshold,
         recovery_timeout=float(_config.circuit_breaker_recovery_timeout),
+        latency_timeout=10.0,  # matches the RazorpayActions HTTP timeout
     )
     _razorpay = RazorpayActions(
         key_id=_config.razorpay_key_id,
@@ -204,6 +213,7 @@ async def _startup() -> None:
     _razorpay_bridge = RazorpayBridge(
         key_id=_config.razorpay_key_id,
         key_secret=_config.razorpay_key_secret,
+        max_inflight=_config.razorpay_max_inflight,
     )
     logger.info(
         "✅ RazorpayBridge initialized "
@@ -212,9 +222,12 @@ async def _startup() -> None:
 
     # Slack Notifier (human-in-the-loop)
     if _config.slack_bot_token and _config.slack_channel_id:
+        _slack_http = create_slack_client()
         _slack = SlackNotifier(
             bot_token=_config.slack_bot_token,
             channel_id=_config.slack_channel_id,
+            http=_slack_http,
+            batch=True,
         )
         logger.info("✅ Slack notifier initialized (channel=%s)", _config.slack_channel_id)
     else:
@@ -251,6 +264,7 @@ async def _startup() -> None:
         rate_limit_max=_config.rate_limit_max_requests,
         rate_limit_window=_config.rate_limit_window_seconds,
     )
+    _governance.start_policy_listener()
     logger.info(
         "✅ Governance engine ready "
         "(rate limit: %d req / %ds window)",
@@ -288,6 +302,7 @@ async def _startup() -> None:
             topic=_config.ntfy_topic,
             server_url=_config.ntfy_url,
             auth_token=_config.ntfy_auth_token or None,
+            batch=True,
         )
         logger.info(
             "✅ ntfy notifier initialized (topic=%s, server=%s)",
@@ -299,8 +314,11 @@ async def _startup() -> None:
             "ℹ️  ntfy not configured — set VYAPAAR_NTFY_TOPIC to enable push fallback"
         )
 
+    # One connection pool for both LLM clients (Azure + security LLM)
+    _llm_http = create_llm_client()
+
     # Azure OpenAI Client (Microsoft AI Foundry)
-    _azure_llm = AzureOpenAIClient(_config)
+    _azure_llm = AzureOpenAIClient(_config, http=_llm_http)
     try:
         await _azure_llm.initialize()
         if _azure_llm.is_configured:
@@ -318,7 +336,7 @@ async def _startup() -> None:
         logger.warning("⚠️  Azure OpenAI initialization skipped: %s", e)
 
     # Security LLM / Dual LLM Quarantine Pattern
-    _tool_validator = ToolCallValidator(_config)
+    _tool_validator = ToolCallValidator(_config, http=_llm_http)
     try:
         await _tool_validator.initialize()
         if _tool_validator.is_configured:
@@ -398,18 +416,31 @@ async def _shutdown() -> None:
         _poll_task.cancel()
     if _poller:
         _poller.stop()
+    if _razorpay:
+        await _razorpay.close()
+    if _razorpay_bridge:
+        await _razorpay_bridge.aclose()
     if _slack:
         await _slack.close()
+    if _slack_http:
+        await _slack_http.aclose()
     if _ntfy:
         await _ntfy.close()
+    await aclose_ntfy_clients()
     if _gleif:
         await _gleif.close()
+    if _anomaly_scorer:
+        await _anomaly_scorer.close()
+    if _governance:
+        await _governance.close()
     if _safe_browsing:
         await _safe_browsing.close()
     if _azure_llm:
         await _azure_llm.close()
     if _tool_validator:
         await _tool_validator.close()
+    if _llm_http:
+        await _llm_http.aclose()
     if _redis:
         await _redis.disconnect()
     if _postgres:
@@ -442,7 +473,16 @@ async def handle_razorpay_webhook(
     """
     _require(config=_config, redis=_redis, postgres=_postgres, governance=_governance, razorpay=_razorpay)
 
-    payload_bytes = payload.encode("utf-8")
+    # Encode once; validation, HMAC and parsing all share these bytes
+    try:
+        payload_bytes = validate_webhook_payload(payload.encode("utf-8"))
+    except WebhookValidationError as e:
+        logger.warning("REJECTED: %s", e)
+        return {
+            "decision": Decision.REJECTED.value,
+            "reason": e.code,
+            "detail": str(e),
+        }
 
     # --- Step 1: Verify Signature ---
     if not verify_razorpay_signature(payload_bytes, signature, _config.razorpay_webhook_secret):
@@ -550,6 +590,8 @@ async def poll_razorpay_payouts(
         Summary of payouts found and governance decisions made.
     """
     _require(config=_config, redis=_redis, razorpay_bridge=_razorpay_bridge, governance=_governance, razorpay=_razorpay, postgres=_postgres)
+    bridge = _razorpay_bridge
+    assert bridge is not None  # checked by _require
 
     acct = account_number or _config.razorpay_account_number
     if not acct:
@@ -563,7 +605,7 @@ async def poll_razorpay_payouts(
 
     # Create a one-shot poller
     poller = PayoutPoller(
-        bridge=_razorpay_bridge,
+        bridge=bridge,
         account_number=acct,
         redis=_redis,
         poll_interval=_config.poll_interval,
@@ -578,6 +620,7 @@ async def poll_razorpay_payouts(
             "message": "No new queued payouts found",
             "payouts_found": 0,
             "poller_stats": poller.stats,
+            "bridge_stats": bridge.stats,
         }
 
     # Process each payout through governance
@@ -641,6 +684,7 @@ async def poll_razorpay_payouts(
         "payouts_found": len(new_payouts),
         "decisions": results,
         "poller_stats": poller.stats,
+        "bridge_stats": bridge.stats,
     }
 
 
@@ -760,6 +804,13 @@ async def set_agent_policy(
     )
 
     saved = await _postgres.upsert_agent_policy(policy)
+    if _governance:
+        _governance.invalidate_policy(agent_id)
+    if _redis:
+        try:
+            await _redis.publish_policy_invalidation(agent_id)
+        except Exception as e:
+            logger.warning("Policy invalidation publish failed: %s", e)
     return {"status": "ok", "policy": saved.model_dump(mode="json")}
 
 
@@ -1047,8 +1098,6 @@ async def validate_tool_call_security(
         "requires_approval_above": str(policy.require_approval_above) if policy else None,
     }
     
-    from vyapaar_mcp.llm.security_validator import ToolCallRequest
-    
     result = await _tool_validator.validate(
         tool_name=tool_name,
         parameters=parameters,
@@ -1171,6 +1220,30 @@ async def run_server() -> None:
     await mcp.run_stdio_async()
 
 
+def _install_uvloop(choice: str = "auto") -> bool:
+    """Use uvloop for the event loop when it is installed (not on Windows).
+
+    ``choice`` comes from VYAPAAR_EVENT_LOOP: ``auto`` (default) uses
+    uvloop if available, ``uvloop`` warns when it is missing, and
+    ``asyncio`` keeps the stock loop. The result is also passed to
+    uvicorn so the SSE transport follows the same setting.
+    """
+    import sys
+
+    if choice == "asyncio" or sys.platform == "win32":
+        return False
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        if choice == "uvloop":
+            logger.warning("VYAPAAR_EVENT_LOOP=uvloop but uvloop is not installed")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
+
+
 def run_server_sync() -> None:
     """Synchronous entrypoint with custom SSE path handling."""
     import os
@@ -1179,6 +1252,7 @@ def run_server_sync() -> None:
     from starlette.routing import Mount, Route
     from mcp.server.sse import SseServerTransport
 
+    use_uvloop = _install_uvloop(os.environ.get("VYAPAAR_EVENT_LOOP", "auto").lower())
     transport_name = os.environ.get("VYAPAAR_TRANSPORT", "stdio")
     
     if transport_name == "sse":
@@ -1215,7 +1289,12 @@ def run_server_sync() -> None:
         # Add custom routes from mcp
         starlette_app.routes.extend(mcp._custom_starlette_routes)
         
-        uvicorn.run(starlette_app, host=host, port=port)
+        uvicorn.run(
+            starlette_app,
+            host=host,
+            port=port,
+            loop="uvloop" if use_uvloop else "asyncio",
+        )
     else:
         mcp.run(transport=transport_name)
 
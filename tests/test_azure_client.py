@@ -0,0 +1,90 @@
+"""Tests for the Azure OpenAI client (backpressure and error mapping)."""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import sys
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+from openai import APIStatusError, NotFoundError, RateLimitError
+
+from vyapaar_mcp.config import VyapaarConfig
+from vyapaar_mcp.llm.azure_client import AzureOpenAIClient
+
+
+@pytest.mark.asyncio
+class TestInflightLimit:
+    async def test_concurrent_requests_are_bounded(self, config: VyapaarConfig) -> None:
+        config.azure_max_inflight = 2
+        gate = asyncio.Event()
+        active = peak = 0
+
+        async def create(**_: Any) -> Any:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await gate.wait()
+            active -= 1
+            message = SimpleNamespace(content="ok")
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        client = AzureOpenAIClient(config)
+        client._client = SimpleNamespace(  # type: ignore[assignment]
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+
+        calls = [
+            asyncio.create_task(client.chat_completion([{"role": "user", "content": "hi"}]))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*calls)
+
+        assert peak == 2
+        assert results == [("ok", "success")] * 5
+
+
+def make_status_error(
+    cls: type[APIStatusError], status: int, body: dict[str, Any]
+) -> APIStatusError:
+    request = httpx.Request("POST", "https://example.openai.azure.com/openai/deployments/x")
+    response = httpx.Response(status, request=request)
+    return cls(body.get("message", "error"), response=response, body=body)
+
+
+@pytest.mark.asyncio
+class TestErrorMapping:
+    async def call_raising(self, config: VyapaarConfig, error: Exception) -> tuple[str | None, str]:
+        async def create(**_: Any) -> Any:
+            raise error
+
+        client = AzureOpenAIClient(config)
+        client._client = SimpleNamespace(  # type: ignore[assignment]
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        return await client.chat_completion([{"role": "user", "content": "hi"}])
+
+    async def test_deployment_not_found(self, config: VyapaarConfig) -> None:
+        error = make_status_error(NotFoundError, 404, {"code": "DeploymentNotFound"})
+        text, status = await self.call_raising(config, error)
+        assert text is None and "deployment" in status and "not found" in status
+
+    async def test_other_404(self, config: VyapaarConfig) -> None:
+        _text, status = await self.call_raising(config, make_status_error(NotFoundError, 404, {}))
+        assert status.startswith("Azure endpoint error (404)")
+
+    async def test_api_error_uses_message(self, config: VyapaarConfig) -> None:
+        error = make_status_error(RateLimitError, 429, {"message": "slow down"})
+        assert await self.call_raising(config, error) == (None, "Azure API error: slow down")
+
+
+def test_llm_package_import_does_not_load_openai() -> None:
+    """The SDK is only imported once a client is initialized."""
+    code = "import sys, vyapaar_mcp.llm; print('openai' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
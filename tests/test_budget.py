@@ -113,6 +113,72 @@ class TestIdempotency:
         result = await fake_redis.check_idempotency("webhook-B")
         assert result is True
 
+    async def test_replay_detected_across_hours(
+        self, fake_redis: RedisClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A replay in a later hour bucket is still caught within 48h."""
+        from vyapaar_mcp.db import redis_client as redis_mod
+
+        start = 1_700_000_000.0
+        monkeypatch.setattr(redis_mod.time, "time", lambda: start)
+        assert await fake_redis.check_idempotency("webhook-C") is True
+
+        monkeypatch.setattr(redis_mod.time, "time", lambda: start + 47 * 3600)
+        assert await fake_redis.check_idempotency("webhook-C") is False
+
+    async def test_bucket_gets_ttl(self, fake_redis: RedisClient) -> None:
+        """Bucket hashes expire so old ids are eventually dropped."""
+        await fake_redis.check_idempotency("webhook-D")
+        key = fake_redis._idempotency_keys("webhook-D")[0]
+        assert await fake_redis.client.hexists(key, "webhook-D")
+        assert 0 < await fake_redis.client.ttl(key) <= 2 * 172800 + 3600
+
+    async def test_replay_caught_across_window_boundary(
+        self, fake_redis: RedisClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An id seen just before a window rolls over is still found after it."""
+        from vyapaar_mcp.db import redis_client as redis_mod
+
+        end_of_window = 172_800 * 9_000 - 1.0
+        monkeypatch.setattr(redis_mod.time, "time", lambda: end_of_window)
+        assert await fake_redis.check_idempotency("webhook-J") is True
+
+        monkeypatch.setattr(redis_mod.time, "time", lambda: end_of_window + 47 * 3600)
+        assert await fake_redis.check_idempotency("webhook-J") is False
+
+    async def test_keys_share_a_cluster_slot(self, fake_redis: RedisClient) -> None:
+        """Both window keys carry the same hash tag and only two are read."""
+        current, previous = fake_redis._idempotency_keys("webhook-K")
+        tag = current[current.index("{"):current.index("}") + 1]
+        assert tag != "{}" and previous.count(tag) == 1
+
+    async def test_legacy_key_still_honoured(self, fake_redis: RedisClient) -> None:
+        """Ids recorded under the old per-id SET NX layout are not replayed."""
+        await fake_redis.client.set("vyapaar:idempotent:webhook-L", "processed", ex=172800)
+        assert await fake_redis.check_idempotency("webhook-L") is False
+        assert await fake_redis.check_idempotency_batch(["webhook-L", "webhook-M"]) == [
+            False,
+            True,
+        ]
+
+    async def test_batch_matches_single_checks(self, fake_redis: RedisClient) -> None:
+        """The pipelined batch flags new ids, replays and in-batch repeats."""
+        await fake_redis.check_idempotency("webhook-E")
+        flags = await fake_redis.check_idempotency_batch(
+            ["webhook-E", "webhook-F", "webhook-F", "webhook-G"]
+        )
+        assert flags == [False, True, False, True]
+        assert await fake_redis.check_idempotency("webhook-G") is False
+        assert await fake_redis.check_idempotency_batch([]) == []
+
+    async def test_survives_script_flush(self, fake_redis: RedisClient) -> None:
+        """EVALSHA misses after SCRIPT FLUSH fall back to EVAL once."""
+        await fake_redis.client.script_flush()
+        assert await fake_redis.check_idempotency_batch(["webhook-H", "webhook-I"]) == [True, True]
+        await fake_redis.client.script_flush()
+        assert await fake_redis.check_idempotency("webhook-H") is False
+        assert await fake_redis.check_budget_atomic("agent-flush", 100, 1_000) is True
+
 
 @pytest.mark.asyncio
 class TestReputationCache:
@@ -130,3 +196,115 @@ class TestReputationCache:
 
         result = await fake_redis.get_cached_reputation("https://safe.com")
         assert result == data
+
+    async def test_miss_reserves_then_waits(self, fake_redis: RedisClient) -> None:
+        """First miss reserves the lookup; concurrent callers are told to wait."""
+        status, data = await fake_redis.get_or_reserve_reputation("https://new.com")
+        assert (status, data) == ("reserved", None)
+
+        status, data = await fake_redis.get_or_reserve_reputation("https://new.com")
+        assert (status, data) == ("wait", None)
+        # The in-flight marker is never surfaced as cached data
+        assert await fake_redis.get_cached_reputation("https://new.com") is None
+
+    async def test_cache_fill_replaces_reservation(self, fake_redis: RedisClient) -> None:
+        """Writing the result after a reservation turns waiters into hits."""
+        data = {"matches": []}
+        await fake_redis.get_or_reserve_reputation("https://fill.com")
+        await fake_redis.cache_reputation("https://fill.com", data, ttl=300)
+
+        status, cached = await fake_redis.get_or_reserve_reputation("https://fill.com")
+        assert status == "hit"
+        assert cached == data
+
+    async def test_release_only_drops_inflight_marker(self, fake_redis: RedisClient) -> None:
+        """Releasing a reservation must not delete a real cached result."""
+        await fake_redis.get_or_reserve_reputation("https://fail.com")
+        await fake_redis.release_reputation_reservation("https://fail.com")
+        status, _ = await fake_redis.get_or_reserve_reputation("https://fail.com")
+        assert status == "reserved"
+
+        await fake_redis.cache_reputation("https://fail.com", {"matches": []})
+        await fake_redis.release_reputation_reservation("https://fail.com")
+        assert await fake_redis.get_cached_reputation("https://fail.com") == {"matches": []}
+
+
+@pytest.mark.asyncio
+class TestScriptWarmup:
+    """Test Lua script preloading at connect time."""
+
+    async def test_warm_scripts_loads_all(self, fake_redis: RedisClient) -> None:
+        """Every hot-path script should be cached server-side after warm-up."""
+        import hashlib
+
+        await fake_redis.warm_scripts()
+        shas = [
+            hashlib.sha1(lua.encode()).hexdigest()
+            for lua in (
+                fake_redis._BUDGET_LUA,
+                fake_redis._RATE_LIMIT_LUA,
+                fake_redis._IDEMPOTENCY_LUA,
+                fake_redis._RELEASE_INFLIGHT_LUA,
+            )
+        ]
+        assert await fake_redis.client.script_exists(*shas) == [True] * 4
+
+
+@pytest.mark.asyncio
+class TestReputationMemcache:
+    """Test the in-process LRU in front of the Redis reputation cache."""
+
+    async def test_hit_served_locally(self, fake_redis: RedisClient) -> None:
+        """A second read should not need Redis once the LRU is populated."""
+        data = {"matches": []}
+        await fake_redis.cache_reputation("https://local.com", data)
+        assert await fake_redis.get_cached_reputation("https://local.com") == data
+
+        await fake_redis.client.flushall()
+        assert await fake_redis.get_cached_reputation("https://local.com") == data
+
+    async def test_write_through_local(self, fake_redis: RedisClient) -> None:
+        """The writer's own next lookup is served without Redis."""
+        data = {"matches": []}
+        await fake_redis.cache_reputation("https://fresh.com", data)
+        await fake_redis.client.flushall()
+
+        status, cached = await fake_redis.get_or_reserve_reputation("https://fresh.com")
+        assert status == "hit"
+        assert cached == data
+
+    async def test_write_invalidates_local(self, fake_redis: RedisClient) -> None:
+        """cache_reputation should replace a stale local entry."""
+        await fake_redis.cache_reputation("https://flip.com", {"matches": []})
+        await fake_redis.get_cached_reputation("https://flip.com")
+
+        flagged = {"matches": [{"threatType": "MALWARE"}]}
+        await fake_redis.cache_reputation("https://flip.com", flagged)
+        assert await fake_redis.get_cached_reputation("https://flip.com") == flagged
+
+    async def test_local_entry_expires(
+        self, fake_redis: RedisClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Entries older than the local TTL fall through to Redis."""
+        import vyapaar_mcp.db.redis_client as redis_mod
+
+        await fake_redis.cache_reputation("https://old.com", {"matches": []})
+        await fake_redis.get_cached_reputation("https://old.com")
+        await fake_redis.client.flushall()
+
+        later = redis_mod.time.monotonic() + redis_mod.REPUTATION_MEMCACHE_TTL + 1
+        monkeypatch.setattr(redis_mod.time, "monotonic", lambda: later)
+        assert await fake_redis.get_cached_reputation("https://old.com") is None
+
+    async def test_local_entry_honours_shorter_ttl(
+        self, fake_redis: RedisClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A short cache_reputation TTL also bounds the local copy."""
+        import vyapaar_mcp.db.redis_client as redis_mod
+
+        await fake_redis.cache_reputation("https://brief.com", {"matches": []}, ttl=5)
+        await fake_redis.client.flushall()
+
+        later = redis_mod.time.monotonic() + 6
+        monkeypatch.setattr(redis_mod.time, "monotonic", lambda: later)
+        assert await fake_redis.get_cached_reputation("https://brief.com") is None
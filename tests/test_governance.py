@@ -5,6 +5,10 @@ Tests every row of SPEC §8 Decision Matrix.
 
 from __future__ import annotations
 
+import asyncio
+import gc
+import logging
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,6 +16,7 @@ import pytest
 from vyapaar_mcp.db.redis_client import RedisClient
 from vyapaar_mcp.governance.engine import GovernanceEngine
 from vyapaar_mcp.models import (
+    AgentPolicy,
     Decision,
     PayoutEntity,
     ReasonCode,
@@ -75,6 +80,75 @@ class TestGovernanceEngine:
         assert result.decision == Decision.REJECTED
         assert result.reason_code == ReasonCode.NO_POLICY
 
+    async def test_early_reject_cancels_reputation_lookup(
+        self, fake_redis: RedisClient
+    ) -> None:
+        """The speculative Safe Browsing call is cancelled on early reject."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_check(url: str) -> SafeBrowsingResponse:
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return SafeBrowsingResponse()
+
+        safe_browsing = MagicMock()
+        safe_browsing.check_url = slow_check
+        mock_pg = MagicMock()
+
+        async def no_policy(agent_id: str) -> None:
+            await started.wait()
+            return None
+
+        mock_pg.get_agent_policy = no_policy
+
+        engine = GovernanceEngine(fake_redis, mock_pg, safe_browsing)
+        result = await engine.evaluate(
+            make_payout(), "unknown-agent", vendor_url="https://vendor.com"
+        )
+
+        assert result.reason_code == ReasonCode.NO_POLICY
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+    async def test_early_reject_retrieves_failed_lookup(
+        self, fake_redis: RedisClient
+    ) -> None:
+        """A reputation lookup that already failed isn't left unretrieved."""
+        failed = asyncio.Event()
+
+        async def failing_check(url: str) -> SafeBrowsingResponse:
+            failed.set()
+            raise ConnectionError("redis down")
+
+        safe_browsing = MagicMock()
+        safe_browsing.check_url = failing_check
+        mock_pg = MagicMock()
+
+        async def no_policy(agent_id: str) -> None:
+            await failed.wait()
+            await asyncio.sleep(0)
+            return None
+
+        mock_pg.get_agent_policy = no_policy
+        unretrieved: list[dict[str, object]] = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _loop, context: unretrieved.append(context))
+        try:
+            engine = GovernanceEngine(fake_redis, mock_pg, safe_browsing)
+            result = await engine.evaluate(
+                make_payout(), "unknown-agent", vendor_url="https://vendor.com"
+            )
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+
+        assert result.reason_code == ReasonCode.NO_POLICY
+        assert unretrieved == []
+
     async def test_per_txn_limit_exceeded(
         self, fake_redis: RedisClient, mock_postgres: MagicMock, safe_browsing_safe: MagicMock
     ) -> None:
@@ -116,6 +190,22 @@ class TestGovernanceEngine:
         assert result.decision == Decision.REJECTED
         assert result.reason_code == ReasonCode.DOMAIN_BLOCKED
 
+    async def test_domain_blocked_case_insensitive(
+        self, fake_redis: RedisClient, mock_postgres: MagicMock, safe_browsing_safe: MagicMock
+    ) -> None:
+        """Blocklist matching ignores case in both the policy and the URL."""
+        mock_postgres.get_agent_policy.return_value = AgentPolicy(
+            agent_id="test-agent-001",
+            blocked_domains=["Evil.COM"],
+        )
+        engine = GovernanceEngine(fake_redis, mock_postgres, safe_browsing_safe)
+        result = await engine.evaluate(
+            make_payout(amount=10000), "test-agent-001",
+            vendor_url="https://EVIL.com/pay",
+        )
+
+        assert result.reason_code == ReasonCode.DOMAIN_BLOCKED
+
     async def test_safe_browsing_unsafe_rejects(
         self, fake_redis: RedisClient, mock_postgres: MagicMock, safe_browsing_unsafe: MagicMock
     ) -> None:
@@ -168,3 +258,148 @@ class TestGovernanceEngine:
 
         assert result.processing_ms is not None
         assert result.processing_ms >= 0
+
+
+class TestExtractDomain:
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            ("https://vendor.com/pay?x=1", "vendor.com"),
+            ("https://vendor.com", "vendor.com"),
+            ("https://vendor.com?next=/a", "vendor.com"),
+            ("http://user:pw@vendor.com:8443/a", "vendor.com"),
+            ("https://[2001:db8::1]:443/a", "[2001:db8::1]"),
+            ("https://[2001:db8::1]/a", "[2001:db8::1]"),
+            ("vendor.com/pay", "vendor.com"),
+            ("vendor.com/go?u=https://evil.com", "vendor.com"),
+            ("//vendor.com/pay", "vendor.com"),
+            ("", None),
+            ("https:///path", None),
+        ],
+    )
+    def test_extract_domain(self, url: str, expected: str | None) -> None:
+        assert GovernanceEngine._extract_domain(url) == expected
+
+
+@pytest.mark.asyncio
+class TestPolicyCache:
+    """Agent policies are cached in-process and evicted on update."""
+
+    async def test_repeat_evaluations_hit_cache(
+        self, fake_redis: RedisClient, mock_postgres: MagicMock, safe_browsing_safe: MagicMock
+    ) -> None:
+        engine = GovernanceEngine(fake_redis, mock_postgres, safe_browsing_safe)
+        for i in range(3):
+            await engine.evaluate(make_payout(payout_id=f"pout_pc_{i}"), "test-agent-001")
+
+        assert mock_postgres.get_agent_policy.await_count == 1
+
+    async def test_invalidate_refetches(
+        self, fake_redis: RedisClient, mock_postgres: MagicMock, safe_browsing_safe: MagicMock
+    ) -> None:
+        engine = GovernanceEngine(fake_redis, mock_postgres, safe_browsing_safe)
+        await engine.evaluate(make_payout(payout_id="pout_pc_a"), "test-agent-001")
+
+        mock_postgres.get_agent_policy.return_value = AgentPolicy(
+            agent_id="test-agent-001", per_txn_limit=100,
+        )
+        engine.invalidate_policy("test-agent-001")
+        result = await engine.evaluate(make_payout(payout_id="pout_pc_b"), "test-agent-001")
+
+        assert result.reason_code == ReasonCode.TXN_LIMIT_EXCEEDED
+        assert mock_postgres.get_agent_policy.await_count == 2
+
+    async def test_missing_policy_not_cached(
+        self, fake_redis: RedisClient, safe_browsing_safe: MagicMock
+    ) -> None:
+        mock_pg = MagicMock()
+        mock_pg.get_agent_policy = AsyncMock(return_value=None)
+        engine = GovernanceEngine(fake_redis, mock_pg, safe_browsing_safe)
+
+        await engine.evaluate(make_payout(), "new-agent")
+        await engine.evaluate(make_payout(), "new-agent")
+
+        assert mock_pg.get_agent_policy.await_count == 2
+
+    async def test_published_invalidation_evicts(
+        self, fake_redis: RedisClient, mock_postgres: MagicMock, safe_browsing_safe: MagicMock
+    ) -> None:
+        engine = GovernanceEngine(fake_redis, mock_postgres, safe_browsing_safe)
+        await engine.evaluate(make_payout(payout_id="pout_pc_c"), "test-agent-001")
+        assert "test-agent-001" in engine._policy_cache
+
+        engine.start_policy_listener()
+        await asyncio.sleep(0.05)
+        await fake_redis.publish_policy_invalidation("test-agent-001")
+        for _ in range(50):
+            if "test-agent-001" not in engine._policy_cache:
+                break
+            await asyncio.sleep(0.01)
+
+        assert "test-agent-001" not in engine._policy_cache
+        await engine.close()
+
+    async def test_listener_backs_off_and_warns_once(
+        self,
+        fake_redis: RedisClient,
+        mock_postgres: MagicMock,
+        safe_browsing_safe: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """With Redis down, retries back off to the cap and warn only once."""
+        from vyapaar_mcp.governance import engine as engine_mod
+
+        def down() -> Any:
+            raise ConnectionError("redis down")
+
+        monkeypatch.setattr(fake_redis, "policy_invalidations", down)
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+            if len(sleeps) == 7:
+                raise asyncio.CancelledError
+
+        monkeypatch.setattr(engine_mod.asyncio, "sleep", fake_sleep)
+        engine = GovernanceEngine(fake_redis, mock_postgres, safe_browsing_safe)
+
+        with caplog.at_level(logging.DEBUG, logger=engine_mod.__name__), pytest.raises(
+            asyncio.CancelledError
+        ):
+            await engine._listen_policy_invalidations()
+
+        assert sleeps == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+        warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+        assert len(warnings) == 1
+
+
+@pytest.mark.asyncio
+class TestDecisionLogging:
+    async def test_decision_log_carries_structured_fields(
+        self,
+        fake_redis: RedisClient,
+        mock_postgres: MagicMock,
+        safe_browsing_safe: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        engine = GovernanceEngine(fake_redis, mock_postgres, safe_browsing_safe)
+        with caplog.at_level(logging.INFO, logger="vyapaar_mcp.governance.engine"):
+            await engine.evaluate(make_payout(payout_id="pout_log_1"), "test-agent-001")
+
+        record = next(r for r in caplog.records if r.getMessage().startswith("DECISION"))
+        assert record.extra_fields["decision"] == "APPROVED"  # type: ignore[attr-defined]
+        assert record.extra_fields["payout_id"] == "pout_log_1"  # type: ignore[attr-defined]
+
+    async def test_filtered_decision_log_is_skipped(
+        self,
+        fake_redis: RedisClient,
+        mock_postgres: MagicMock,
+        safe_browsing_safe: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        engine = GovernanceEngine(fake_redis, mock_postgres, safe_browsing_safe)
+        with caplog.at_level(logging.WARNING, logger="vyapaar_mcp.governance.engine"):
+            await engine.evaluate(make_payout(payout_id="pout_log_2"), "test-agent-001")
+
+        assert not [r for r in caplog.records if r.getMessage().startswith("DECISION")]
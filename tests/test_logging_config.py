@@ -0,0 +1,110 @@
+"""Tests for the structured JSON log formatter."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import orjson
+import pytest
+
+from vyapaar_mcp import logging_config
+from vyapaar_mcp.logging_config import JSONFormatter
+
+
+def make_record(created: float, **extra: object) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "vyapaar.test", logging.INFO, __file__, 1, "hello %s", ("world",), None
+    )
+    record.created = created
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+class TestJSONFormatter:
+    def test_timestamp_matches_isoformat(self) -> None:
+        formatter = JSONFormatter()
+        for created in (1_700_000_000.0, 1_700_000_000.25, 1_700_000_001.5, 1_700_000_001.999999):
+            entry = orjson.loads(formatter.format(make_record(created)))
+            expected = datetime.fromtimestamp(created, tz=UTC)
+            parsed = datetime.fromisoformat(entry["timestamp"])
+            assert abs((parsed - expected).total_seconds()) < 2e-6
+            assert entry["timestamp"].endswith("+00:00")
+
+    def test_fields_and_extra(self) -> None:
+        line = JSONFormatter().format(
+            make_record(
+                1_700_000_000.0,
+                extra_fields={"agent_id": "agent-1", "when": datetime(2024, 1, 1)},
+            )
+        )
+        entry = orjson.loads(line)
+        assert entry["message"] == "hello world"
+        assert entry["level"] == "INFO"
+        assert entry["agent_id"] == "agent-1"
+        assert entry["when"].startswith("2024-01-01")
+
+
+    def test_extra_fields_via_logger_extra(self) -> None:
+        """Records built by Logger.makeRecord carry extra_fields through."""
+        record = logging.getLogger("vyapaar.test").makeRecord(
+            "vyapaar.test", logging.INFO, __file__, 1, "hi", (), None,
+            extra={"extra_fields": {"payout_id": "pout_1"}},
+        )
+        entry = orjson.loads(JSONFormatter().format(record))
+        assert entry["payout_id"] == "pout_1"
+
+        plain = orjson.loads(JSONFormatter().format(make_record(1_700_000_000.0)))
+        assert "payout_id" not in plain and "thread" not in plain
+
+    def test_output_is_compact_utf8(self) -> None:
+        record = make_record(1_700_000_000.0, extra_fields={"vendor": "Śrī Traders ₹"})
+        line = JSONFormatter().format(record)
+        assert '"vendor":"Śrī Traders ₹"' in line
+        assert ", " not in line and '": ' not in line
+
+@pytest.fixture
+def restore_root_logger() -> Iterator[None]:
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    yield
+    logging_config._stop_listener()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    for handler in saved_handlers:
+        root.addHandler(handler)
+    root.setLevel(saved_level)
+
+
+@pytest.mark.usefixtures("restore_root_logger")
+class TestQueuedLogging:
+    def test_records_written_by_background_listener(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        root = logging.getLogger()
+        logging_config.configure_logging(level="INFO", json_format=True)
+        assert [type(h).__name__ for h in root.handlers] == ["_InProcessQueueHandler"]
+        assert logging_config._listener is not None
+
+        logging.getLogger("vyapaar.test").info("queued %d", 1)
+        logging_config._stop_listener()  # drains the queue
+
+        out = capsys.readouterr().out
+        assert orjson.loads(out.strip().splitlines()[-1])["message"] == "queued 1"
+
+    def test_json_file_beside_text_console(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        log_file = tmp_path / "vyapaar.jsonl"
+        logging_config.configure_logging(level="INFO", log_file=str(log_file))
+
+        logging.getLogger("vyapaar.test").info("teed %s", "line")
+        logging_config._stop_listener()
+
+        console = capsys.readouterr().out.strip().splitlines()[-1]
+        assert console.endswith("| vyapaar.test | teed line")
+        entry = orjson.loads(log_file.read_text().strip().splitlines()[-1])
+        assert entry["message"] == "teed line"
@@ -5,6 +5,8 @@ Tests metric recording and Prometheus text format output.
 
 from __future__ import annotations
 
+import threading
+
 from vyapaar_mcp.models import Decision, GovernanceResult, ReasonCode
 from vyapaar_mcp.observability import MetricsCollector
 
@@ -78,6 +80,16 @@ class TestMetricsCollector:
         assert snapshot["reputation_checks"]["unsafe"] == 1
         assert snapshot["reputation_checks"]["error"] == 1
 
+    def test_payout_checks_recording(self) -> None:
+        m = MetricsCollector()
+        m.record_payout_checks(rate_limit_allowed=True, budget_ok=True, reputation_safe=False)
+        m.record_payout_checks(rate_limit_allowed=False)
+        snapshot = m.snapshot()
+        assert snapshot["rate_limit_checks"] == {"allowed": 1, "blocked": 1}
+        assert snapshot["budget_checks"] == {"ok": 1, "exceeded": 0}
+        assert snapshot["reputation_checks"]["unsafe"] == 1
+        assert snapshot["reputation_checks"]["safe"] == 0
+
     def test_slack_notification_recording(self) -> None:
         m = MetricsCollector()
         m.record_slack_notification(success=True)
@@ -157,3 +169,28 @@ class TestSnapshot:
         m = MetricsCollector()
         snapshot = m.snapshot()
         assert snapshot["latency"]["avg_ms"] == 0
+
+
+class TestConcurrentRecording:
+    def test_no_lost_updates_across_threads(self) -> None:
+        m = MetricsCollector()
+        per_thread, threads = 2000, 8
+
+        def work() -> None:
+            for _ in range(per_thread):
+                m.record_webhook()
+                m.record_decision(make_result(amount=1, processing_ms=7))
+
+        pool = [threading.Thread(target=work) for _ in range(threads)]
+        for t in pool:
+            t.start()
+        for t in pool:
+            t.join()
+
+        snapshot = m.snapshot()
+        total = per_thread * threads
+        assert snapshot["webhooks"]["received"] == total
+        assert snapshot["decisions"]["APPROVED|POLICY_OK"] == total
+        assert snapshot["amounts_paise"]["APPROVED"] == total
+        assert snapshot["latency"]["count"] == total
+        assert f'vyapaar_decision_latency_ms_bucket{{le="10"}} {total}' in m.render()
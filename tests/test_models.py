@@ -44,6 +44,15 @@ class TestPayoutModels:
         assert notes.agent_id == "agent-001"
         assert notes.vendor_url == "https://example.com"
 
+    def test_dict_notes_converted_once(self) -> None:
+        """Dict notes are memoized until the notes field is replaced."""
+        entity = PayoutEntity(id="pout_123", amount=50000, status="queued")
+        assert entity.get_notes() is entity.get_notes()
+        assert entity.get_notes().agent_id == "unknown"
+
+        entity.notes = {"agent_id": "agent-002"}
+        assert entity.get_notes().agent_id == "agent-002"
+
     def test_payout_notes_defaults(self) -> None:
         """Missing notes should use defaults."""
         notes = PayoutNotes()
@@ -80,6 +89,25 @@ class TestSafeBrowsingModels:
         assert response.is_safe is False
         assert "MALWARE" in response.threat_types
 
+    def test_threat_types_deduplicated_in_order(self) -> None:
+        """Threat types keep first-seen order and are computed once."""
+        match = {
+            "platformType": "ANY_PLATFORM",
+            "threatEntryType": "URL",
+            "threat": {"url": "http://evil.com"},
+        }
+        response = SafeBrowsingResponse(
+            matches=[
+                {**match, "threatType": t}  # type: ignore[list-item]
+                for t in ("SOCIAL_ENGINEERING", "MALWARE", "SOCIAL_ENGINEERING")
+            ]
+        )
+        assert response.threat_types == ["SOCIAL_ENGINEERING", "MALWARE"]
+        assert response.threat_types is response.threat_types
+
+        response.matches = []
+        assert response.threat_types == []
+
 
 class TestGovernanceModels:
     """Test internal governance result models."""
@@ -117,6 +145,16 @@ class TestGovernanceModels:
         assert policy.per_txn_limit is None
         assert policy.blocked_domains == []
 
+    def test_domain_sets_follow_reassignment(self) -> None:
+        """Domain sets are rebuilt when the lists are replaced."""
+        policy = AgentPolicy(agent_id="agent-001", blocked_domains=["evil.com"])
+        assert policy.blocked_domain_set == {"evil.com"}
+        assert policy.blocked_domain_set is policy.blocked_domain_set
+        policy.blocked_domains = ["bad.com"]
+        policy.allowed_domains = ["good.com"]
+        assert policy.blocked_domain_set == {"bad.com"}
+        assert policy.allowed_domain_set == {"good.com"}
+
     def test_health_status(self) -> None:
         """HealthStatus should track all services."""
         health = HealthStatus(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
@@ -11,7 +13,10 @@ from vyapaar_mcp.egress.ntfy_notifier import (
     PRIORITY_DEFAULT,
     PRIORITY_HIGH,
     PRIORITY_URGENT,
+    NtfyBatcher,
     NtfyNotifier,
+    NtfyPayload,
+    _merge_payloads,
     notify_with_fallback,
 )
 from vyapaar_mcp.models import Decision, GovernanceResult, ReasonCode
@@ -41,6 +46,25 @@ def make_result(
     )
 
 
+def posted_payload(post: AsyncMock) -> dict:
+    """Rebuild the notification fields from the last mocked POST."""
+    kwargs = post.call_args.kwargs
+    headers = kwargs["headers"]
+    payload: dict = {
+        "topic": post.call_args.args[0].rsplit("/", 1)[1],
+        "message": kwargs["content"].decode(),
+        "priority": int(headers["Priority"]),
+    }
+    if "Title" in headers:
+        title = headers["Title"]
+        if title.startswith("=?UTF-8?B?"):
+            title = base64.b64decode(title[10:-2]).decode()
+        payload["title"] = title
+    if "Tags" in headers:
+        payload["tags"] = headers["Tags"].split(",")
+    return payload
+
+
 # ================================================================
 # NtfyNotifier Tests
 # ================================================================
@@ -68,8 +92,7 @@ class TestNtfyNotifier:
         )
 
         assert result is True
-        call_kwargs = notifier._client.post.call_args
-        payload = call_kwargs.kwargs.get("json") or call_kwargs[1].get("json")
+        payload = posted_payload(notifier._client.post)
         assert payload["topic"] == "vyapaar-test"
         assert payload["message"] == "Test notification"
         assert payload["title"] == "Test Title"
@@ -78,8 +101,8 @@ class TestNtfyNotifier:
 
         await notifier.close()
 
-    async def test_send_to_root_url(self) -> None:
-        """Verify POST goes to root URL, not topic URL (per ntfy API spec)."""
+    async def test_send_to_topic_url(self) -> None:
+        """Verify POST goes to the topic URL (header publish form)."""
         mock_response = MagicMock()
         mock_response.status_code = 200
 
@@ -92,7 +115,8 @@ class TestNtfyNotifier:
 
         call_args = notifier._client.post.call_args
         url = call_args[0][0] if call_args[0] else call_args.kwargs.get("url", "")
-        assert url == "https://ntfy.example.com/"
+        assert url == "https://ntfy.example.com/test-topic"
+        assert call_args.kwargs["content"] == b"Hello"
 
         await notifier.close()
 
@@ -114,6 +138,7 @@ class TestNtfyNotifier:
     async def test_send_circuit_open_returns_false(self) -> None:
         """Test circuit breaker open = notification dropped."""
         cb = MagicMock()
+        cb.is_closed = MagicMock(return_value=False)
         cb.call = AsyncMock(side_effect=CircuitOpenError("ntfy", 30))
 
         notifier = NtfyNotifier(topic="test-topic", circuit_breaker=cb)
@@ -144,7 +169,7 @@ class TestNtfyNotifier:
         )
 
         assert sent is True
-        payload = notifier._client.post.call_args.kwargs["json"]
+        payload = posted_payload(notifier._client.post)
         assert "Approval Required" in payload["title"]
         assert "75,000" in payload["message"] or "750" in payload["message"]
 
@@ -167,7 +192,7 @@ class TestNtfyNotifier:
         sent = await notifier.send_governance_notification(result_obj)
 
         assert sent is True
-        payload = notifier._client.post.call_args.kwargs["json"]
+        payload = posted_payload(notifier._client.post)
         assert "Rejected" in payload["title"]
         assert "MALWARE" in payload["message"]
 
@@ -215,7 +240,132 @@ class TestNtfyNotifier:
         notifier = NtfyNotifier(topic="test", auth_token="tk_my_secret_token")
         # Check the client was created with auth header
         assert notifier._auth_token == "tk_my_secret_token"
+        assert notifier._headers["Authorization"] == "Bearer tk_my_secret_token"
+        await notifier.close()
+
+    async def test_notifiers_share_client(self) -> None:
+        """Notifiers without an injected client share one pool per loop."""
+        from vyapaar_mcp.egress.ntfy_notifier import aclose_all
+
+        a = NtfyNotifier(topic="topic-a")
+        b = NtfyNotifier(topic="topic-b")
+        shared = a._http()
+        assert b._http() is shared
+
+        await aclose_all()
+        assert shared.is_closed
+        assert a._http() is not shared
+        await aclose_all()
+
+    async def test_injected_client_used(self) -> None:
+        """An injected client takes precedence over the shared one."""
+        client = httpx.AsyncClient()
+        notifier = NtfyNotifier(topic="test", client=client)
+        assert notifier._http() is client
+        await notifier.close()
+        assert not client.is_closed
+        await client.aclose()
+
+
+# ================================================================
+# NtfyBatcher Tests
+# ================================================================
+
+
+@pytest.mark.asyncio
+class TestNtfyBatcher:
+    """Test burst coalescing of ntfy notifications."""
+
+    async def test_burst_coalesced_per_topic(self) -> None:
+        """A burst is delivered as one merged notification per topic."""
+        delivered: list[NtfyPayload] = []
+
+        async def deliver(payload: NtfyPayload) -> bool:
+            delivered.append(payload)
+            return True
+
+        batcher = NtfyBatcher(deliver, max_wait_ms=20)
+        for i in range(3):
+            assert batcher.put(NtfyPayload(
+                topic="alerts", message=f"m{i}", title=f"t{i}",
+                priority=PRIORITY_HIGH if i == 1 else PRIORITY_DEFAULT,
+                tags=["x", f"tag{i}"],
+            ))
+        batcher.put(NtfyPayload(topic="other", message="solo"))
+        await asyncio.sleep(0.05)
+
+        assert len(delivered) == 2
+        merged = next(p for p in delivered if p.topic == "alerts")
+        assert merged.title == "3 Vyapaar alerts"
+        assert merged.priority == PRIORITY_HIGH
+        assert merged.tags == ["x", "tag0", "tag1", "tag2"]
+        assert "t1\nm1" in merged.message
+        solo = next(p for p in delivered if p.topic == "other")
+        assert solo.message == "solo"
+        await batcher.aclose()
+
+    async def test_send_many_skips_approvals(self) -> None:
+        """send_many queues one payload per non-approved result."""
+        notifier = NtfyNotifier(topic="test", batch=True)
+        notifier._client = MagicMock()
+        notifier._client.post = AsyncMock(return_value=MagicMock(status_code=200))
+
+        results = [
+            make_result(),
+            make_result(decision=Decision.APPROVED),
+            make_result(reason_code=ReasonCode.DOMAIN_BLOCKED),
+        ]
+        assert await notifier.send_many(results) is True
+        assert notifier._batcher is not None
+        assert notifier._batcher.queue.qsize() == 2
+
+        await notifier.close()
+        notifier._client.post.assert_called_once()
+        assert "2 Vyapaar alerts" in posted_payload(notifier._client.post)["title"]
+
+    async def test_close_flushes_pending(self) -> None:
+        """Closing the notifier delivers anything still queued."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+
+        notifier = NtfyNotifier(topic="test", batch=True)
+        notifier._client = MagicMock()
+        notifier._client.post = AsyncMock(return_value=mock_response)
+
+        assert await notifier.send(message="queued") is True
+        notifier._client.post.assert_not_called()
+
         await notifier.close()
+        notifier._client.post.assert_called_once()
+
+    async def test_close_delivers_batch_being_collected(self) -> None:
+        """A batch already dequeued by the flush task survives aclose()."""
+        delivered: list[NtfyPayload] = []
+
+        async def deliver(payload: NtfyPayload) -> bool:
+            delivered.append(payload)
+            return True
+
+        batcher = NtfyBatcher(deliver, max_wait_ms=1000)
+        batcher.put(NtfyPayload(topic="alerts", message="m0"))
+        await asyncio.sleep(0)  # task takes m0 and waits for more
+        assert batcher.queue.empty()
+        batcher.put(NtfyPayload(topic="alerts", message="m1"))
+
+        await batcher.aclose()
+        assert len(delivered) == 1
+        assert "m0" in delivered[0].message
+        assert "m1" in delivered[0].message
+
+    async def test_merged_digest_keeps_shared_click(self) -> None:
+        """click survives merging only when every payload agrees on it."""
+        same = [
+            NtfyPayload(topic="a", message=f"m{i}", click="https://x/1") for i in range(2)
+        ]
+        assert _merge_payloads(same).click == "https://x/1"
+        mixed = [*same, NtfyPayload(topic="a", message="m2", click="https://x/2")]
+        assert _merge_payloads(mixed).click is None
+        assert _merge_payloads(same[:1]).click == "https://x/1"
 
 
 # ================================================================
@@ -0,0 +1,262 @@
+"""Tests for the payout poller (pagination against a fake bridge)."""
+
+from __future__ import annotations
+
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from vyapaar_mcp.ingress import polling
+from vyapaar_mcp.ingress.polling import (
+    ERROR_BACKOFF_BASE,
+    ERROR_BACKOFF_MAX,
+    MAX_PAYOUTS_PER_PAGE,
+    MAX_POLL_INTERVAL,
+    MIN_POLL_INTERVAL,
+    SEEN_CACHE_SIZE,
+    PayoutPoller,
+)
+
+
+class FakeBridge:
+    """Serves a fixed list of payouts page by page, like fetch_all_payouts."""
+
+    def __init__(self, payouts: list[dict[str, Any]]) -> None:
+        self.payouts = payouts
+        self.skips: list[int] = []
+
+    async def fetch_all_payouts(
+        self, account_number: str, count: int = 100, skip: int = 0, **_: Any
+    ) -> dict[str, Any]:
+        self.skips.append(skip)
+        items = self.payouts[skip:skip + count]
+        return {"entity": "collection", "count": len(items), "items": items}
+
+
+def make_payouts(n: int) -> list[dict[str, Any]]:
+    """n payouts, every third one queued."""
+    return [
+        {"id": f"pout_{i}", "amount": 100, "status": "queued" if i % 3 == 0 else "processed"}
+        for i in range(n)
+    ]
+
+
+class FakeRedis:
+    """Idempotency batch check backed by a set, recording each batch."""
+
+    def __init__(self) -> None:
+        self.keys: set[str] = set()
+        self.batches: list[list[str]] = []
+
+    async def check_idempotency_batch(self, webhook_ids: list[str]) -> list[bool]:
+        self.batches.append(webhook_ids)
+        flags = [wid not in self.keys for wid in webhook_ids]
+        self.keys.update(webhook_ids)
+        return flags
+
+
+def make_poller(bridge: FakeBridge, redis: FakeRedis | None = None) -> PayoutPoller:
+    return PayoutPoller(bridge, "2323230000000000", redis=redis)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+class TestPagination:
+    async def test_single_page_fetched_once(self) -> None:
+        bridge = FakeBridge(make_payouts(30))
+        queued = await make_poller(bridge).fetch_all_queued_payouts()
+
+        assert bridge.skips == [0]
+        assert [p["id"] for p in queued] == [f"pout_{i}" for i in range(0, 30, 3)]
+
+    async def test_all_pages_in_order(self) -> None:
+        """A page with few queued payouts does not end pagination early."""
+        payouts = make_payouts(MAX_PAYOUTS_PER_PAGE * 5 + 20)
+        bridge = FakeBridge(payouts)
+        queued = await make_poller(bridge).fetch_all_queued_payouts()
+
+        assert [p["id"] for p in queued] == [
+            p["id"] for p in payouts if p["status"] == "queued"
+        ]
+        assert sorted(bridge.skips)[:6] == [
+            i * MAX_PAYOUTS_PER_PAGE for i in range(6)
+        ]
+
+    async def test_exact_page_multiple_stops_on_empty_page(self) -> None:
+        bridge = FakeBridge(make_payouts(MAX_PAYOUTS_PER_PAGE))
+        queued = await make_poller(bridge).fetch_all_queued_payouts()
+
+        assert len(queued) == len(range(0, MAX_PAYOUTS_PER_PAGE, 3))
+        assert 0 in bridge.skips and MAX_PAYOUTS_PER_PAGE in bridge.skips
+
+    async def test_has_more_flag_skips_empty_probe(self) -> None:
+        class FlaggedBridge(FakeBridge):
+            async def fetch_all_payouts(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
+                data = await super().fetch_all_payouts(*args, **kwargs)
+                return {**data, "has_more": False}
+
+        bridge = FlaggedBridge(make_payouts(MAX_PAYOUTS_PER_PAGE))
+        await make_poller(bridge).fetch_all_queued_payouts()
+
+        assert bridge.skips == [0]
+
+
+class TestAdaptiveInterval:
+    def test_starts_at_configured_interval(self) -> None:
+        assert make_poller(FakeBridge([])).get_backoff_interval() == 30.0
+
+    def test_activity_polls_fast(self) -> None:
+        poller = make_poller(FakeBridge([]))
+        poller._record_progress(3)
+        assert poller.get_backoff_interval() == MIN_POLL_INTERVAL
+
+    def test_idle_tapers_to_max(self) -> None:
+        poller = make_poller(FakeBridge([]))
+        poller._record_progress(2)
+        intervals = []
+        for _ in range(6):
+            poller._record_progress(0)
+            intervals.append(poller.get_backoff_interval())
+        assert intervals == [30.0, 60.0, 120.0, 240.0, MAX_POLL_INTERVAL, MAX_POLL_INTERVAL]
+
+        poller._record_progress(1)
+        assert poller.get_backoff_interval() == MIN_POLL_INTERVAL
+        assert poller.stats["consecutive_empty_polls"] == 0
+
+    def test_errors_take_precedence(self) -> None:
+        poller = make_poller(FakeBridge([]))
+        poller._record_progress(5)
+        poller._error_count = 1
+        assert poller.get_backoff_interval() == ERROR_BACKOFF_BASE
+        poller._error_count = 20
+        assert poller.get_backoff_interval() == ERROR_BACKOFF_MAX
+
+
+@pytest.mark.asyncio
+class TestSeenCache:
+    async def test_repeat_ids_skip_redis(self) -> None:
+        bridge = FakeBridge(make_payouts(9))
+        redis = FakeRedis()
+        poller = make_poller(bridge, redis)
+
+        assert [p.id for p, _, _ in await poller.poll_once()] == ["pout_0", "pout_3", "pout_6"]
+        assert await poller.poll_once() == []
+        assert len(redis.batches) == 1
+
+        bridge.payouts.append({"id": "pout_new", "amount": 100, "status": "queued"})
+        assert [p.id for p, _, _ in await poller.poll_once()] == ["pout_new"]
+        assert redis.batches[-1] == ["poll:payout.queued:pout_new"]
+
+    async def test_ids_processed_elsewhere_are_cached(self) -> None:
+        """IDs Redis reports as already processed are remembered too."""
+        bridge = FakeBridge(make_payouts(3))
+        redis = FakeRedis()
+        redis.keys.add("poll:payout.queued:pout_0")
+        poller = make_poller(bridge, redis)
+
+        assert await poller.poll_once() == []
+        assert await poller.poll_once() == []
+        assert len(redis.batches) == 1
+
+    async def test_malformed_payout_does_not_sink_its_page(self) -> None:
+        """A bad payout is skipped unmarked; the rest of the page is governed."""
+        payouts = make_payouts(9)
+        payouts[3] = {"id": "pout_3", "amount": "100", "status": "queued"}
+        bridge = FakeBridge(payouts)
+        redis = FakeRedis()
+        poller = make_poller(bridge, redis)
+
+        assert [p.id for p, _, _ in await poller.poll_once()] == ["pout_0", "pout_6"]
+        assert "poll:payout.queued:pout_3" not in redis.keys
+
+        payouts[3] = {"id": "pout_3", "amount": 100, "status": "queued"}
+        assert [p.id for p, _, _ in await poller.poll_once()] == ["pout_3"]
+
+    async def test_seen_set_is_bounded(self) -> None:
+        poller = make_poller(FakeBridge([]))
+        for i in range(SEEN_CACHE_SIZE + 5):
+            poller._remember(f"pout_{i}")
+        assert len(poller._seen) == SEEN_CACHE_SIZE
+        assert "pout_0" not in poller._seen
+
+
+class TestConvert:
+    def test_notes_become_payout_notes(self) -> None:
+        payout = make_poller(FakeBridge([])).convert_to_payout_entity({
+            "id": "pout_1", "amount": 5000, "status": "queued",
+            "notes": {"agent_id": "agent-1", "vendor_url": "https://x.com"},
+        })
+        assert payout.get_notes().agent_id == "agent-1"
+
+    def test_page_conversion_matches_single(self) -> None:
+        poller = make_poller(FakeBridge([]))
+        raws = make_payouts(6)
+        assert poller.convert_page(raws) == [poller.convert_to_payout_entity(r) for r in raws]
+
+    def test_drifted_amount_type_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            make_poller(FakeBridge([])).convert_to_payout_entity(
+                {"id": "pout_1", "amount": "5000", "status": "queued"}
+            )
+
+
+@pytest.mark.asyncio
+class TestSchedule:
+    async def test_sleep_excludes_poll_time(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        poller = make_poller(FakeBridge([]))
+        clock = iter([100.0, 100.0, 112.0])
+        monkeypatch.setattr(
+            polling, "time", SimpleNamespace(monotonic=lambda: next(clock), time=time.time)
+        )
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            poller._running = False
+
+        monkeypatch.setattr(polling.asyncio, "sleep", fake_sleep)
+        await poller.run_continuous()
+
+        assert sleeps == [30.0 - 12.0]
+
+    async def test_last_poll_at_is_epoch(self) -> None:
+        poller = make_poller(FakeBridge([]))
+        assert poller.stats["last_poll_at"] is None
+        await poller.poll_once()
+        assert abs(poller.stats["last_poll_at"] - time.time()) < 5
+
+
+@pytest.mark.asyncio
+class TestStreaming:
+    async def test_first_page_yielded_before_the_rest_are_fetched(self) -> None:
+        payouts = make_payouts(MAX_PAYOUTS_PER_PAGE * 6)
+        bridge = FakeBridge(payouts)
+        poller = make_poller(bridge, FakeRedis())
+
+        skips_at_first: list[int] | None = None
+        ids = []
+        async for payout, _, _ in poller.iter_new_payouts():
+            if skips_at_first is None:
+                skips_at_first = list(bridge.skips)
+            ids.append(payout.id)
+
+        assert skips_at_first == [0]
+        assert ids == [p["id"] for p in payouts if p["status"] == "queued"]
+        assert poller.stats["consecutive_empty_polls"] == 0
+
+    async def test_fetch_error_mid_stream_counts_as_error(self) -> None:
+        class FlakyBridge(FakeBridge):
+            async def fetch_all_payouts(
+                self, account_number: str, count: int = 100, skip: int = 0, **_: Any
+            ) -> dict[str, Any]:
+                if skip:
+                    raise RuntimeError("upstream down")
+                return await super().fetch_all_payouts(account_number, count, skip)
+
+        poller = make_poller(FlakyBridge(make_payouts(MAX_PAYOUTS_PER_PAGE * 2)), FakeRedis())
+        found = await poller.poll_once()
+
+        assert len(found) == len(range(0, MAX_PAYOUTS_PER_PAGE, 3))
+        assert poller.stats["error_count"] == 1
@@ -0,0 +1,162 @@
+"""Tests for Razorpay X payout actions (approve/reject over httpx)."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from vyapaar_mcp.egress import razorpay_actions
+from vyapaar_mcp.egress.razorpay_actions import RazorpayActions
+from vyapaar_mcp.resilience import CircuitBreaker
+
+
+def make_actions(handler: object) -> RazorpayActions:
+    """Build RazorpayActions whose HTTP client is served by ``handler``."""
+    actions = RazorpayActions("rzp_test_key", "secret")
+    actions._http = httpx.AsyncClient(
+        base_url="https://api.razorpay.com",
+        transport=httpx.MockTransport(handler),  # type: ignore[arg-type]
+        headers={"Authorization": actions._auth_header},
+    )
+    return actions
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip retry sleeps."""
+    monkeypatch.setattr(razorpay_actions, "BASE_DELAY", 0.0)
+
+
+@pytest.mark.asyncio
+class TestRazorpayActions:
+    """Test approve/reject request handling and retries."""
+
+    async def test_approve_retries_on_5xx(self) -> None:
+        """A 5xx is retried and the next success is returned."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(502)
+            return httpx.Response(200, json={"id": "pout_1", "status": "processing"})
+
+        actions = make_actions(handler)
+        result = await actions.approve_payout("pout_1")
+
+        assert result["status"] == "processing"
+        assert len(calls) == 2
+        assert calls[0].url.path == "/v1/payouts/pout_1/approve"
+        assert calls[0].headers["Authorization"].startswith("Basic ")
+        await actions.close()
+
+    async def test_reject_does_not_retry_4xx(self) -> None:
+        """A 4xx is raised immediately without retrying."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(400, json={"error": "bad request"})
+
+        actions = make_actions(handler)
+        with pytest.raises(httpx.HTTPStatusError):
+            await actions.reject_payout("pout_2", "DOMAIN_BLOCKED")
+
+        assert len(calls) == 1
+        assert calls[0].method == "PATCH"
+        await actions.close()
+
+    async def test_429_honours_retry_after(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A 429 is retried after the server-provided Retry-After delay."""
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+
+        monkeypatch.setattr(razorpay_actions.asyncio, "sleep", fake_sleep)
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"id": "pout_3"}),
+        ])
+        actions = make_actions(lambda request: next(responses))
+
+        assert (await actions.approve_payout("pout_3"))["id"] == "pout_3"
+        assert sleeps == [2.0]
+        await actions.close()
+
+    async def test_backoff_not_counted_as_latency(self) -> None:
+        """The breaker's latency EMA sees each attempt, not the retry sleep."""
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "0.2"}),
+            httpx.Response(200, json={"id": "pout_6"}),
+        ])
+        actions = make_actions(lambda request: next(responses))
+        actions._circuit = CircuitBreaker("razorpay", latency_timeout=10.0)
+
+        assert (await actions.approve_payout("pout_6"))["id"] == "pout_6"
+        assert actions._circuit._latency_current < 0.1
+        await actions.close()
+
+    async def test_unexpected_errors_not_retried(self) -> None:
+        """Non-transient exceptions propagate on the first attempt."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            raise ValueError("bug")
+
+        actions = make_actions(handler)
+        with pytest.raises(ValueError):
+            await actions.approve_payout("pout_4")
+        assert len(calls) == 1
+        await actions.close()
+
+    async def test_transport_errors_retried(self) -> None:
+        """Connection failures are retried up to MAX_RETRIES."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            raise httpx.ConnectError("refused")
+
+        actions = make_actions(handler)
+        with pytest.raises(RuntimeError):
+            await actions.approve_payout("pout_5")
+        assert len(calls) == razorpay_actions.MAX_RETRIES
+        await actions.close()
+
+    async def test_backoff_is_jittered(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Backoff steps stay within [BASE_DELAY, next step] and vary."""
+        monkeypatch.setattr(razorpay_actions, "BASE_DELAY", 1.0)
+        samples = {RazorpayActions._jittered(4.0) for _ in range(50)}
+        assert all(1.0 <= s <= 8.0 for s in samples)
+        assert len(samples) > 1
+        assert RazorpayActions._jittered(25.0) <= razorpay_actions.MAX_DELAY
+
+    async def test_ping(self) -> None:
+        """Ping reflects whether the API answered successfully."""
+        actions = make_actions(lambda request: httpx.Response(200, json={"items": []}))
+        assert await actions.ping() is True
+        await actions.close()
+
+        actions = make_actions(lambda request: httpx.Response(401))
+        assert await actions.ping() is False
+        await actions.close()
+
+    async def test_ping_is_cached(self) -> None:
+        """Back-to-back probes hit the API only once."""
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(200, json={"items": []})
+
+        actions = make_actions(handler)
+        assert await actions.ping() is True
+        assert await actions.ping() is True
+        assert len(calls) == 1
+
+        actions._ping_cache = (actions._ping_cache[0] - 10, True)  # type: ignore[index]
+        assert await actions.ping() is True
+        assert len(calls) == 2
+        await actions.close()
@@ -6,22 +6,32 @@ Tests the bridge's ability to:
 3. Communicate via MCP/stdio protocol
 4. Call tools (list_tools, fetch_all_payouts, ping)
 
-These tests require:
+The subprocess tests require:
 - Go binary built at bin/razorpay-mcp-server
 - Valid Razorpay API credentials in .env
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import anyio
 import pytest
+from mcp.types import TextContent
 
 from vyapaar_mcp.config import VyapaarConfig
+from vyapaar_mcp.ingress import razorpay_bridge
 from vyapaar_mcp.ingress.razorpay_bridge import RazorpayBridge, DEFAULT_BINARY_PATH
 
-# Skip all tests if Go binary not built
+# Skip binary-dependent tests if Go binary not built
 GO_BINARY_EXISTS = os.path.isfile(DEFAULT_BINARY_PATH)
-pytestmark = pytest.mark.skipif(
+requires_binary = pytest.mark.skipif(
     not GO_BINARY_EXISTS,
     reason=f"Go binary not found at {DEFAULT_BINARY_PATH}. "
            f"Build: cd vendor/razorpay-mcp-server && "
@@ -34,6 +44,7 @@ pytestmark = pytest.mark.skipif(
 # ================================================================
 
 
+@requires_binary
 class TestBridgeInit:
     """Test bridge initialization."""
 
@@ -85,6 +96,7 @@ def account_number(config: VyapaarConfig) -> str:
     return config.razorpay_account_number
 
 
+@requires_binary
 class TestBridgeConnectivity:
     """Test MCP subprocess communication with Go binary."""
 
@@ -144,3 +156,213 @@ class TestBridgeConnectivity:
         result = await bridge.fetch_all_payments(count=3)
         assert "items" in result
         assert isinstance(result["items"], list)
+
+
+# ================================================================
+# Persistent Session (no binary needed)
+# ================================================================
+
+
+class FakeSession:
+    """Stands in for an MCP ClientSession."""
+
+    def __init__(
+        self,
+        fail_first: bool = False,
+        broken: bool = False,
+        error: str | None = None,
+        gate: asyncio.Event | None = None,
+    ) -> None:
+        self.calls: list[str] = []
+        self.fail_first = fail_first
+        self.broken = broken
+        self.error = error
+        self.gate = gate
+        self.active = self.peak = 0
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        self.calls.append(name)
+        if self.broken:
+            # Stagger the failures so some land after a peer reconnected
+            await asyncio.sleep(0.005 * len(self.calls))
+            raise anyio.BrokenResourceError()
+        if self.fail_first:
+            self.fail_first = False
+            raise anyio.BrokenResourceError()
+        if self.gate is not None:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await self.gate.wait()
+            finally:
+                self.active -= 1
+        return SimpleNamespace(
+            isError=self.error is not None,
+            content=[TextContent(type="text", text=self.error or '{"items": []}')],
+        )
+
+    async def list_tools(self) -> Any:
+        if self.error is not None:
+            raise RuntimeError(self.error)
+        await self.call_tool("list_tools", {})
+        return SimpleNamespace(tools=[SimpleNamespace(name="fetch_payout_with_id")])
+
+
+def make_bridge(
+    tmp_path: Path, sessions: list[FakeSession], **kwargs: Any
+) -> tuple[RazorpayBridge, list[str]]:
+    """Bridge whose _connect hands out ``sessions`` in order and logs lifecycle."""
+    binary = tmp_path / "razorpay-mcp-server"
+    binary.write_text("")
+    bridge = RazorpayBridge(
+        "rzp_test_1234", "secret", binary_path=str(binary), **kwargs
+    )
+    events: list[str] = []
+    queue = iter(sessions)
+
+    @asynccontextmanager
+    async def fake_connect() -> AsyncGenerator[FakeSession, None]:
+        events.append("open")
+        try:
+            yield next(queue)
+        finally:
+            events.append("close")
+
+    bridge._connect = fake_connect  # type: ignore[method-assign]
+    return bridge, events
+
+
+@pytest.mark.asyncio
+class TestPersistentSession:
+    async def test_calls_reuse_one_session(self, tmp_path: Path) -> None:
+        session = FakeSession()
+        bridge, events = make_bridge(tmp_path, [session])
+
+        await bridge.fetch_payout("pout_1")
+        await bridge.fetch_all_payments()
+
+        assert events == ["open"]
+        assert session.calls == ["fetch_payout_with_id", "fetch_all_payments"]
+        await bridge.aclose()
+        assert events == ["open", "close"]
+
+    async def test_broken_session_reconnects_for_reads(self, tmp_path: Path) -> None:
+        broken, fresh = FakeSession(fail_first=True), FakeSession()
+        bridge, events = make_bridge(tmp_path, [broken, fresh])
+
+        assert await bridge.fetch_payout("pout_1") == {"items": []}
+
+        assert events == ["open", "close", "open"]
+        assert fresh.calls == ["fetch_payout_with_id"]
+        await bridge.aclose()
+
+    async def test_broken_session_does_not_retry_writes(self, tmp_path: Path) -> None:
+        broken = FakeSession(fail_first=True)
+        bridge, events = make_bridge(tmp_path, [broken, FakeSession()])
+
+        with pytest.raises(anyio.BrokenResourceError):
+            await bridge.create_refund("pay_1", 100)
+
+        assert broken.calls == ["create_refund"]
+        assert events == ["open", "close"]
+
+    async def test_stale_discard_keeps_replacement(self, tmp_path: Path) -> None:
+        first, second = FakeSession(), FakeSession()
+        bridge, events = make_bridge(tmp_path, [first, second])
+
+        assert await bridge._ensure_session() is first
+        await bridge._discard_session(first)  # type: ignore[arg-type]
+        assert await bridge._ensure_session() is second
+        await bridge._discard_session(first)  # type: ignore[arg-type]
+        await asyncio.sleep(0)
+
+        assert bridge._session is second
+        assert events == ["open", "close", "open"]
+        await bridge.aclose()
+        assert events == ["open", "close", "open", "close"]
+
+    async def test_tool_error_text_is_raised(self, tmp_path: Path) -> None:
+        bridge, _ = make_bridge(tmp_path, [FakeSession(error="payout not found")])
+
+        with pytest.raises(RuntimeError, match="payout not found"):
+            await bridge.fetch_payout("pout_missing")
+        await bridge.aclose()
+
+
+
+@pytest.mark.asyncio
+class TestInflightLimit:
+    async def test_concurrent_calls_are_bounded(self, tmp_path: Path) -> None:
+        gate = asyncio.Event()
+        session = FakeSession(gate=gate)
+        bridge, _ = make_bridge(tmp_path, [session], max_inflight=2)
+
+        calls = [asyncio.create_task(bridge.fetch_payout(f"pout_{i}")) for i in range(5)]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert bridge.stats["inflight"] == 2
+        assert bridge.stats["saturated"] is True
+
+        gate.set()
+        await asyncio.gather(*calls)
+        assert session.peak == 2
+        assert bridge.stats["inflight"] == 0
+        await bridge.aclose()
+
+    async def test_concurrent_callers_share_one_reconnect(self, tmp_path: Path) -> None:
+        """Callers failing on the same broken session respawn it only once."""
+        fresh = FakeSession()
+        bridge, events = make_bridge(
+            tmp_path, [FakeSession(broken=True), fresh, FakeSession(), FakeSession()]
+        )
+
+        results = await asyncio.gather(
+            *(bridge.fetch_payout(f"pout_{i}") for i in range(4))
+        )
+
+        assert results == [{"items": []}] * 4
+        assert events == ["open", "close", "open"]
+        assert len(fresh.calls) == 4
+        await bridge.aclose()
+
+    async def test_hung_call_times_out(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(razorpay_bridge, "TOOL_CALL_TIMEOUT", 0.01)
+        bridge, _ = make_bridge(tmp_path, [FakeSession(gate=asyncio.Event())])
+
+        with pytest.raises(TimeoutError):
+            await bridge.fetch_payout("pout_1")
+        assert bridge.stats["inflight"] == 0
+        await bridge.aclose()
+
+
+@pytest.mark.asyncio
+class TestPing:
+    async def test_ping_failure_keeps_shared_session(self, tmp_path: Path) -> None:
+        """A failed health check doesn't tear down the session under other calls."""
+        bridge, events = make_bridge(tmp_path, [FakeSession(error="list_tools failed")])
+
+        assert await bridge.ping() is False
+        assert events == ["open"]
+        await bridge.aclose()
+
+    async def test_ping_reconnects_broken_session(self, tmp_path: Path) -> None:
+        bridge, events = make_bridge(tmp_path, [FakeSession(fail_first=True), FakeSession()])
+
+        assert await bridge.ping() is True
+        assert events == ["open", "close", "open"]
+        await bridge.aclose()
+
+    async def test_hung_ping_times_out_within_limit(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(razorpay_bridge, "TOOL_CALL_TIMEOUT", 0.01)
+        gate = asyncio.Event()
+        session = FakeSession(gate=gate)
+        bridge, _ = make_bridge(tmp_path, [session], max_inflight=1)
+
+        assert await bridge.ping() is False
+        assert session.peak == 1
+        assert bridge.stats["inflight"] == 0
+        await bridge.aclose()
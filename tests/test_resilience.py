@@ -16,6 +16,7 @@ import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from vyapaar_mcp.db.redis_client import RedisClient
@@ -215,6 +216,78 @@ class TestCircuitBreaker:
         assert snap["failure_count"] == 1
 
 
+@pytest.mark.asyncio
+class TestCircuitFastPath:
+    """Synchronous is_closed()/record_*() API used to bypass call()."""
+
+    async def test_record_failure_opens(self) -> None:
+        """Failures recorded directly trip the breaker like call() does."""
+        cb = CircuitBreaker("test", failure_threshold=2)
+        assert cb.is_closed()
+
+        cb.record_failure(RuntimeError("boom"))
+        assert cb.is_closed()
+        cb.record_failure(RuntimeError("boom"))
+        assert not cb.is_closed()
+        assert cb.state == CircuitState.OPEN
+
+    async def test_record_success_resets_failures(self) -> None:
+        """A recorded success clears the consecutive-failure count."""
+        cb = CircuitBreaker("test", failure_threshold=3)
+        cb.record_failure(RuntimeError("boom"))
+        cb.record_success()
+        assert cb.failure_count == 0
+
+    async def test_not_closed_while_shedding(self) -> None:
+        """Elevated latency forces callers back through call()."""
+        cb = CircuitBreaker("test", latency_timeout=10.0)
+        cb.record_success(0.1)
+        cb._latency_current = 20.0
+        assert not cb.is_closed()
+
+
+@pytest.mark.asyncio
+class TestLatencyShedding:
+    """Latency-aware load shedding on a CLOSED breaker."""
+
+    async def test_disabled_by_default(self) -> None:
+        """Without latency_timeout nothing is tracked or shed."""
+        cb = CircuitBreaker("test")
+        cb._record_latency(0.01)
+        cb._latency_current = 100.0
+        assert cb.latency_ratio == 0.0
+
+    async def test_ratio_grows_with_latency(self) -> None:
+        """Ratio is zero near baseline and capped at 0.3 near the timeout."""
+        cb = CircuitBreaker("test", latency_timeout=10.0)
+        for _ in range(5):
+            cb._record_latency(0.1)
+        assert cb.latency_ratio == 0.0
+
+        cb._latency_current = 5.0
+        assert 0.0 < cb.latency_ratio < 0.3
+        cb._latency_current = 20.0
+        assert cb.latency_ratio == pytest.approx(0.3)
+
+    async def test_sheds_calls_when_slow(self) -> None:
+        """Elevated latency rejects some calls with CircuitOpenError."""
+        cb = CircuitBreaker("test", latency_timeout=10.0)
+        cb._record_latency(0.1)
+        cb._latency_current = 20.0
+
+        async def ok() -> str:
+            return "ok"
+
+        with (
+            patch("vyapaar_mcp.resilience.random.random", return_value=0.1),
+            pytest.raises(CircuitOpenError),
+        ):
+            await cb.call(ok)
+        with patch("vyapaar_mcp.resilience.random.random", return_value=0.9):
+            assert await cb.call(ok) == "ok"
+        assert cb.state == CircuitState.CLOSED
+
+
 # ================================================================
 # Rate Limiting Tests (Redis sliding window)
 # ================================================================
@@ -272,6 +345,27 @@ class TestRateLimiting:
         assert allowed is True
         assert count == 1
 
+    async def test_entries_expire_after_window(
+        self, fake_redis: RedisClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Entries older than the window (in µs) should no longer count."""
+        import vyapaar_mcp.db.redis_client as redis_mod
+
+        now_ns = 1_700_000_000 * 1_000_000_000
+        monkeypatch.setattr(redis_mod.time, "time_ns", lambda: now_ns)
+        for _ in range(5):
+            await fake_redis.check_rate_limit(
+                "agent-a", max_requests=5, window_seconds=60
+            )
+
+        # 61 seconds later the whole window has slid past
+        monkeypatch.setattr(redis_mod.time, "time_ns", lambda: now_ns + 61_000_000_000)
+        allowed, count = await fake_redis.check_rate_limit(
+            "agent-a", max_requests=5, window_seconds=60
+        )
+        assert allowed is True
+        assert count == 1
+
 
 # ================================================================
 # Governance Engine — Rate Limit Integration
@@ -311,6 +405,31 @@ class TestGovernanceRateLimit:
         assert result.reason_code == ReasonCode.RATE_LIMITED
         assert "Rate limit exceeded" in (result.reason_detail or "")
 
+    async def test_rate_limited_payout_releases_budget(
+        self, fake_redis: RedisClient, mock_postgres: MagicMock
+    ) -> None:
+        """Budget reserved alongside a rate-limited request is rolled back."""
+        safe_browsing = MagicMock()
+        safe_browsing.check_url = AsyncMock(return_value=SafeBrowsingResponse())
+
+        engine = GovernanceEngine(
+            fake_redis, mock_postgres, safe_browsing,
+            rate_limit_max=1, rate_limit_window=60,
+        )
+
+        await engine.evaluate(
+            PayoutEntity(id="pout_rb_1", amount=1000, status="queued"),
+            "test-agent-001",
+        )
+        spent = await fake_redis.get_daily_spend("test-agent-001")
+
+        result = await engine.evaluate(
+            PayoutEntity(id="pout_rb_2", amount=5000, status="queued"),
+            "test-agent-001",
+        )
+        assert result.reason_code == ReasonCode.RATE_LIMITED
+        assert await fake_redis.get_daily_spend("test-agent-001") == spent
+
     async def test_rate_limit_disabled_when_zero(
         self, fake_redis: RedisClient, mock_postgres: MagicMock
     ) -> None:
@@ -354,12 +473,12 @@ class TestSlackInteractiveButtons:
         from vyapaar_mcp.egress.slack_notifier import SlackNotifier
 
         result = self._make_held_result()
-        blocks = SlackNotifier._build_approval_blocks(
+        blocks = orjson.loads(SlackNotifier._build_approval_blocks(
             result=result,
             amount_rupees=500.0,
             vendor_name="Test Vendor",
             vendor_url="https://test-vendor.com",
-        )
+        ))
 
         # Find the actions block
         actions_block = None
@@ -385,12 +504,12 @@ class TestSlackInteractiveButtons:
         from vyapaar_mcp.egress.slack_notifier import SlackNotifier
 
         result = self._make_held_result(payout_id="pout_style_001", amount=75000)
-        blocks = SlackNotifier._build_approval_blocks(
+        blocks = orjson.loads(SlackNotifier._build_approval_blocks(
             result=result,
             amount_rupees=750.0,
             vendor_name=None,
             vendor_url=None,
-        )
+        ))
 
         actions_block = next(b for b in blocks if b.get("type") == "actions")
         elements = actions_block["elements"]
@@ -414,7 +533,7 @@ class TestSlackInteractiveButtons:
         with patch("httpx.AsyncClient.post", new_callable=AsyncMock) as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {"ok": True}
+            mock_response.content = b'{"ok": true}'
             mock_post.return_value = mock_response
 
             result = await notifier.update_approval_message(
@@ -428,3 +547,6 @@ class TestSlackInteractiveButtons:
             mock_post.assert_called_once()
             call_args = mock_post.call_args
             assert "chat.update" in str(call_args)
+            assert result is True
+            body = orjson.loads(call_args.kwargs["content"])
+            assert body["ts"] == "1234567890.123456"
@@ -0,0 +1,311 @@
+"""Tests for the Dual LLM security validator (verdict caching)."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from vyapaar_mcp.config import VyapaarConfig
+from vyapaar_mcp.llm import security_validator
+from vyapaar_mcp.llm.security_validator import (
+    SecurityLLMClient,
+    ToolCallRequest,
+    ToolCallValidator,
+)
+
+POLICY = {"max_daily_spend": 1_000_000}
+
+
+class FakeCompletions:
+    """Stands in for ``client.chat.completions`` and counts calls."""
+
+    def __init__(
+        self, content: str = '{"approved": true, "reason": "ok", "risk_score": 0.1}'
+    ) -> None:
+        self.content = content
+        self.calls = 0
+        self.fail = False
+
+    async def create(self, **_: Any) -> Any:
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("security LLM down")
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def make_client(config: VyapaarConfig, completions: FakeCompletions) -> SecurityLLMClient:
+    client = SecurityLLMClient(config)
+    client._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))  # type: ignore[assignment]
+    return client
+
+
+def make_request(amount: int = 5000) -> ToolCallRequest:
+    return ToolCallRequest(
+        tool_name="poll_razorpay_payouts",
+        parameters={"amount": amount},
+        agent_id="agent-001",
+        context_tainted=True,
+    )
+
+
+@pytest.mark.asyncio
+class TestValidationCache:
+    async def test_repeat_call_served_from_cache(self, config: VyapaarConfig) -> None:
+        completions = FakeCompletions()
+        client = make_client(config, completions)
+
+        first = await client.validate_tool_call(make_request(), POLICY)
+        second = await client.validate_tool_call(make_request(), POLICY)
+
+        assert first.approved and second == first
+        assert completions.calls == 1
+
+    async def test_different_inputs_miss(self, config: VyapaarConfig) -> None:
+        completions = FakeCompletions()
+        client = make_client(config, completions)
+
+        await client.validate_tool_call(make_request(5000), POLICY)
+        await client.validate_tool_call(make_request(6000), POLICY)
+        await client.validate_tool_call(make_request(5000), {"max_daily_spend": 1})
+
+        assert completions.calls == 3
+
+    async def test_failures_not_cached(self, config: VyapaarConfig) -> None:
+        completions = FakeCompletions()
+        completions.fail = True
+        client = make_client(config, completions)
+
+        denied = await client.validate_tool_call(make_request(), POLICY)
+        assert denied.approved is False
+
+        completions.fail = False
+        assert (await client.validate_tool_call(make_request(), POLICY)).approved is True
+        assert completions.calls == 2
+
+    async def test_expiry_and_disable(self, config: VyapaarConfig) -> None:
+        completions = FakeCompletions()
+        client = make_client(config, completions)
+
+        await client.validate_tool_call(make_request(), POLICY)
+        for key, (_, verdict) in client._cache.items():
+            client._cache[key] = (0.0, verdict)
+        await client.validate_tool_call(make_request(), POLICY)
+        assert completions.calls == 2
+
+        config.security_llm_cache_ttl = 0
+        uncached = make_client(config, completions)
+        await uncached.validate_tool_call(make_request(), POLICY)
+        await uncached.validate_tool_call(make_request(), POLICY)
+        assert completions.calls == 4
+
+    async def test_cache_is_bounded(
+        self, config: VyapaarConfig, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(security_validator, "VALIDATION_CACHE_SIZE", 2)
+        client = make_client(config, FakeCompletions())
+
+        for amount in (1, 2, 3):
+            await client.validate_tool_call(make_request(amount), POLICY)
+
+        assert len(client._cache) == 2
+
+    @pytest.mark.parametrize(
+        "parameters", [{"amount": 2**70}, {"meta": {1: "x"}}], ids=["big-int", "int-key"]
+    )
+    @pytest.mark.parametrize("strict", [True, False])
+    async def test_unserializable_parameters_fall_back(
+        self, config: VyapaarConfig, parameters: dict[str, Any], strict: bool
+    ) -> None:
+        config.quarantine_strict = strict
+        completions = FakeCompletions()
+        request = ToolCallRequest(
+            tool_name="poll_razorpay_payouts",
+            parameters=parameters,
+            agent_id="agent-001",
+            context_tainted=True,
+        )
+
+        result = await make_client(config, completions).validate_tool_call(request, POLICY)
+
+        assert result.approved is not strict
+        assert result.reason.startswith("Validation error")
+        assert completions.calls == 0
+
+
+class TestPromptPolicy:
+    def test_policy_and_parameters_are_compact(self, config: VyapaarConfig) -> None:
+        client = SecurityLLMClient(config)
+
+        first = client._build_validation_prompt(make_request(), {"b": 1, "a": 2})
+        second = client._build_validation_prompt(make_request(), {"a": 2, "b": 1})
+
+        assert first == second
+        assert '{"a":2,"b":1}' in first
+        assert 'PARAMETERS: {"amount":5000}' in first
+
+    async def test_reply_parsed_with_surrounding_whitespace(
+        self, config: VyapaarConfig
+    ) -> None:
+        completions = FakeCompletions(
+            '\n  {"approved": false, "reason": "no", "risk_score": 0.9}\n'
+        )
+        result = await make_client(config, completions).validate_tool_call(make_request(), POLICY)
+        assert (result.approved, result.reason) == (False, "no")
+
+
+@pytest.mark.asyncio
+class TestPromptCaching:
+    async def capture_messages(self, config: VyapaarConfig) -> list[dict[str, Any]]:
+        sent: list[dict[str, Any]] = []
+        completions = FakeCompletions()
+        original = completions.create
+
+        async def create(**kwargs: Any) -> Any:
+            sent.extend(kwargs["messages"])
+            return await original(**kwargs)
+
+        completions.create = create  # type: ignore[method-assign]
+        await make_client(config, completions).validate_tool_call(make_request(), POLICY)
+        return sent
+
+    async def test_plain_messages_by_default(self, config: VyapaarConfig) -> None:
+        system, user = await self.capture_messages(config)
+        assert isinstance(system["content"], str)
+        assert "GOVERNANCE_POLICY" in user["content"]
+
+    async def test_policy_moves_into_cached_prefix(self, config: VyapaarConfig) -> None:
+        config.security_llm_prompt_cache = True
+        system, user = await self.capture_messages(config)
+
+        parts = system["content"]
+        assert [p["cache_control"] for p in parts] == [{"type": "ephemeral"}] * 2
+        assert '{"max_daily_spend":1000000}' in parts[1]["text"]
+        assert "GOVERNANCE_POLICY" not in user["content"]
+        assert 'PARAMETERS: {"amount":5000}' in user["content"]
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    async def test_concurrent_identical_calls_share_one_request(
+        self, config: VyapaarConfig
+    ) -> None:
+        gate = asyncio.Event()
+        completions = FakeCompletions()
+        original = completions.create
+
+        async def slow_create(**kwargs: Any) -> Any:
+            await gate.wait()
+            return await original(**kwargs)
+
+        completions.create = slow_create  # type: ignore[method-assign]
+        client = make_client(config, completions)
+
+        calls = [
+            asyncio.create_task(client.validate_tool_call(make_request(), POLICY))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*calls)
+
+        assert completions.calls == 1
+        assert all(r.approved for r in results)
+        assert client._inflight == {}
+
+    async def test_cancelled_caller_does_not_fail_others(
+        self, config: VyapaarConfig
+    ) -> None:
+        gate = asyncio.Event()
+        completions = FakeCompletions()
+        original = completions.create
+
+        async def slow_create(**kwargs: Any) -> Any:
+            await gate.wait()
+            return await original(**kwargs)
+
+        completions.create = slow_create  # type: ignore[method-assign]
+        client = make_client(config, completions)
+
+        first = asyncio.create_task(client.validate_tool_call(make_request(), POLICY))
+        second = asyncio.create_task(client.validate_tool_call(make_request(), POLICY))
+        await asyncio.sleep(0)
+        first.cancel()
+        gate.set()
+
+        assert (await second).approved is True
+        assert completions.calls == 1
+
+
+@pytest.mark.asyncio
+class TestSharedHttp:
+    async def test_injected_pool_used_and_left_open(self, config: VyapaarConfig) -> None:
+        http = httpx.AsyncClient()
+        client = SecurityLLMClient(config, http=http)
+        await client.initialize()
+
+        assert client._client is not None
+        assert client._client._client is http
+        await client.close()
+        assert not http.is_closed
+        await http.aclose()
+
+
+@pytest.mark.asyncio
+class TestToolCallValidator:
+    async def test_tool_lists_are_trimmed_frozensets(self, config: VyapaarConfig) -> None:
+        config.dual_llm_tools = " azure_chat , ,check_vendor_reputation"
+        validator = ToolCallValidator(config)
+        assert validator._dual_llm_tools == frozenset({"azure_chat", "check_vendor_reputation"})
+
+    async def test_tool_lists_normalized_at_config_load(self, config: VyapaarConfig) -> None:
+        loaded = VyapaarConfig(
+            **{**config.model_dump(), "taint_sources": "azure_chat, get_metrics ,,"}
+        )
+        assert loaded.taint_sources == "azure_chat,get_metrics"
+        assert ToolCallValidator(loaded)._taint_sources == frozenset({"azure_chat", "get_metrics"})
+
+    async def test_clean_context_reuses_one_result(self, config: VyapaarConfig) -> None:
+        validator = ToolCallValidator(config)
+        first = await validator.validate("set_agent_policy", {}, "agent-001", POLICY)
+        second = await validator.validate("azure_chat", {}, "agent-001", POLICY)
+        assert first.approved and first is second
+
+    async def test_tainted_tiers(self, config: VyapaarConfig) -> None:
+        completions = FakeCompletions()
+        validator = ToolCallValidator(config)
+        validator._security_llm = make_client(config, completions)
+        validator._context_tainted = True
+
+        denied = await validator.validate("set_agent_policy", {}, "agent-001", POLICY)
+        assert denied.approved is False and denied.risk_score == 1.0
+
+        tool = next(iter(validator._dual_llm_tools))
+        assert (await validator.validate(tool, {}, "agent-001", POLICY)).approved
+        assert completions.calls == 1
+
+        assert (await validator.validate("get_metrics", {}, "agent-001", POLICY)).approved
+
+    async def test_dual_llm_routing_beats_critical_deny(self, config: VyapaarConfig) -> None:
+        config.dual_llm_tools = "set_agent_policy"
+        completions = FakeCompletions()
+        validator = ToolCallValidator(config)
+        validator._security_llm = make_client(config, completions)
+        validator._context_tainted = True
+
+        assert (await validator.validate("set_agent_policy", {}, "agent-001", POLICY)).approved
+        assert completions.calls == 1
+        denied = await validator.validate("handle_slack_action", {}, "agent-001", POLICY)
+        assert "handle_slack_action" in denied.reason and not denied.approved
+
+    async def test_unavailable_llm_returns_shared_frozen_verdict(
+        self, config: VyapaarConfig
+    ) -> None:
+        client = SecurityLLMClient(config)
+        first = await client.validate_tool_call(make_request(), POLICY)
+        assert first is await client.validate_tool_call(make_request(6000), POLICY)
+        with pytest.raises(AttributeError):
+            first.approved = True  # type: ignore[misc]
@@ -13,8 +13,12 @@ import pytest
 
 from tests.conftest import make_webhook_payload
 from vyapaar_mcp.ingress.webhook import (
+    MAX_PAYLOAD_SIZE,
+    RazorpaySignatureVerifier,
+    WebhookValidationError,
     extract_webhook_id,
     parse_webhook_event,
+    validate_webhook_payload,
     verify_razorpay_signature,
 )
 
@@ -61,6 +65,42 @@ class TestSignatureVerification:
         # Just ensure it doesn't crash — actual timing safety is in the implementation
         assert verify_razorpay_signature(body, sig, SECRET) is True
 
+    def test_malformed_signature_rejected(self) -> None:
+        """Odd-length, truncated or non-ASCII signatures fail without raising."""
+        body = b"test"
+        sig = hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+        for bad in (sig[:-1], sig[:32], "", "é" * 64):
+            assert verify_razorpay_signature(body, bad, SECRET) is False
+
+    def test_verifier_is_reusable(self) -> None:
+        """The cached keyed state is copied, never consumed, per message."""
+        verifier = RazorpaySignatureVerifier(SECRET)
+        for body in (b"one", b"two", b"one"):
+            sig = hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+            assert verifier.verify(body, sig) is True
+        assert verifier.verify(b"two", sig) is False
+
+
+class TestPayloadValidation:
+    """Test size checks on the raw webhook body."""
+
+    def test_valid_payload_returned_unchanged(self) -> None:
+        body = b'{"event": "payout.queued"}'
+        assert validate_webhook_payload(body) is body
+
+    @pytest.mark.parametrize(
+        ("body", "code"),
+        [
+            (b"", "EMPTY_PAYLOAD"),
+            (b"{}", "PAYLOAD_TOO_SHORT"),
+            (b"x" * (MAX_PAYLOAD_SIZE + 1), "PAYLOAD_TOO_LARGE"),
+        ],
+    )
+    def test_invalid_payload_rejected(self, body: bytes, code: str) -> None:
+        with pytest.raises(WebhookValidationError) as exc:
+            validate_webhook_payload(body)
+        assert exc.value.code == code
+
 
 class TestWebhookParsing:
     """Test parsing of Razorpay webhook payloads."""
@@ -102,6 +142,16 @@ class TestWebhookParsing:
         with pytest.raises(ValueError):
             parse_webhook_event(b'{"entity": "event"}')
 
+    def test_parse_non_object_and_wrong_types_raise(self) -> None:
+        """Top-level arrays and string amounts are rejected as ValueError."""
+        with pytest.raises(ValueError, match="Invalid webhook payload"):
+            parse_webhook_event(b"[]")
+        with pytest.raises(ValueError, match="Invalid webhook payload"):
+            parse_webhook_event(
+                b'{"event": "payout.queued", "payload": {"payout": {"entity": '
+                b'{"id": "pout_1", "amount": "5000", "status": "queued"}}}}'
+            )
+
 
 class TestWebhookIdExtraction:
     """Test idempotency key extraction."""